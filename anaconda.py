@@ -611,6 +611,58 @@ if __name__ == "__main__":
     threadMgr.add(AnacondaThread(name=constants.THREAD_WAIT_FOR_CONNECTING_NM,
                                  target=wait_for_connecting_NM_thread))
 
+    # Set up the disks now, so the storage can be scanned while the display starts.
+    from pyanaconda.argument_parsing import name_path_pairs
+
+    image_count = 0
+    try:
+        for (name, path) in name_path_pairs(opts.images):
+            log.info("naming disk image '%s' '%s'", path, name)
+            anaconda.storage.disk_images[name] = path
+            image_count += 1
+    except ValueError as e:
+        stdout_log.error("error specifying image file: %s", e)
+        util.ipmi_abort(scripts=ksdata.scripts)
+        sys.exit(1)
+
+    if image_count:
+        anaconda.storage.setup_disk_images()
+
+    # Ignore disks labeled OEMDRV
+    from pyanaconda.modules.common.constants.services import STORAGE
+    from pyanaconda.modules.common.constants.objects import DISK_SELECTION
+    from pyanaconda.storage.utils import device_matches
+    matched = device_matches("LABEL=OEMDRV", disks_only=True)
+    for oemdrv_disk in matched:
+        disk_select_proxy = STORAGE.get_proxy(DISK_SELECTION)
+        ignored_disks = disk_select_proxy.IgnoredDisks
+
+        if oemdrv_disk not in ignored_disks:
+            log.info("Adding disk %s labeled OEMDRV to ignored disks", oemdrv_disk)
+            ignored_disks.append(oemdrv_disk)
+            disk_select_proxy.SetIgnoredDisks(ignored_disks)
+
+    from pyanaconda.payload import payloadMgr
+    from pyanaconda.timezone import time_initialize
+
+    # The threads below can report errors only once the UI is set up.
+    from pyanaconda.errors import errorHandler
+    errorHandler.defer()
+
+    if not conf.target.is_directory:
+        threadMgr.add(AnacondaThread(name=constants.THREAD_STORAGE, target=storage_initialize,
+                                     args=(anaconda.storage, ksdata, anaconda.protected)))
+
+    from pyanaconda.modules.common.constants.services import TIMEZONE
+    timezone_proxy = TIMEZONE.get_proxy()
+
+    if conf.system.can_initialize_system_clock:
+        threadMgr.add(AnacondaThread(name=constants.THREAD_TIME_INIT,
+                                     target=time_initialize,
+                                     args=(timezone_proxy,
+                                           anaconda.storage,
+                                           anaconda.bootloader)))
+
     # initialize the screen access manager before launching the UI
     from pyanaconda import screen_access
     screen_access.initSAM()
@@ -660,52 +712,8 @@ if __name__ == "__main__":
 
     storage_checker.add_constraint(constants.STORAGE_MIN_RAM, min_ram)
 
-    from pyanaconda.argument_parsing import name_path_pairs
-
-    image_count = 0
-    try:
-        for (name, path) in name_path_pairs(opts.images):
-            log.info("naming disk image '%s' '%s'", path, name)
-            anaconda.storage.disk_images[name] = path
-            image_count += 1
-    except ValueError as e:
-        stdout_log.error("error specifying image file: %s", e)
-        util.ipmi_abort(scripts=ksdata.scripts)
-        sys.exit(1)
-
-    if image_count:
-        anaconda.storage.setup_disk_images()
-
-    # Ignore disks labeled OEMDRV
-    from pyanaconda.modules.common.constants.services import STORAGE
-    from pyanaconda.modules.common.constants.objects import DISK_SELECTION
-    from pyanaconda.storage.utils import device_matches
-    matched = device_matches("LABEL=OEMDRV", disks_only=True)
-    for oemdrv_disk in matched:
-        disk_select_proxy = STORAGE.get_proxy(DISK_SELECTION)
-        ignored_disks = disk_select_proxy.IgnoredDisks
-
-        if oemdrv_disk not in ignored_disks:
-            log.info("Adding disk %s labeled OEMDRV to ignored disks", oemdrv_disk)
-            ignored_disks.append(oemdrv_disk)
-            disk_select_proxy.SetIgnoredDisks(ignored_disks)
-
-    from pyanaconda.payload import payloadMgr
-    from pyanaconda.timezone import time_initialize
-
-    if not conf.target.is_directory:
-        threadMgr.add(AnacondaThread(name=constants.THREAD_STORAGE, target=storage_initialize,
-                                     args=(anaconda.storage, ksdata, anaconda.protected)))
-
-    from pyanaconda.modules.common.constants.services import TIMEZONE
-    timezone_proxy = TIMEZONE.get_proxy()
-
-    if conf.system.can_initialize_system_clock:
-        threadMgr.add(AnacondaThread(name=constants.THREAD_TIME_INIT,
-                                     target=time_initialize,
-                                     args=(timezone_proxy,
-                                           anaconda.storage,
-                                           anaconda.bootloader)))
+    # The UI and the interactive mode are known now.
+    errorHandler.set_ready()
 
     if flags.rescue_mode:
         rescue.start_rescue_mode_ui(anaconda)
@@ -63,11 +63,15 @@ During system installation, anaconda will install the packages listed in
 /run/install/dd_packages to the target system.
 """
 
+import errno
 import logging
 import sys
 import os
 import subprocess
+import tempfile
 import fnmatch
+import threading
+import time
 
 # Import readline so raw_input gets readline features, like history, and
 # backspace working right. Do not import readline if not connected to a tty
@@ -105,6 +109,52 @@ KERNELVER = os.uname()[2]
 MODULE_UPDATES_DIR = "/lib/modules/%s/updates" % KERNELVER
 FIRMWARE_UPDATES_DIR = "/lib/firmware/updates"
 
+# how many driver rpms can be extracted at once
+EXTRACT_WORKERS = 4
+
+# how many modules are passed to a single modinfo call
+MODINFO_BATCH_SIZE = 200
+
+@contextmanager
+def timed(step):
+    """log how long the given step took."""
+    start = time.time()
+    try:
+        yield
+    finally:
+        log.info("%s took %.2f s", step, time.time() - start)
+
+def run_parallel(func, items, workers):
+    """
+    call func for each of the items, at most workers calls at once.
+
+    Waits for all the calls and re-raises the first exception, if any.
+    """
+    items = list(items)
+    errors = []
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                if not items:
+                    return
+                item = items.pop(0)
+            try:
+                func(item)
+            except Exception as e: # pylint: disable=broad-except
+                with lock:
+                    errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(min(workers, len(items)))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    if errors:
+        raise errors[0]
+
 def mkdir_seq(stem):
     """
     Create sequentially-numbered directories starting with stem.
@@ -121,7 +171,7 @@ def mkdir_seq(stem):
         try:
             os.makedirs(dirname)
         except OSError as e:
-            if e.errno != 17: raise
+            if e.errno != errno.EEXIST: raise
             n += 1
         else:
             return dirname
@@ -206,7 +256,32 @@ def iter_files(topdir, pattern=None):
 
 def ensure_dir(d):
     """make sure the given directory exists."""
-    subprocess.check_call(["mkdir", "-p", d])
+    try:
+        os.makedirs(d)
+    except OSError as e:
+        if e.errno != errno.EEXIST or not os.path.isdir(d): raise
+
+def merge_tree(srcdir, destdir):
+    """
+    move the contents of srcdir into destdir, replacing existing files.
+
+    srcdir and destdir have to be on the same filesystem.
+    """
+    for head, dirs, files in os.walk(srcdir):
+        desthead = os.path.join(destdir, os.path.relpath(head, srcdir))
+        ensure_dir(desthead)
+
+        # symlinks to directories are moved like files
+        links = [d for d in dirs if os.path.islink(os.path.join(head, d))]
+        dirs[:] = [d for d in dirs if d not in links]
+
+        for f in files + links:
+            src, dest = os.path.join(head, f), os.path.join(desthead, f)
+            if os.path.isdir(dest) and not os.path.islink(dest):
+                shutil.rmtree(dest)
+            elif os.path.lexists(dest):
+                os.unlink(dest)
+            os.rename(src, dest)
 
 def move_files(files, destdir, basedir):
     """move files into destdir (iff they're not already under destdir)"""
@@ -215,7 +290,10 @@ def move_files(files, destdir, basedir):
             continue
         dest = destdir+"/"+dest_strip(f, basedir)
         ensure_dir(os.path.dirname(dest))
-        subprocess.call(["mv", "-f", f, dest])
+        try:
+            shutil.move(f, dest)
+        except (IOError, OSError) as e:
+            log.error("ERROR: failed to move %s to %s: %s", f, dest, e)
 
 def dest_strip(dest, basedir):
     """strip a base directory plus kernel version from a path"""
@@ -242,7 +320,19 @@ def copy_files(files, destdir, basedir):
 
         dest = destdir+"/"+dest_strip(f, basedir)
         ensure_dir(os.path.dirname(dest))
-        subprocess.call(["cp", "-a", f, dest])
+        try:
+            copy_file(f, dest)
+        except (IOError, OSError) as e:
+            log.error("ERROR: failed to copy %s to %s: %s", f, dest, e)
+
+def copy_file(src, dest):
+    """copy a file like 'cp -a' does: keep symlinks, mode and times."""
+    if os.path.islink(dest) or (os.path.islink(src) and os.path.lexists(dest)):
+        os.unlink(dest)
+    if os.path.islink(src):
+        os.symlink(os.readlink(src), dest)
+    else:
+        shutil.copy2(src, dest)
 
 def append_line(filename, line):
     """simple helper to append a line to a file"""
@@ -314,9 +404,27 @@ def extract_drivers(drivers=None, repos=None, outdir="/updates",
 
     ensure_dir(outdir)
 
-    for driver in drivers:
+    # Packages can contain the same files, so every package is extracted
+    # into its own directory and the directories are merged in the order
+    # of the packages. The last package wins, like before.
+    tmpdirs = [tempfile.mkdtemp(prefix=".dd-extract-", dir=outdir) for _ in drivers]
+
+    def extract(item):
+        driver, tmpdir = item
         log.info("Extracting: %s", driver.name)
-        dd_extract(driver.source, outdir)
+        dd_extract(driver.source, tmpdir)
+
+    try:
+        with timed("Extracting %d driver packages" % len(drivers)):
+            run_parallel(extract, zip(drivers, tmpdirs), EXTRACT_WORKERS)
+
+        for tmpdir in tmpdirs:
+            merge_tree(tmpdir, outdir)
+    finally:
+        for tmpdir in tmpdirs:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+    for driver in drivers:
         # Make sure we install modules/firmware into the target system
         if 'modules' in driver.flags or 'firmwares' in driver.flags:
             append_line(pkglist, driver.name)
@@ -346,6 +454,36 @@ def list_aliases(module):
 
     return alias_list + [module]
 
+def list_modules_aliases(modules):
+    """
+    return a dict: keys are the given module files, values are lists of
+    the aliases provided by the modules (plus the module itself).
+
+    modinfo is called once for a whole batch of modules.
+    """
+    aliases = {m: [] for m in modules}
+
+    for i in range(0, len(modules), MODINFO_BATCH_SIZE):
+        batch = modules[i:i+MODINFO_BATCH_SIZE]
+        paths = {os.path.abspath(m): m for m in batch}
+        proc = subprocess.Popen(["modinfo"] + list(paths.keys()),
+                                stdout=subprocess.PIPE, universal_newlines=True)
+        out, _ = proc.communicate()
+        if proc.returncode:
+            log.warning("modinfo failed for some of the modules")
+
+        module = None
+        for line in out.splitlines():
+            key, _sep, value = line.partition(":")
+            value = value.strip()
+            if key == "filename":
+                module = paths.get(value)
+            elif key == "alias" and module is not None:
+                aliases[module].append(value)
+
+    # add the module itself
+    return {m: aliases[m] + [m] for m in modules}
+
 def grab_driver_files(outdir="/updates"):
     """
     copy any modules/firmware we just extracted into the running system.
@@ -355,12 +493,16 @@ def grab_driver_files(outdir="/updates"):
     modules = list(iter_files(outdir+'/lib/modules',"*.ko*"))
     firmware = list(iter_files(outdir+'/lib/firmware'))
 
-    module_dict = {os.path.basename(m).split('.ko')[0]: list_aliases(m) for m in modules}
+    with timed("Reading aliases of %d modules" % len(modules)):
+        aliases = list_modules_aliases(modules)
+
+    module_dict = {os.path.basename(m).split('.ko')[0]: aliases[m] for m in modules}
 
-    copy_files(modules, MODULE_UPDATES_DIR, outdir+'/lib/modules')
-    copy_files(firmware, FIRMWARE_UPDATES_DIR, outdir+'/lib/firmware')
-    move_files(modules, outdir+MODULE_UPDATES_DIR, outdir+'/lib/modules')
-    move_files(firmware, outdir+FIRMWARE_UPDATES_DIR, outdir+'/lib/firmware')
+    with timed("Staging %d files" % (len(modules) + len(firmware))):
+        copy_files(modules, MODULE_UPDATES_DIR, outdir+'/lib/modules')
+        copy_files(firmware, FIRMWARE_UPDATES_DIR, outdir+'/lib/firmware')
+        move_files(modules, outdir+MODULE_UPDATES_DIR, outdir+'/lib/modules')
+        move_files(firmware, outdir+FIRMWARE_UPDATES_DIR, outdir+'/lib/firmware')
 
     return module_dict
 
@@ -454,7 +596,8 @@ def load_drivers(moddict):
 # but right now the only use case is running inside the initramfs, so..
 def process_driver_disk(dev, interactive=False):
     try:
-        return _process_driver_disk(dev, interactive=interactive)
+        with timed("Processing driver disk %s" % dev):
+            return _process_driver_disk(dev, interactive=interactive)
     except (subprocess.CalledProcessError, IOError) as e:
         log.error("ERROR: %s", e)
         return {}
@@ -499,10 +642,11 @@ def _process_driver_disk(dev, interactive=False):
 
 def process_driver_rpm(rpm, dev=None):
     try:
-        if dev:
-            return _process_driver_rpm_from_device(rpm, dev)
-        else:
-            return _process_driver_rpm(rpm)
+        with timed("Processing driver rpm %s" % rpm):
+            if dev:
+                return _process_driver_rpm_from_device(rpm, dev)
+            else:
+                return _process_driver_rpm(rpm)
     except (subprocess.CalledProcessError, IOError) as e:
         log.error("ERROR: %s", e)
         return {}
@@ -17,6 +17,7 @@
 #
 import collections
 import os
+import time
 from glob import glob
 from itertools import chain
 
@@ -926,6 +927,36 @@ class BootLoader(object):
     def install(self, args=None):
         raise NotImplementedError()
 
+    def install_to_targets(self, targets, install_target):
+        """Install the boot loader to the given targets.
+
+        The targets are processed one after another in the given order.
+        Targets of a mirrored boot set share the stage2 device, so they
+        can't be installed at once. Failures of the targets are collected
+        and reported once all targets are processed.
+
+        :param targets: a list of (stage1, stage2) tuples
+        :param install_target: a function that accepts the stage1 and
+                               stage2 devices and raises BootLoaderError
+                               if the installation fails
+        :raise: BootLoaderError if any of the targets failed
+        """
+        errors = []
+
+        for (stage1dev, stage2dev) in targets:
+            start = time.time()
+
+            try:
+                install_target(stage1dev, stage2dev)
+            except BootLoaderError as e:
+                errors.append("%s: %s" % (stage1dev.name, e))
+
+            log.info("Boot loader installation to %s took %.2f s.",
+                     stage1dev.name, time.time() - start)
+
+        if errors:
+            raise BootLoaderError("boot loader install failed: %s" % "; ".join(errors))
+
     def update(self):
         """ Update an existing bootloader configuration. """
         pass
@@ -84,8 +84,13 @@ class EFIBase(object):
         if self.stage1_device.type == "partition":  # pylint: disable=no-member
             self._add_single_efi_boot_target(self.stage1_device)  # pylint: disable=no-member
         elif self.stage1_device.type == "mdarray":  # pylint: disable=no-member
-            for parent in self.stage1_device.parents:  # pylint: disable=no-member
-                self._add_single_efi_boot_target(parent)
+            # The boot entries share the NVRAM boot order, so they
+            # have to be created one after another.
+            targets = [(parent, None) for parent in self.stage1_device.parents]  # pylint: disable=no-member
+            self.install_to_targets(targets, self._add_efi_boot_target_for)  # pylint: disable=no-member
+
+    def _add_efi_boot_target_for(self, stage1dev, _stage2dev):
+        self._add_single_efi_boot_target(stage1dev)
 
     def remove_efi_boot_target(self):
         buf = self.efibootmgr(capture=True)
@@ -254,8 +254,7 @@ class GRUB2(GRUB):
         if args is None:
             args = []
 
-        # XXX will installing to multiple drives work as expected with GRUBv2?
-        for (stage1dev, stage2dev) in self.install_targets:
+        def install_target(stage1dev, stage2dev):
             grub_args = args + ["--no-floppy", stage1dev.path]
             if stage1dev == stage2dev:
                 # This is hopefully a temporary hack. GRUB2 currently refuses
@@ -274,6 +273,8 @@ class GRUB2(GRUB):
             if rc:
                 raise BootLoaderError("boot loader install failed")
 
+        self.install_to_targets(self.install_targets, install_target)
+
     def write(self):
         """Write the bootloader configuration and install the bootloader."""
         if self.skip_bootloader:
@@ -23,6 +23,7 @@ from pyanaconda.bootloader.image import LinuxBootLoaderImage, TbootLinuxBootLoad
 from pyanaconda.core import util
 from pyanaconda.core.configuration.anaconda import conf
 from pyanaconda.errors import errorHandler, ERROR_RAISE
+from pyanaconda.payload.rpmdb import rpm_database
 from pyanaconda.product import productName
 
 from pyanaconda.anaconda_loggers import get_module_logger
@@ -121,20 +122,16 @@ def write_sysconfig_kernel(storage, version):
             return
 
     try:
-        import rpm
+        names = rpm_database.get_names('basenames', kernel_file)
     except ImportError:
         log.error("failed to import rpm python module")
         return
 
-    ts = rpm.TransactionSet(util.getSysroot())
-    mi = ts.dbMatch('basenames', kernel_file)
-    try:
-        h = next(mi)
-    except StopIteration:
+    if not names:
         log.error("failed to get package name for default kernel")
         return
 
-    kernel = h.name.decode()
+    kernel = names[0]
 
     f = open(util.getSysroot() + "/etc/sysconfig/kernel", "w+")
     f.write("# UPDATEDEFAULT specifies if new-kernel-pkg should make\n"
@@ -100,6 +100,7 @@ GRAPHICAL_TARGET = 'graphical.target'
 # Network
 NETWORK_CONNECTION_TIMEOUT = 45  # in seconds
 NETWORK_CONNECTED_CHECK_INTERVAL = 0.1  # in seconds
+NETWORK_DEVICE_REFRESH_DELAY = 16  # in milliseconds, about one frame
 
 # DBus
 DEFAULT_DBUS_TIMEOUT = -1       # use default
@@ -133,6 +134,12 @@ THREAD_NTP_SERVER_CHECK = "AnaNTPserver"
 THREAD_DBUS_TASK = "AnaTaskThread"
 THREAD_NVDIMM_RECONFIGURE = "AnaNVDIMMReconfigureThread"
 THREAD_NVDIMM_REPOPULATE = "AnaNVDIMMRepopulateThread"
+THREAD_EXISTING_INSTALLATIONS = "AnaExistingInstallationsThread"
+THREAD_NTP_PROBE = "AnaNTPProbeThread"
+THREAD_PASSWORD_CHECK = "AnaPasswordCheckThread"
+THREAD_ISO_DISCOVERY = "AnaIsoDiscoveryThread"
+THREAD_REPOMD_CHECK = "AnaRepoMDCheckThread"
+THREAD_TREEINFO_DOWNLOAD = "AnaTreeInfoDownloadThread"
 
 # Geolocation constants
 
@@ -229,6 +236,13 @@ NOTICEABLE_FREEZE = 0.1
 # all ASCII characters
 PW_ASCII_CHARS = string.digits + string.ascii_letters + string.punctuation + " "
 
+# the number of milliseconds the password input has to be unchanged
+# before it is checked asynchronously
+PASSWORD_CHECK_DELAY = 250
+
+# how many verdicts of libpwquality can be cached
+PASSWORD_QUALITY_CACHE_SIZE = 64
+
 # Recognizing a tarfile
 TAR_SUFFIX = (".tar", ".tbz", ".tgz", ".txz", ".tar.bz2", "tar.gz", "tar.xz")
 
@@ -263,6 +277,37 @@ SIZE_UNITS_DEFAULT = "MiB"
 # An estimated ratio for metadata size to total disk space.
 STORAGE_METADATA_RATIO = 0.1
 
+# How many disks are shown at once in the text storage spoke.
+TUI_DISKS_PAGE_SIZE = 20
+
+# How many devices can be probed for existing installations at once.
+EXISTING_INSTALLATIONS_PROBE_WORKERS = 8
+
+# How many DASDs can be formatted at once.
+DASD_FORMAT_WORKERS = 8
+
+# How many iSCSI portals from the kickstart file can be used at once.
+ISCSI_LOGIN_WORKERS = 4
+
+# How many modules can be asked for their installation tasks at once.
+INSTALLATION_TASKS_COLLECT_WORKERS = 8
+
+# How many modules can be asked for their kickstarts at once.
+KICKSTART_GENERATE_WORKERS = 8
+
+# How many ISO images can be checked for installation sources at once.
+ISO_DISCOVERY_WORKERS = 8
+
+# How many repomd.xml files can be requested at once.
+REPOMD_CHECK_WORKERS = 8
+
+# How long to wait for a server with a repomd.xml file.
+REPOMD_CHECK_TIMEOUT = 15  # in seconds
+
+# The resource claimed by installation tasks by default.
+# Tasks that claim it don't run with any other tasks.
+TASK_RESOURCE_ALL = "*"
+
 # Constants for reporting status to IPMI.  These are from the IPMI spec v2 rev1.1, page 512.
 IPMI_STARTED = 0x7          # installation started
 IPMI_FINISHED = 0x8         # installation finished successfully
@@ -291,6 +336,11 @@ NTP_SERVER_OK = 0
 NTP_SERVER_NOK = 1
 NTP_SERVER_QUERY = 2
 
+# NTP server probing (in seconds)
+NTP_PROBE_TIMEOUT = 5
+NTP_PROBE_CACHE_TTL = 300
+NTP_PROBE_FAILURE_CACHE_TTL = 30
+
 # Storage checker constraints
 STORAGE_MIN_RAM = "min_ram"
 STORAGE_MIN_ROOT = "min_root"
@@ -384,3 +434,12 @@ MOUNT_POINT_FORMAT = "format"
 MOUNT_POINT_REFORMAT = "reformat"
 MOUNT_POINT_FORMAT_OPTIONS = "format-options"
 MOUNT_POINT_MOUNT_OPTIONS = "mount-options"
+
+# The maximal size of a section of the crash dump in characters.
+CRASH_DUMP_SECTION_SIZE = 512 * 1024
+
+# The size of the head of a truncated section of the crash dump in characters.
+CRASH_DUMP_SECTION_HEAD_SIZE = 64 * 1024
+
+# The time budget for collecting the sections of the crash dump in seconds.
+CRASH_DUMP_TIME_BUDGET = 20
@@ -37,6 +37,7 @@ import imp
 import types
 import inspect
 import functools
+from collections import OrderedDict
 
 import requests
 from requests_file import FileAdapter
@@ -487,42 +488,45 @@ def execConsole():
 def getDirSize(directory):
     """ Get the size of a directory and all its subdirectories.
 
+    Only regular files on the same device are counted and mount
+    points are skipped.
+
     :param dir: The name of the directory to find the size of.
     :return: The size of the directory in kilobytes.
     """
-    def getSubdirSize(directory):
-        # returns size in bytes
-        try:
-            mydev = os.lstat(directory)[stat.ST_DEV]
-        except OSError as e:
-            log.debug("failed to stat %s: %s", directory, e)
-            return 0
+    try:
+        mydev = os.lstat(directory).st_dev
+    except OSError as e:
+        log.debug("failed to stat %s: %s", directory, e)
+        return 0
+
+    dsize = 0
+    dirs = [directory]
+
+    while dirs:
+        current = dirs.pop()
 
         try:
-            dirlist = os.listdir(directory)
+            entries = os.scandir(current)
         except OSError as e:
-            log.debug("failed to listdir %s: %s", directory, e)
-            return 0
-
-        dsize = 0
-        for f in dirlist:
-            curpath = '%s/%s' % (directory, f)
-            try:
-                sinfo = os.lstat(curpath)
-            except OSError as e:
-                log.debug("failed to stat %s/%s: %s", directory, f, e)
-                continue
+            log.debug("failed to listdir %s: %s", current, e)
+            continue
 
-            if stat.S_ISDIR(sinfo[stat.ST_MODE]):
-                if os.path.ismount(curpath):
+        with entries:
+            for entry in entries:
+                try:
+                    sinfo = entry.stat(follow_symlinks=False)
+                except OSError as e:
+                    log.debug("failed to stat %s: %s", entry.path, e)
                     continue
-                if mydev == sinfo[stat.ST_DEV]:
-                    dsize += getSubdirSize(curpath)
-            elif stat.S_ISREG(sinfo[stat.ST_MODE]):
-                dsize += sinfo[stat.ST_SIZE]
 
-        return dsize
-    return getSubdirSize(directory) // 1024
+                if stat.S_ISDIR(sinfo.st_mode):
+                    if sinfo.st_dev == mydev and not os.path.ismount(entry.path):
+                        dirs.append(entry.path)
+                elif stat.S_ISREG(sinfo.st_mode):
+                    dsize += sinfo.st_size
+
+    return dsize // 1024
 
 
 ## Create a directory path.  Don't fail if the directory already exists.
@@ -631,15 +635,15 @@ def setup_translations():
     gettext.textdomain("anaconda")
 
 
-def _run_systemctl(command, service, root="/"):
+def _run_systemctl(command, *services, root="/"):
     """
-    Runs 'systemctl command service.service'
+    Runs 'systemctl command service.service ...'
 
     :return: exit status of the systemctl
 
     """
 
-    args = [command, service]
+    args = [command] + list(services)
     if root != "/":
         args += ["--root", root]
 
@@ -684,6 +688,88 @@ def disable_service(service):
         log.warning("Disabling %s failed. It probably doesn't exist", service)
 
 
+class SystemdUnitBatch(object):
+    """Enable, disable and mask systemd units in the sysroot at once.
+
+    Every call of systemctl loads all units from the disk again, so
+    the collected requests are applied with one call per command.
+    If the call fails, the units are split into halves until the
+    units that failed are found, so a few failed units cost only
+    a few more calls. The last request for a unit wins.
+    """
+
+    # The order in which the commands are applied.
+    COMMANDS = ("disable", "mask", "enable")
+
+    def __init__(self, root=None):
+        """Create a new batch.
+
+        :param root: a path to the root or None for the sysroot
+        """
+        self._root = root
+        self._requests = OrderedDict()
+
+    def enable(self, unit):
+        """Request to enable the unit."""
+        self._requests[unit] = "enable"
+
+    def disable(self, unit):
+        """Request to disable the unit.
+
+        Units that don't exist are effectively disabled,
+        so failures are only logged.
+        """
+        self._requests[unit] = "disable"
+
+    def mask(self, unit):
+        """Request to mask the unit."""
+        self._requests[unit] = "mask"
+
+    def apply(self):
+        """Apply the collected requests.
+
+        :return: a dictionary of failed units and their commands
+        :raise: ValueError if some units failed to be enabled or masked
+        """
+        root = self._root or getSysroot()
+        failed = OrderedDict()
+
+        for command in self.COMMANDS:
+            units = [u for u, c in self._requests.items() if c == command]
+
+            if not units:
+                continue
+
+            for unit in self._run(command, units, root):
+                failed[unit] = command
+
+        self._requests.clear()
+
+        for unit, command in failed.items():
+            if command == "disable":
+                log.warning("Disabling %s failed. It probably doesn't exist", unit)
+            else:
+                log.error("Failed to %s the service %s.", command, unit)
+
+        errors = [u for u, c in failed.items() if c != "disable"]
+        if errors:
+            raise ValueError("Error configuring services %s" % ", ".join(errors))
+
+        return failed
+
+    def _run(self, command, units, root):
+        """Run the command for the units and return the failed units."""
+        if _run_systemctl(command, *units, root=root) == 0:
+            return []
+
+        if len(units) == 1:
+            return units
+
+        # Find the units that failed.
+        middle = len(units) // 2
+        return self._run(command, units[:middle], root) + self._run(command, units[middle:], root)
+
+
 def dracut_eject(device):
     """
     Use dracut shutdown hook to eject media after the system is shutdown.
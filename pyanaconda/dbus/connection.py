@@ -24,6 +24,7 @@ import pydbus
 from pyanaconda.core.constants import ANACONDA_BUS_ADDR_FILE
 from pyanaconda.dbus.constants import DBUS_ANACONDA_SESSION_ADDRESS, DBUS_STARTER_ADDRESS
 from pyanaconda.dbus.observer import DBusObjectObserver, DBusCachedObserver
+from pyanaconda.dbus.pool import DBusProxyPool
 
 from pyanaconda.anaconda_loggers import get_module_logger
 log = get_module_logger(__name__)
@@ -46,6 +47,7 @@ class Connection(ABC):
         self._connection = None
         self._service_registrations = []
         self._object_registrations = []
+        self._proxy_pool = DBusProxyPool(self)
 
     @property
     def connection(self):
@@ -110,11 +112,14 @@ class Connection(ABC):
     def get_proxy(self, service_name, object_path):
         """Returns a proxy of a remote DBus object.
 
+        The proxies are shared. Only the first request for
+        the remote object sends messages to the bus.
+
         :param service_name: a DBus name of a service
         :param object_path: a DBus path an object
         :return: a proxy object
         """
-        return self.connection.get(service_name, object_path)
+        return self._proxy_pool.get_proxy(service_name, object_path)
 
     def get_observer(self, service_name, object_path):
         """Returns an observer of a remote DBus object.
@@ -147,6 +152,7 @@ class Connection(ABC):
             registration = self._service_registrations.pop()
             registration.unown()
 
+        self._proxy_pool.clear()
         self._connection = None
 
 
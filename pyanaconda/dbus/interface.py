@@ -73,10 +73,20 @@ def dbus_interface(interface_name):
 
     The XML specification is accessible as:
         Interface.dbus
+
+    If there is a precompiled specification of the class,
+    it will be used instead.
     """
     def decorated(cls):
-        generator = DBusSpecification()
-        cls.dbus = generator.generate_specification(cls, interface_name)
+        from pyanaconda.dbus.precompiled import get_precompiled_specification
+        specification = get_precompiled_specification(cls, interface_name)
+
+        if not specification:
+            generator = DBusSpecification()
+            specification = generator.generate_specification(cls, interface_name)
+
+        cls.dbus = specification
+        cls.__dbus_interface__ = interface_name
         return cls
     return decorated
 
@@ -238,17 +248,28 @@ class DBusSpecification(object):
 
         # Visit cls and base classes in reversed order.
         for member in reversed(inspect.getmro(cls)):
+            specification = self._get_inherited_specification(cls, member)
+
             # Skip classes with no specification.
-            if not getattr(member, "dbus", None):
+            if not specification:
                 continue
 
             # Update found interfaces.
-            node = self.xml_generator.xml_to_element(member.dbus)
+            node = self.xml_generator.xml_to_element(specification)
             node_interfaces = self.xml_generator.get_interfaces_from_node(node)
             interfaces.update(node_interfaces)
 
         return interfaces
 
+    def _get_inherited_specification(self, cls, member):
+        """Get the specification of a class from the hierarchy of the given class.
+
+        :param cls: a class object
+        :param member: cls or one of its base classes
+        :return: a string with the specification or None
+        """
+        return getattr(member, "dbus", None)
+
     def _generate_interface(self, cls, interfaces, interface_name):
         """Generate interface defined by given class.
 
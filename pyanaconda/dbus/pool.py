@@ -0,0 +1,275 @@
+#
+# Pool of DBus proxies.
+#
+# Copyright (C) 2019  Red Hat, Inc.  All rights reserved.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+from collections import OrderedDict
+from threading import RLock
+from xml.etree import ElementTree
+
+from gi.repository import GLib
+from pydbus.proxy import Interface
+from pydbus.timeout import timeout_to_glib
+
+from pyanaconda.dbus.constants import DBUS_FLAG_NONE
+
+from pyanaconda.anaconda_loggers import get_module_logger
+log = get_module_logger(__name__)
+
+__all__ = ["DBusProxyPool"]
+
+# The standard interfaces of DBus.
+DBUS_NAME = "org.freedesktop.DBus"
+DBUS_PATH = "/org/freedesktop/DBus"
+DBUS_INTROSPECTABLE = "org.freedesktop.DBus.Introspectable"
+
+# The maximal number of pooled proxies.
+DBUS_PROXY_POOL_SIZE = 256
+
+# The component of object paths of short-lived tasks.
+DBUS_TASKS_COMPONENT = "Tasks"
+
+
+class DBusProxyPool(object):
+    """Pool of DBus proxies.
+
+    Creating a proxy with pydbus requires a blocking call of the
+    Introspect method and a new Python class built from the result.
+    The pool keeps one proxy per service name and object path and
+    shares the classes of interfaces with the same introspection data,
+    so the next requests for the same object don't send any messages.
+
+    The proxies of a service are dropped when the service changes its
+    owner, for example when it is restarted. The least recently used
+    proxies are dropped if the pool is full. Proxies of tasks are never
+    pooled, because every task has a unique object path. The pool can
+    be shared by more threads.
+
+    Usage:
+
+    pool = DBusProxyPool(DBus)
+    proxy = pool.get_proxy("org.fedoraproject.Anaconda.Boss",
+                           "/org/fedoraproject/Anaconda/Boss")
+    """
+
+    def __init__(self, message_bus, max_size=DBUS_PROXY_POOL_SIZE):
+        """Create a new pool.
+
+        :param message_bus: a message bus
+        :param max_size: a maximal number of pooled proxies
+        """
+        self._message_bus = message_bus
+        self._max_size = max_size
+        self._lock = RLock()
+        self._proxies = OrderedDict()
+        self._interfaces = {}
+        self._classes = {}
+        self._generations = {}
+        self._subscriptions = {}
+
+    def get_proxy(self, service_name, object_path):
+        """Returns a proxy of a remote DBus object.
+
+        :param service_name: a DBus name of a service
+        :param object_path: a DBus path an object
+        :return: a proxy object
+        """
+        if not self._is_pooled(object_path):
+            return self._create_proxy(service_name, object_path)
+
+        key = (service_name, object_path)
+
+        with self._lock:
+            if key in self._proxies:
+                self._proxies.move_to_end(key)
+                return self._proxies[key]
+
+            self._watch_name_owner(service_name)
+            generation = self._generations.get(service_name, 0)
+
+        # Don't block other threads during the introspection.
+        proxy = self._create_proxy(service_name, object_path)
+
+        with self._lock:
+            # The service has changed its owner in the meantime.
+            if generation != self._generations.get(service_name, 0):
+                return proxy
+
+            if key not in self._proxies:
+                self._proxies[key] = proxy
+
+                while len(self._proxies) > self._max_size:
+                    self._proxies.popitem(last=False)
+
+            return self._proxies[key]
+
+    @staticmethod
+    def _is_pooled(object_path):
+        """Should the proxy of the given object be pooled?
+
+        :param object_path: a DBus path an object
+        :return: True or False
+        """
+        return DBUS_TASKS_COMPONENT not in object_path.split("/")
+
+    def _create_proxy(self, service_name, object_path):
+        """Create a new proxy of a remote DBus object.
+
+        :param service_name: a DBus name of a service
+        :param object_path: a DBus path an object
+        :return: a proxy object
+        """
+        proxy_class = self._get_proxy_class(self._introspect(service_name, object_path))
+        return proxy_class(self._message_bus.connection, service_name, object_path)
+
+    def _introspect(self, service_name, object_path):
+        """Get the introspection data of the remote object.
+
+        :param service_name: a DBus name of a service
+        :param object_path: a DBus path an object
+        :return: an XML string
+        """
+        result = self._message_bus.connection.con.call_sync(
+            service_name,
+            object_path,
+            DBUS_INTROSPECTABLE,
+            "Introspect",
+            None,
+            GLib.VariantType.new("(s)"),
+            DBUS_FLAG_NONE,
+            timeout_to_glib(None),
+            None
+        )
+
+        if not result:
+            raise KeyError("No such object {} of {}.".format(object_path, service_name))
+
+        xml, = result.unpack()
+        return xml
+
+    def _get_proxy_class(self, xml):
+        """Get a class of proxies for the given introspection data.
+
+        :param xml: an XML string with the introspection data
+        :return: a subclass of ProxyObject
+        """
+        try:
+            introspection = ElementTree.fromstring(xml)
+        except ElementTree.ParseError:
+            raise KeyError("Invalid introspection data.")
+
+        # The standard interfaces go last like in pydbus.
+        elements = sorted(
+            [e for e in introspection if e.tag == "interface"],
+            key=lambda e: e.attrib["name"].startswith("org.freedesktop.DBus.")
+        )
+
+        if not elements:
+            raise KeyError("No interfaces are exported.")
+
+        with self._lock:
+            interfaces = tuple(self._get_interface_class(e) for e in elements)
+
+            if interfaces not in self._classes:
+                self._classes[interfaces] = self._create_proxy_class(interfaces)
+
+            return self._classes[interfaces]
+
+    def _get_interface_class(self, element):
+        """Get a class of the given interface.
+
+        :param element: an XML element of the interface
+        :return: a subclass of ProxyObject
+        """
+        key = ElementTree.tostring(element)
+
+        if key not in self._interfaces:
+            self._interfaces[key] = Interface(element)
+
+        return self._interfaces[key]
+
+    @staticmethod
+    def _create_proxy_class(interfaces):
+        """Create a class of proxies with the given interfaces.
+
+        The class behaves as the composite object of pydbus.
+
+        :param interfaces: a tuple of interface classes
+        :return: a subclass of ProxyObject
+        """
+        def get_item(self, interface_name):
+            if interface_name == "" or interface_name[0] == ".":
+                interface_name = self._path.replace("/", ".")[1:] + interface_name
+
+            for interface in interfaces:
+                if interface.__name__ == interface_name:
+                    return interface(self._bus, self._bus_name, self._path, self)
+
+            raise KeyError(interface_name)
+
+        name = "<CompositeObject>({})".format("+".join(i.__name__ for i in interfaces))
+        proxy_class = type("<CompositeObject>", interfaces, {"__getitem__": get_item})
+        proxy_class.__qualname__ = name
+        proxy_class.__module__ = "DBUS"
+        return proxy_class
+
+    def _watch_name_owner(self, service_name):
+        """Watch the owner of the given service name.
+
+        :param service_name: a DBus name of a service
+        """
+        if service_name in self._subscriptions:
+            return
+
+        self._subscriptions[service_name] = self._message_bus.connection.subscribe(
+            sender=DBUS_NAME,
+            iface=DBUS_NAME,
+            signal="NameOwnerChanged",
+            object=DBUS_PATH,
+            arg0=service_name,
+            signal_fired=self._name_owner_changed_callback
+        )
+
+    def _name_owner_changed_callback(self, sender, obj, iface, signal, params):
+        """Callback for the NameOwnerChanged signal."""
+        service_name, old_owner, new_owner = params
+        log.debug("The owner of %s has changed from '%s' to '%s'.",
+                  service_name, old_owner, new_owner)
+        self.invalidate(service_name)
+
+    def invalidate(self, service_name):
+        """Drop the proxies of the given service.
+
+        :param service_name: a DBus name of a service
+        """
+        with self._lock:
+            self._generations[service_name] = self._generations.get(service_name, 0) + 1
+
+            for key in list(self._proxies):
+                if key[0] == service_name:
+                    del self._proxies[key]
+
+    def clear(self):
+        """Drop all proxies and stop watching the service names."""
+        with self._lock:
+            for subscription in self._subscriptions.values():
+                subscription.unsubscribe()
+
+            self._subscriptions.clear()
+            self._proxies.clear()
+            self._interfaces.clear()
+            self._classes.clear()
+            self._generations.clear()
@@ -0,0 +1,304 @@
+#
+# Precompiled DBus specifications.
+#
+# Copyright (C) 2019  Red Hat, Inc.  All rights reserved.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# The DBus specifications of the decorated classes are generated when
+# the classes are defined. That requires to inspect the classes and to
+# parse and generate a lot of XML in every process at every start. The
+# specifications can be generated at the build time instead:
+#
+#   python3 -m pyanaconda.dbus.precompiled --output specifications.json
+#
+# If the file is installed next to this module, the decorators will use
+# the specifications of classes whose sources haven't changed since the
+# file was generated.
+#
+import argparse
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import sys
+from threading import Lock
+
+from pyanaconda.dbus.interface import DBusSpecification
+
+__all__ = ["get_precompiled_specification", "collect_specifications",
+           "verify_specifications"]
+
+# The default location of the precompiled specifications.
+SPECIFICATIONS_FILE = os.path.join(os.path.dirname(__file__), "specifications.json")
+
+# The packages with DBus classes.
+SPECIFICATIONS_PACKAGES = ["pyanaconda.dbus", "pyanaconda.modules"]
+
+# The modules the generated specifications depend on.
+SPECIFICATIONS_GENERATORS = ["pyanaconda.dbus.interface", "pyanaconda.dbus.typing"]
+
+_specifications = None
+_specifications_lock = Lock()
+_file_hashes = {}
+
+
+def _get_class_id(cls):
+    """Get a unique identifier of the class."""
+    return "{}.{}".format(cls.__module__, cls.__qualname__)
+
+
+def _get_file_hash(path):
+    """Get a hash of the given file or None."""
+    if path not in _file_hashes:
+        try:
+            with open(path, "rb") as f:
+                _file_hashes[path] = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            _file_hashes[path] = None
+
+    return _file_hashes[path]
+
+
+def _get_source_hash(cls):
+    """Get a hash of the sources the specification of the class depends on.
+
+    The specification depends on the modules of the class and its base
+    classes and on the modules that generate the specifications.
+
+    :param cls: a class object
+    :return: a string with the hash or None
+    """
+    module_names = SPECIFICATIONS_GENERATORS + [c.__module__ for c in cls.__mro__]
+    source_hash = hashlib.sha256()
+
+    for module_name in sorted(set(module_names)):
+        path = getattr(sys.modules.get(module_name), "__file__", None)
+
+        # Skip the built-in modules.
+        if not path:
+            continue
+
+        file_hash = _get_file_hash(path)
+
+        if file_hash is None:
+            return None
+
+        source_hash.update(module_name.encode("utf-8"))
+        source_hash.update(file_hash.encode("utf-8"))
+
+    return source_hash.hexdigest()
+
+
+class _SourceSpecification(DBusSpecification):
+    """Generator of specifications from the sources of classes.
+
+    The inherited specifications are generated again instead of
+    being taken from the base classes, because they can be
+    precompiled and out of date.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._generated = {}
+
+    def generate_class_specification(self, cls):
+        """Generate the specification of the decorated class.
+
+        :param cls: a class object
+        :return: a string with the specification
+        """
+        if cls not in self._generated:
+            self._generated[cls] = self.generate_specification(cls, cls.__dbus_interface__)
+
+        return self._generated[cls]
+
+    def _get_inherited_specification(self, cls, member):
+        # The decorated class doesn't have its own specification yet.
+        for owner in inspect.getmro(member):
+            if owner is cls or "dbus" not in owner.__dict__:
+                continue
+
+            if "__dbus_interface__" not in owner.__dict__:
+                return owner.dbus
+
+            return self.generate_class_specification(owner)
+
+        return None
+
+
+def load_specifications(path=SPECIFICATIONS_FILE):
+    """Load the precompiled specifications.
+
+    :param path: a path to the file with specifications
+    :return: a dictionary of class identifiers and specifications
+    """
+    if not os.path.exists(path):
+        return {}
+
+    try:
+        with open(path, "rt") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    return data.get("specifications", {})
+
+
+def get_precompiled_specification(cls, interface_name):
+    """Get the precompiled specification of the class.
+
+    The specification is ignored if the sources of the class
+    have changed since it was generated.
+
+    :param cls: a class object
+    :param interface_name: a name of the interface defined by the class or None
+    :return: a string with the specification or None
+    """
+    global _specifications
+
+    with _specifications_lock:
+        if _specifications is None:
+            _specifications = load_specifications()
+
+        entry = _specifications.get(_get_class_id(cls))
+
+    if not entry or entry["interface"] != interface_name:
+        return None
+
+    if not entry.get("hash") or entry["hash"] != _get_source_hash(cls):
+        return None
+
+    return entry["xml"]
+
+
+def _find_dbus_classes(module):
+    """Find the classes with DBus specifications defined by the module."""
+    for _name, member in inspect.getmembers(module, inspect.isclass):
+        if member.__module__ != module.__name__:
+            continue
+
+        if "dbus" not in member.__dict__ or "__dbus_interface__" not in member.__dict__:
+            continue
+
+        yield member
+
+
+def _import_modules(packages):
+    """Import all modules of the given packages."""
+    for package_name in packages:
+        package = importlib.import_module(package_name)
+        yield package
+
+        for info in pkgutil.walk_packages(package.__path__, package_name + "."):
+            # Don't start the DBus services.
+            if info.name.endswith(".__main__"):
+                continue
+
+            try:
+                yield importlib.import_module(info.name)
+            except Exception as e:  # pylint: disable=broad-except
+                print("Skipping {}: {}".format(info.name, e), file=sys.stderr)
+
+
+def collect_specifications(packages=None):
+    """Collect the specifications of all DBus classes in the packages.
+
+    :param packages: a list of package names
+    :return: a dictionary of class identifiers and specifications
+    """
+    generator = _SourceSpecification()
+    specifications = {}
+
+    for module in _import_modules(packages or SPECIFICATIONS_PACKAGES):
+        for cls in _find_dbus_classes(module):
+            specifications[_get_class_id(cls)] = {
+                "module": cls.__module__,
+                "interface": cls.__dbus_interface__,
+                "hash": _get_source_hash(cls),
+                "xml": generator.generate_class_specification(cls)
+            }
+
+    return specifications
+
+
+def verify_specifications(specifications):
+    """Verify the specifications.
+
+    Generate the specifications of the classes again and
+    return identifiers of classes that don't match.
+
+    :param specifications: a dictionary of class identifiers and specifications
+    :return: a list of invalid class identifiers
+    """
+    generator = _SourceSpecification()
+    invalid = []
+
+    for class_id, entry in sorted(specifications.items()):
+        module_name = entry["module"]
+        qualname = class_id[len(module_name) + 1:]
+
+        try:
+            cls = importlib.import_module(module_name)
+
+            for name in qualname.split("."):
+                cls = getattr(cls, name)
+
+        except (ImportError, AttributeError):
+            invalid.append(class_id)
+            continue
+
+        xml = generator.generate_specification(cls, entry["interface"])
+
+        if xml != entry["xml"]:
+            invalid.append(class_id)
+
+    return invalid
+
+
+def main(argv=None):
+    """Generate or verify the precompiled specifications."""
+    parser = argparse.ArgumentParser(description="Precompile DBus specifications.")
+    parser.add_argument("--output", default=SPECIFICATIONS_FILE,
+                        help="a path to the generated file")
+    parser.add_argument("--verify", metavar="PATH",
+                        help="verify the given file instead")
+    parser.add_argument("packages", nargs="*", default=SPECIFICATIONS_PACKAGES,
+                        help="packages with DBus classes")
+    args = parser.parse_args(argv)
+
+    if args.verify:
+        with open(args.verify, "rt") as f:
+            invalid = verify_specifications(json.load(f)["specifications"])
+
+        for class_id in invalid:
+            print("Invalid specification of {}.".format(class_id), file=sys.stderr)
+
+        return 1 if invalid else 0
+
+    data = {
+        "specifications": collect_specifications(args.packages)
+    }
+
+    with open(args.output, "wt") as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+
+    print("Generated {} specifications.".format(len(data["specifications"])))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,16 +17,21 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
 import inspect
+from operator import attrgetter
 from typing import get_type_hints
 
-from pyanaconda.dbus.typing import get_variant, Structure
+from pyanaconda.dbus.typing import get_variant, get_dbus_type, Structure, List, Variant
 
-__all__ = ["get_structure", "apply_structure", "dbus_structure", "DBusStructureError"]
+__all__ = ["get_structure", "apply_structure", "get_structure_list", "apply_structure_list",
+           "dbus_structure", "DBusStructureError"]
 
 
 # Class attribute for DBus fields.
 DBUS_FIELDS_ATTRIBUTE = "__dbus_fields__"
 
+# Class attribute for DBus codec.
+DBUS_CODEC_ATTRIBUTE = "__dbus_codec__"
+
 
 class DBusStructureError(Exception):
     """General exception for DBus structure errors."""
@@ -118,6 +123,93 @@ def get_fields(obj):
     return fields
 
 
+class DBusStructureCodec(object):
+    """Encoder and decoder of DBus structures.
+
+    The codec is created from DBus fields of a data class. The
+    DBus types of the fields are resolved only once, so encoding
+    and decoding of the structures does only the necessary work.
+    """
+
+    def __init__(self, fields):
+        """Create a codec.
+
+        :param fields: a map of DBus fields
+        """
+        self._encoders = [
+            (name, get_dbus_type(field.type_hint), attrgetter(field.data_name))
+            for name, field in fields.items()
+        ]
+        self._data_names = {
+            name: field.data_name for name, field in fields.items()
+        }
+
+    def encode(self, obj):
+        """Return a DBus structure of the data object.
+
+        :param obj: a data object
+        :return: a DBus structure
+        """
+        return {
+            name: Variant(signature, get_data(obj))
+            for name, signature, get_data in self._encoders
+        }
+
+    def encode_list(self, objects):
+        """Return a list of DBus structures of the data objects.
+
+        :param objects: a list of data objects
+        :return: a list of DBus structures
+        """
+        encoders = self._encoders
+        return [
+            {name: Variant(signature, get_data(obj)) for name, signature, get_data in encoders}
+            for obj in objects
+        ]
+
+    def decode(self, structure, obj):
+        """Set the data object with data from the DBus structure.
+
+        :param structure: an unpacked DBus structure
+        :param obj: a data object
+        :return: a data object
+        """
+        data_names = self._data_names
+
+        for name, value in structure.items():
+            data_name = data_names.get(name, None)
+
+            if not data_name:
+                raise DBusStructureError("Field '{}' doesn't exist.".format(name))
+
+            setattr(obj, data_name, value)
+
+        return obj
+
+    def decode_list(self, structures, cls):
+        """Create data objects from the DBus structures.
+
+        :param structures: a list of unpacked DBus structures
+        :param cls: a data class
+        :return: a list of data objects
+        """
+        return [self.decode(structure, cls()) for structure in structures]
+
+
+def get_codec(obj):
+    """Return a DBus codec of a data object.
+
+    :param obj: a data object or a data class
+    :return: an instance of DBusStructureCodec
+    """
+    codec = getattr(obj, DBUS_CODEC_ATTRIBUTE, None)
+
+    if codec is None:
+        codec = DBusStructureCodec(get_fields(obj))
+
+    return codec
+
+
 def get_structure(obj) -> Structure:
     """Return a DBus structure.
 
@@ -126,13 +218,7 @@ def get_structure(obj) -> Structure:
     :param obj: a data object
     :return: a DBus structure
     """
-    structure = {}
-    fields = get_fields(obj)
-
-    for name, field in fields.items():
-        structure[name] = field.get_data_variant(obj)
-
-    return structure
+    return get_codec(obj).encode(obj)
 
 
 def apply_structure(structure, obj):
@@ -144,17 +230,31 @@ def apply_structure(structure, obj):
     :param obj: a data object
     :return: a data object
     """
-    fields = get_fields(obj)
+    return get_codec(obj).decode(structure, obj)
+
+
+def get_structure_list(objects) -> List[Structure]:
+    """Return a list of DBus structures.
+
+    All objects have to be instances of the same data class.
+
+    :param objects: a list of data objects
+    :return: a list of DBus structures
+    """
+    if not objects:
+        return []
 
-    for name, value in structure.items():
-        field = fields.get(name, None)
+    return get_codec(objects[0]).encode_list(objects)
 
-        if not field:
-            raise DBusStructureError("Field '{}' doesn't exist.".format(name))
 
-        field.set_data(obj, value)
+def apply_structure_list(structures, cls):
+    """Create data objects from a list of DBus structures.
 
-    return obj
+    :param structures: a list of unpacked DBus structures
+    :param cls: a data class
+    :return: a list of data objects
+    """
+    return get_codec(cls).decode_list(structures, cls)
 
 
 def generate_fields(cls):
@@ -231,9 +331,14 @@ def dbus_structure(cls):
     Instances of the decorated class can be used to create and apply
     DBus structures with method get_structure and apply_structure.
 
+    The class attribute __dbus_codec__ is set with a codec created
+    from the fields, so the fields don't have to be processed again.
+
     :param cls: a data class
     :return: a data class with generated DBus fields
     """
-    setattr(cls, DBUS_FIELDS_ATTRIBUTE, generate_fields(cls))
+    fields = generate_fields(cls)
+    setattr(cls, DBUS_FIELDS_ATTRIBUTE, fields)
+    setattr(cls, DBUS_CODEC_ATTRIBUTE, DBusStructureCodec(fields))
     setattr(cls, '__repr__', generate_string_from_data)
     return cls
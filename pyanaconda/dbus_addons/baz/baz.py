@@ -49,6 +49,11 @@ class BazTask(Task):
     def name(self):
         return "Configure Baz"
 
+    @property
+    def resources(self):
+        # The task doesn't touch the target system.
+        return ["baz"]
+
     @property
     def steps(self):
         return 5
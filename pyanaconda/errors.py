@@ -16,6 +16,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from threading import Event, current_thread, main_thread
+
 from pyanaconda.core.i18n import _, C_
 from pyanaconda.flags import flags
 
@@ -104,6 +106,20 @@ class ErrorHandler(object):
     """
     def __init__(self, ui=None):
         self.ui = ui
+        self._ready = Event()
+        self._ready.set()
+
+    def defer(self):
+        """Defer the error handling until the UI is ready.
+
+        Errors raised in other threads will wait for the set_ready
+        method, so threads started before the UI can report errors.
+        """
+        self._ready.clear()
+
+    def set_ready(self):
+        """The UI is ready to handle errors."""
+        self._ready.set()
 
     def _partitionErrorHandler(self, exn):
         message = _("The following errors occurred with your partitioning:\n\n%(errortxt)s\n\n"
@@ -300,6 +316,10 @@ class ErrorHandler(object):
         """
         rc = ERROR_RAISE
 
+        # The main thread sets up the UI, so it can't wait for it.
+        if current_thread() is not main_thread():
+            self._ready.wait()
+
         if not self.ui:
             raise exn
 
@@ -26,6 +26,7 @@ import shutil
 import sys
 import time
 import traceback
+from collections import deque
 
 import blivet.errors
 
@@ -39,7 +40,8 @@ from pyanaconda import startup_utils
 from pyanaconda import product
 from pyanaconda.core.async_utils import run_in_loop
 from pyanaconda.core.configuration.anaconda import conf
-from pyanaconda.core.constants import THREAD_EXCEPTION_HANDLING_TEST, IPMI_FAILED
+from pyanaconda.core.constants import THREAD_EXCEPTION_HANDLING_TEST, IPMI_FAILED, \
+    CRASH_DUMP_SECTION_SIZE, CRASH_DUMP_SECTION_HEAD_SIZE, CRASH_DUMP_TIME_BUDGET
 from pyanaconda.errors import NonInteractiveError
 from pyanaconda.core.i18n import _
 from pyanaconda.threading import threadMgr
@@ -51,6 +53,147 @@ from simpleline.event_loop.signals import ExceptionSignal
 from pyanaconda.anaconda_loggers import get_module_logger
 log = get_module_logger(__name__)
 
+# Small files that are attached to the crash dump in full.
+DUMP_FILES = ["/proc/cmdline"]
+
+# Log files that are attached to the crash dump as bounded sections.
+DUMP_LOG_FILES = ["/tmp/anaconda.log", "/tmp/packaging.log",
+                  "/tmp/program.log", "/tmp/storage.log", "/tmp/ifcfg.log",
+                  "/tmp/dnf.librepo.log", "/tmp/hawkey.log",
+                  "/tmp/lvm.log", "/root/lorax-packages.log",
+                  "/tmp/blivet-gui-utils.log", "/tmp/dbus.log"]
+
+
+class CrashDumpBudget(object):
+    """Time budget for collecting the crash dump.
+
+    The budget is shared by all sections of the dump, so the user
+    gets the error dialog in time even if the sources are huge.
+    """
+
+    def __init__(self, timeout=CRASH_DUMP_TIME_BUDGET):
+        self._timeout = timeout
+        self._deadline = None
+
+    def start(self):
+        """Start the budget of a new crash dump."""
+        self._deadline = time.monotonic() + self._timeout
+
+    @property
+    def expired(self):
+        """Is the budget spent?"""
+        if self._deadline is None:
+            self.start()
+
+        return time.monotonic() > self._deadline
+
+
+crash_dump_budget = CrashDumpBudget()
+
+
+class BoundedSection(object):
+    """Section of the crash dump with a bounded size.
+
+    The lines are streamed into the section. It keeps the first lines
+    up to the size of the head and the last lines up to the rest of the
+    maximal size. The dropped lines are replaced with a marker.
+    """
+
+    def __init__(self, max_size=CRASH_DUMP_SECTION_SIZE, head_size=CRASH_DUMP_SECTION_HEAD_SIZE):
+        self._head = []
+        self._head_size = 0
+        self._head_limit = min(head_size, max_size)
+        self._tail = deque()
+        self._tail_size = 0
+        self._tail_limit = max_size - self._head_limit
+        self._dropped = 0
+        self._interrupted = False
+
+    @property
+    def dropped(self):
+        """The number of dropped lines."""
+        return self._dropped
+
+    def add_line(self, line):
+        """Add a line to the section.
+
+        :param line: a string ending with a new line
+        """
+        if not self._tail and self._head_size + len(line) <= self._head_limit:
+            self._head.append(line)
+            self._head_size += len(line)
+            return
+
+        # Keep only the end of a line that doesn't fit.
+        if len(line) > self._tail_limit:
+            line = line[len(line) - self._tail_limit:]
+            self._dropped += 1
+
+        self._tail.append(line)
+        self._tail_size += len(line)
+
+        while self._tail_size > self._tail_limit:
+            self._tail_size -= len(self._tail.popleft())
+            self._dropped += 1
+
+    def interrupt(self):
+        """Mark the section as incomplete."""
+        self._interrupted = True
+
+    def get_text(self):
+        """Get the text of the section."""
+        parts = list(self._head)
+
+        if self._dropped:
+            parts.append("\n[... {} lines truncated ...]\n\n".format(self._dropped))
+
+        parts.extend(self._tail)
+
+        if self._interrupted:
+            parts.append("\n[... interrupted, the time budget has been spent ...]\n")
+
+        return "".join(parts)
+
+
+def collect_section(lines, budget=None, **kwargs):
+    """Stream the lines into a bounded section.
+
+    :param lines: an iterable of strings ending with a new line
+    :param budget: an instance of CrashDumpBudget or None for the shared one
+    :param kwargs: arguments of the BoundedSection
+    :return: a text of the section
+    """
+    budget = budget or crash_dump_budget
+    section = BoundedSection(**kwargs)
+
+    for line in lines:
+        if budget.expired:
+            section.interrupt()
+            break
+
+        section.add_line(line)
+
+    return section.get_text()
+
+
+def get_file_callback(path):
+    """Get a callback that collects a bounded section of the file.
+
+    :param path: a path to the file
+    :return: a function with no arguments
+    """
+    def callback():
+        if not os.path.exists(path):
+            return ""
+
+        try:
+            with open(path, "rt", errors="replace") as f:
+                return collect_section(f)
+        except OSError as e:
+            return "Failed to read {}: {}".format(path, e)
+
+    return callback
+
 
 class AnacondaReverseExceptionDump(ReverseExceptionDump):
 
@@ -131,6 +274,8 @@ class AnacondaExceptionHandler(ExceptionHandler):
         """
 
         log.debug("running handleException")
+        crash_dump_budget.start()
+
         exception_lines = traceback.format_exception(*dump_info.exc_info)
         log.critical("\n".join(exception_lines))
 
@@ -258,15 +403,11 @@ class AnacondaExceptionHandler(ExceptionHandler):
 
 
 def initExceptionHandling(anaconda):
-    file_list = ["/tmp/anaconda.log", "/tmp/packaging.log",
-                 "/tmp/program.log", "/tmp/storage.log", "/tmp/ifcfg.log",
-                 "/tmp/dnf.librepo.log", "/tmp/hawkey.log",
-                 "/tmp/lvm.log", util.getSysroot() + "/root/install.log",
-                 "/proc/cmdline", "/root/lorax-packages.log",
-                 "/tmp/blivet-gui-utils.log", "/tmp/dbus.log"]
+    file_list = list(DUMP_FILES)
+    log_file_list = DUMP_LOG_FILES + [util.getSysroot() + "/root/install.log"]
 
     if os.path.exists("/tmp/syslog"):
-        file_list.extend(["/tmp/syslog"])
+        log_file_list.extend(["/tmp/syslog"])
 
     if anaconda.opts and anaconda.opts.ksfile:
         file_list.extend([anaconda.opts.ksfile])
@@ -296,6 +437,11 @@ def initExceptionHandling(anaconda):
                   localSkipList=["passphrase", "password", "_oldweak", "_password", "try_passphrase"],
                   fileList=file_list)
 
+    # The log files can be huge, so attach only bounded sections of them.
+    for path in log_file_list:
+        config.register_callback(os.path.basename(path), get_file_callback(path),
+                                 attchmnt_only=False)
+
     config.register_callback("lsblk_output", lsblk_callback, attchmnt_only=False)
     config.register_callback("nmcli_dev_list", nmcli_dev_list_callback,
                            attchmnt_only=True)
@@ -304,7 +450,7 @@ def initExceptionHandling(anaconda):
     config.register_callback("type", lambda: "anaconda", attchmnt_only=True)
     config.register_callback("addons", list_addons_callback, attchmnt_only=False)
 
-    if "/tmp/syslog" not in file_list:
+    if "/tmp/syslog" not in log_file_list:
         # no syslog, grab output from journalctl and put it also to the
         # anaconda-tb file
         config.register_callback("journalctl", journalctl_callback, attchmnt_only=False)
@@ -338,13 +484,11 @@ def journalctl_callback():
     # regex to filter log messages from anaconda's process (we have that in our
     # logs)
     anaconda_log_line = re.compile(r"\[%d\]:" % os.getpid())
-    ret = ""
-    for line in util.execReadlines("journalctl", ["-b"]):
-        if anaconda_log_line.search(line) is None:
-            # not an anaconda's message
-            ret += line + "\n"
+    lines = util.execReadlines("journalctl", ["-b"])
 
-    return ret
+    # not an anaconda's message
+    return collect_section(line + "\n" for line in lines
+                           if anaconda_log_line.search(line) is None)
 
 
 def list_addons_callback():
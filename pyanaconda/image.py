@@ -21,10 +21,13 @@ import os
 import os.path
 import stat
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 
 from pyanaconda import isys
+from pyanaconda.core.constants import ISO_DISCOVERY_WORKERS, THREAD_ISO_DISCOVERY
 from pyanaconda.errors import errorHandler, ERROR_RAISE, InvalidImageSizeError, MissingImageError
-from pyanaconda.payload.install_tree_metadata import InstallTreeMetadata
+from pyanaconda.iso9660 import ISO9660Image, ISO9660Error
 
 import blivet.util
 import blivet.arch
@@ -45,6 +48,9 @@ def findFirstIsoImage(path):
     Find the first iso image in path
     This also supports specifying a specific .iso image
 
+    The images are checked at once and without mounting them if
+    possible. The results are cached per path, size and mtime.
+
     Returns the basename of the image
     """
     try:
@@ -52,31 +58,171 @@ def findFirstIsoImage(path):
     except OSError:
         return None
 
-    arch = _arch
-    mount_path = "/mnt/install/cdimage"
-    discinfo_path = os.path.join(mount_path, ".discinfo")
-
     if os.path.isfile(path) and path.endswith(".iso"):
         files = [os.path.basename(path)]
         path = os.path.dirname(path)
     else:
         files = os.listdir(path)
 
-    for fn in files:
-        what = os.path.join(path, fn)
-        log.debug("Checking %s", what)
-        if not isys.isIsoImage(what):
-            continue
+    candidates = [fn for fn in files if os.path.isfile(os.path.join(path, fn))]
 
-        log.debug("mounting %s on %s", what, mount_path)
-        try:
-            blivet.util.mount(what, mount_path, fstype="iso9660", options="ro")
-        except OSError:
+    if not candidates:
+        return None
+
+    workers = min(len(candidates), ISO_DISCOVERY_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers,
+                            thread_name_prefix=THREAD_ISO_DISCOVERY) as executor:
+        checks = [(fn, executor.submit(_check_iso_image_cached, os.path.join(path, fn)))
+                  for fn in candidates]
+
+    # Keep the order of the files.
+    for fn, future in checks:
+        if not future.result():
             continue
 
+        what = os.path.join(path, fn)
+
+        # warn user if images appears to be wrong size
+        if os.stat(what)[stat.ST_SIZE] % 2048:
+            log.warning("%s appears to be corrupted", what)
+            exn = InvalidImageSizeError("size is not a multiple of 2048 bytes", what)
+            if errorHandler.cb(exn) == ERROR_RAISE:
+                raise exn
+
+        log.info("Found disc at %s", fn)
+        return fn
+
+    return None
+
+
+# Results of the checks of ISO images by paths, sizes and mtimes.
+# Only the definitive results are cached, not the failures to read
+# or to mount the images.
+_iso_checks = {}
+_iso_checks_lock = Lock()
+
+# Only one image can be mounted at the mount point at once.
+_iso_mount_lock = Lock()
+
+
+def _check_iso_image_cached(what):
+    """Check the ISO image or return the cached result.
+
+    :param what: a path to the image
+    :return: True or False
+    """
+    try:
+        sinfo = os.stat(what)
+    except OSError:
+        return False
+
+    key = (os.path.realpath(what), sinfo.st_size, sinfo.st_mtime_ns)
+
+    with _iso_checks_lock:
+        if key in _iso_checks:
+            log.debug("Using the cached check of %s", what)
+            return _iso_checks[key]
+
+    result = _check_iso_image(what)
+
+    # The image can be checked again later.
+    if result is None:
+        return False
+
+    with _iso_checks_lock:
+        _iso_checks[key] = result
+
+    return result
+
+
+def _check_iso_image(what):
+    """Check if the ISO image can be used as an installation source.
+
+    :param what: a path to the image
+    :return: True or False, or None if the image can't be checked now
+    """
+    log.debug("Checking %s", what)
+    if not isys.isIsoImage(what):
+        # The image can't be read.
+        if not os.access(what, os.R_OK):
+            return None
+
+        return False
+
+    try:
+        with ISO9660Image(what) as image:
+            if _check_iso_metadata(what, image):
+                return True
+    except ISO9660Error as e:
+        log.debug("Can't read %s without mounting: %s", what, e)
+    else:
+        # The reader doesn't support all extensions of ISO 9660,
+        # so don't trust the negative result without mounting.
+        log.debug("Can't verify %s without mounting", what)
+
+    with _iso_mount_lock:
+        return _check_mounted_iso_image(what)
+
+
+def _check_disc_arch(what, disc_arch):
+    """Check the architecture of the .discinfo file."""
+    log.debug("discArch = %s", disc_arch)
+    if disc_arch != _arch:
+        log.warning("findFirstIsoImage: architectures mismatch: %s, %s",
+                    disc_arch, _arch)
+        return False
+
+    return True
+
+
+def _check_iso_metadata(what, image):
+    """Check the metadata of the ISO image without mounting it."""
+    data = image.read_file(".discinfo")
+
+    if data is None:
+        return False
+
+    log.debug("Reading .discinfo from %s", what)
+    disc_info = DiscInfo()
+
+    try:
+        disc_info.loads(data.decode("utf-8"))
+        disc_arch = disc_info.arch
+    except Exception as ex:  # pylint: disable=broad-except
+        log.warning(".discinfo file can't be loaded: %s", ex)
+        return False
+
+    if not _check_disc_arch(what, disc_arch):
+        return False
+
+    # If there's no repodata, there's no point in trying to
+    # install from it.
+    if not _check_image_repodata(image):
+        log.warning("%s doesn't have repodata, skipping", what)
+        return False
+
+    return True
+
+
+def _check_mounted_iso_image(what):
+    """Check the ISO image mounted at the mount point.
+
+    :param what: a path to the image
+    :return: True or False, or None if the image can't be mounted
+    """
+    mount_path = "/mnt/install/cdimage"
+    discinfo_path = os.path.join(mount_path, ".discinfo")
+
+    log.debug("mounting %s on %s", what, mount_path)
+    try:
+        blivet.util.mount(what, mount_path, fstype="iso9660", options="ro")
+    except OSError as e:
+        log.debug("Can't mount %s: %s", what, e)
+        return None
+
+    try:
         if not os.access(discinfo_path, os.R_OK):
-            blivet.util.umount(mount_path)
-            continue
+            return False
 
         log.debug("Reading .discinfo")
         disc_info = DiscInfo()
@@ -84,36 +230,25 @@ def findFirstIsoImage(path):
         try:
             disc_info.load(discinfo_path)
             disc_arch = disc_info.arch
+        except OSError as ex:
+            log.warning(".discinfo file can't be read: %s", ex)
+            return None
         except Exception as ex:  # pylint: disable=broad-except
             log.warning(".discinfo file can't be loaded: %s", ex)
-            continue
+            return False
 
-        log.debug("discArch = %s", disc_arch)
-        if disc_arch != arch:
-            log.warning("findFirstIsoImage: architectures mismatch: %s, %s",
-                        disc_arch, arch)
-            blivet.util.umount(mount_path)
-            continue
+        if not _check_disc_arch(what, disc_arch):
+            return False
 
         # If there's no repodata, there's no point in trying to
         # install from it.
         if not _check_repodata(mount_path):
             log.warning("%s doesn't have repodata, skipping", what)
-            blivet.util.umount(mount_path)
-            continue
-
-        # warn user if images appears to be wrong size
-        if os.stat(what)[stat.ST_SIZE] % 2048:
-            log.warning("%s appears to be corrupted", what)
-            exn = InvalidImageSizeError("size is not a multiple of 2048 bytes", what)
-            if errorHandler.cb(exn) == ERROR_RAISE:
-                raise exn
+            return False
 
-        log.info("Found disc at %s", fn)
+        return True
+    finally:
         blivet.util.umount(mount_path)
-        return fn
-
-    return None
 
 
 def verify_valid_installtree(path):
@@ -133,6 +268,8 @@ def verify_valid_installtree(path):
 
 
 def _check_repodata(mount_path):
+    # Import it here to avoid a cyclic import with pyanaconda.payload.
+    from pyanaconda.payload.install_tree_metadata import InstallTreeMetadata
     install_tree_meta = InstallTreeMetadata()
     if not install_tree_meta.load_file(mount_path):
         log.warning("Can't read install tree metadata!")
@@ -145,6 +282,28 @@ def _check_repodata(mount_path):
     return repo_md.is_valid()
 
 
+def _check_image_repodata(image):
+    # Import it here to avoid a cyclic import with pyanaconda.payload.
+    from pyanaconda.payload.install_tree_metadata import InstallTreeMetadata
+    install_tree_meta = InstallTreeMetadata()
+
+    for name in (".treeinfo", "treeinfo"):
+        data = image.read_file(name)
+
+        if data is not None:
+            install_tree_meta.load_text(data.decode("utf-8"))
+            break
+    else:
+        log.warning("Can't read install tree metadata!")
+
+    repo_md = install_tree_meta.get_base_repo_metadata()
+
+    if not repo_md:
+        return False
+
+    return image.is_dir(os.path.join(repo_md.relative_path, "repodata"))
+
+
 def mountImage(isodir, tree):
     while True:
         if os.path.isfile(isodir):
@@ -18,9 +18,18 @@
 # Red Hat, Inc.
 #
 
+import hashlib
+import hmac
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
 import pwquality
 
+from pyanaconda.core.async_utils import run_in_loop
 from pyanaconda.core.signal import Signal
+from pyanaconda.core.timer import Timer
 from pyanaconda.core.i18n import _
 from pyanaconda.core import constants, regexes
 from pyanaconda import users
@@ -65,6 +74,64 @@ class PwqualitySettingsCache(object):
 
 pwquality_settings_cache = PwqualitySettingsCache()
 
+
+class PwqualityVerdictCache(object):
+    """Cache for libpwquality verdicts.
+
+    The dictionary check of libpwquality is slow and the same password is
+    checked again and again, for example when its confirmation is typed.
+    The verdicts are cached by a keyed digest of the password, the minimum
+    password length and the username, so the password itself is not kept.
+    Only the most recent verdicts are kept.
+    """
+    def __init__(self, max_size=constants.PASSWORD_QUALITY_CACHE_SIZE):
+        self._max_size = max_size
+        self._verdicts = OrderedDict()
+        self._key = os.urandom(32)
+        self._lock = Lock()
+
+    def _get_digest(self, password, minlen, username):
+        message = repr((password, minlen, username)).encode("utf-8")
+        return hmac.new(self._key, message, hashlib.sha256).digest()
+
+    def check(self, password, minlen, username):
+        """Check the password with libpwquality.
+
+        :param str password: a password to check
+        :param int minlen: a minimum password length
+        :param username: a username or None
+        :returns: a password quality and an error message
+        :rtype: a tuple of int and str
+        """
+        digest = self._get_digest(password, minlen, username)
+
+        with self._lock:
+            if digest in self._verdicts:
+                self._verdicts.move_to_end(digest)
+                return self._verdicts[digest]
+
+        try:
+            settings = pwquality_settings_cache.get_settings_by_minlen(minlen)
+            verdict = (settings.check(password, None, username), "")
+        except pwquality.PWQError as e:
+            # PWQError values are built as a tuple of (int, str)
+            verdict = (0, e.args[1])
+
+        with self._lock:
+            self._verdicts[digest] = verdict
+
+            while len(self._verdicts) > self._max_size:
+                self._verdicts.popitem(last=False)
+
+        return verdict
+
+pwquality_verdict_cache = PwqualityVerdictCache()
+
+# The slow part of the asynchronous checks runs here.
+password_check_executor = ThreadPoolExecutor(max_workers=1,
+                                             thread_name_prefix=constants.THREAD_PASSWORD_CHECK)
+
+
 class PasswordCheckRequest(object):
     """A wrapper for a password check request.
 
@@ -365,16 +432,13 @@ class PasswordValidityCheck(InputCheck):
         """
 
         length_ok = False
-        error_message = ""
-        pw_quality = 0
-        try:
-            # lets run the password through libpwquality
-            pw_quality = check_request.pwquality_settings.check(check_request.password, None, check_request.username)
-        except pwquality.PWQError as e:
-            # Leave valid alone here: the password is weak but can still
-            # be accepted.
-            # PWQError values are built as a tuple of (int, str)
-            error_message = e.args[1]
+
+        # lets run the password through libpwquality
+        # Leave valid alone here: the password is weak but can still
+        # be accepted.
+        pw_quality, error_message = pwquality_verdict_cache.check(check_request.password,
+                                                                  check_request.policy.minlen,
+                                                                  check_request.username)
 
         if check_request.policy.emptyok:
             # if we are OK with empty passwords, then empty passwords are also fine length wise
@@ -577,6 +641,11 @@ class PasswordChecker(object):
 
     It's also possible to mark individual checks to be skipped by setting their skip property to True.
     Such check will be skipped during the checking run.
+
+    In the asynchronous mode, changes of the password fields don't run the checks right away.
+    The checks run once the input hasn't changed for a while, and the slow libpwquality check
+    runs in a worker thread first. Results of outdated input are dropped. The checks_done
+    signal is always emitted in the main thread.
     """
 
     def __init__(self, initial_password_content, initial_password_confirmation_content,
@@ -592,9 +661,13 @@ class PasswordChecker(object):
         self._username = None
         self._fullname = ""
         self._secret_type = constants.SecretType.PASSWORD
+        self._asynchronous = False
+        self._timer = None
+        self._generation = 0
+        self._pending = False
         # connect to the password field signals
-        self.password.changed.connect(self.run_checks)
-        self.password_confirmation.changed.connect(self.run_checks)
+        self.password.changed.connect(self.schedule_checks)
+        self.password_confirmation.changed.connect(self.schedule_checks)
 
         # signals
         self.checks_done = Signal()
@@ -695,12 +768,88 @@ class PasswordChecker(object):
             raise RuntimeError("Unknown secret type: {}".format(new_type))
         self._secret_type = new_type
 
+    @property
+    def asynchronous(self):
+        """Should the checks run asynchronously after a change of the input?
+
+        The asynchronous mode requires a running GLib event loop.
+
+        :returns: True if the checks run asynchronously, otherwise False
+        :rtype: bool
+        """
+        return self._asynchronous
+
+    @asynchronous.setter
+    def asynchronous(self, value):
+        self._asynchronous = value
+
+    @property
+    def checks_pending(self):
+        """Are there scheduled checks that haven't finished yet?"""
+        return self._pending
+
     def add_check(self, check_instance):
         """Add check instance to list of checks."""
         self._checks.append(check_instance)
 
-    def run_checks(self):
-        # first we need to prepare a check request instance
+    def schedule_checks(self):
+        """Run the checks after a change of the input.
+
+        In the synchronous mode, the checks run right away.
+        """
+        if not self.asynchronous:
+            self.run_checks()
+            return
+
+        self._cancel_pending_checks()
+        self._pending = True
+        self._timer = Timer()
+        self._timer.timeout_msec(constants.PASSWORD_CHECK_DELAY,
+                                 self._start_checks, self._generation)
+
+    def run_pending_checks(self):
+        """Run the scheduled checks right away."""
+        if self.checks_pending:
+            self.run_checks()
+
+    def _cancel_pending_checks(self):
+        """Drop the scheduled checks and results of the running ones."""
+        self._generation += 1
+        self._pending = False
+
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+    def _start_checks(self, generation):
+        """Run the slow part of the checks in the worker thread."""
+        self._timer = None
+
+        if generation == self._generation:
+            password_check_executor.submit(self._prepare_checks, self._create_request(), generation)
+
+        return False
+
+    def _prepare_checks(self, check_request, generation):
+        """Cache the libpwquality verdict and finish the checks in the main thread."""
+        try:
+            pwquality_verdict_cache.check(check_request.password,
+                                          check_request.policy.minlen,
+                                          check_request.username)
+        except Exception as e:  # pylint: disable=broad-except
+            log.error("Failed to check the password quality: %s", e)
+
+        run_in_loop(self._finish_checks, generation)
+
+    def _finish_checks(self, generation):
+        """Run the checks unless the input has changed in the meantime."""
+        if generation == self._generation:
+            self.run_checks()
+
+        return False
+
+    def _create_request(self):
+        """Create a check request from the current input."""
         check_request = PasswordCheckRequest()
         check_request.password = self.password.content
         check_request.password_confirmation = self.password_confirmation.content
@@ -708,9 +857,18 @@ class PasswordChecker(object):
         check_request.username = self.username
         check_request.fullname = self.fullname
         check_request.secret_type = self.secret_type
+        return check_request
+
+    def run_checks(self):
+        # results of the scheduled checks would be outdated
+        self._cancel_pending_checks()
 
-        # reset the list of failed checks
+        # first we need to prepare a check request instance
+        check_request = self._create_request()
+
+        # reset the lists of failed and successful checks
         self._failed_checks = []
+        self._successful_checks = []
 
         error_message = ""
         for check in self.checks:
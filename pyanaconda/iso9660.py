@@ -0,0 +1,282 @@
+#
+# iso9660.py: Read files from ISO 9660 images without mounting them.
+#
+# Copyright (C) 2019  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import struct
+from collections import namedtuple
+
+__all__ = ["ISO9660Error", "ISO9660Image"]
+
+# The size of a logical block of the image.
+ISO_BLOCK_SIZE = 2048
+
+# The first block of the volume descriptors.
+ISO_DESCRIPTORS_START = 16
+
+# The maximal number of the volume descriptors we read.
+ISO_DESCRIPTORS_MAX = 32
+
+# Types of the volume descriptors.
+ISO_PRIMARY_DESCRIPTOR = 1
+ISO_SUPPLEMENTARY_DESCRIPTOR = 2
+ISO_TERMINATOR = 255
+
+# Escape sequences of the Joliet supplementary descriptors.
+JOLIET_ESCAPE_SEQUENCES = (b"%/@", b"%/C", b"%/E")
+
+# The maximal size of a file or a directory we read.
+ISO_READ_MAX = 16 * 1024 * 1024
+
+# The directory flag of a directory record.
+ISO_DIRECTORY_FLAG = 0x02
+
+DirectoryRecord = namedtuple("DirectoryRecord", ["name", "extent", "size", "is_dir"])
+
+
+class ISO9660Error(Exception):
+    """The image can't be read."""
+    pass
+
+
+class ISO9660Image(object):
+    """A read-only view of files in an ISO 9660 image.
+
+    Only the root directory tree is read. The names of files are taken
+    from the Rock Ridge extensions, from the Joliet tree or from the
+    plain ISO 9660 records, in this order.
+    """
+
+    def __init__(self, path):
+        """Open the image.
+
+        :param path: a path to the image
+        :raise: ISO9660Error if the image can't be read
+        """
+        self._path = path
+        self._file = None
+        self._roots = []
+        self._directories = {}
+
+        try:
+            self._file = open(path, "rb")
+            self._read_descriptors()
+        except (OSError, IndexError, struct.error) as e:
+            self.close()
+            raise ISO9660Error("Can't read {}: {}".format(path, e)) from e
+        except ISO9660Error:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Close the image."""
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def _read_block(self, block, size=ISO_BLOCK_SIZE):
+        """Read data from the given block."""
+        try:
+            self._file.seek(block * ISO_BLOCK_SIZE)
+            data = self._file.read(size)
+        except OSError as e:
+            raise ISO9660Error("Can't read {}: {}".format(self._path, e)) from e
+
+        if len(data) != size:
+            raise ISO9660Error("Unexpected end of {}.".format(self._path))
+
+        return data
+
+    def _read_descriptors(self):
+        """Find the root directories of the image."""
+        primary = None
+        joliet = None
+
+        for block in range(ISO_DESCRIPTORS_START, ISO_DESCRIPTORS_START + ISO_DESCRIPTORS_MAX):
+            data = self._read_block(block)
+
+            if data[1:6] != b"CD001":
+                raise ISO9660Error("{} is not an ISO 9660 image.".format(self._path))
+
+            if data[0] == ISO_TERMINATOR:
+                break
+
+            if data[0] == ISO_PRIMARY_DESCRIPTOR and primary is None:
+                primary = self._parse_record(data[156:190], joliet=False)
+
+            elif data[0] == ISO_SUPPLEMENTARY_DESCRIPTOR and joliet is None \
+                    and data[88:91] in JOLIET_ESCAPE_SEQUENCES:
+                joliet = self._parse_record(data[156:190], joliet=True)
+
+        if primary is None:
+            raise ISO9660Error("{} has no primary volume descriptor.".format(self._path))
+
+        self._roots.append((primary, False))
+
+        if joliet is not None:
+            self._roots.append((joliet, True))
+
+    @staticmethod
+    def _get_rock_ridge_name(system_use):
+        """Return the Rock Ridge name from the system use area or None."""
+        name = None
+        offset = 0
+
+        while offset + 4 <= len(system_use):
+            signature = system_use[offset:offset + 2]
+            length = system_use[offset + 2]
+
+            if length < 4:
+                break
+
+            if signature == b"NM":
+                flags = system_use[offset + 4]
+                name = (name or b"") + system_use[offset + 5:offset + length]
+
+                if not flags & 0x01:
+                    break
+
+            offset += length
+
+        if name is None:
+            return None
+
+        return name.decode("utf-8", "replace")
+
+    @classmethod
+    def _parse_record(cls, data, joliet):
+        """Parse a directory record."""
+        extent = struct.unpack_from("<I", data, 2)[0]
+        size = struct.unpack_from("<I", data, 10)[0]
+        flags = data[25]
+        name_length = data[32]
+        raw_name = data[33:33 + name_length]
+
+        if raw_name in (b"\x00", b"\x01"):
+            name = None
+        elif joliet:
+            name = raw_name.decode("utf-16-be", "replace")
+        else:
+            padding = 1 if name_length % 2 == 0 else 0
+            name = cls._get_rock_ridge_name(data[33 + name_length + padding:])
+
+            if name is None:
+                name = raw_name.decode("ascii", "replace")
+
+        if name:
+            # Remove the version of the file and the empty extension.
+            name = name.split(";", 1)[0]
+
+            if name.endswith(".") and not flags & ISO_DIRECTORY_FLAG:
+                name = name[:-1]
+
+        return DirectoryRecord(name, extent, size, bool(flags & ISO_DIRECTORY_FLAG))
+
+    def _list_directory(self, record, joliet):
+        """Return records of the given directory."""
+        key = (record.extent, joliet)
+
+        if key in self._directories:
+            return self._directories[key]
+
+        if record.size > ISO_READ_MAX:
+            raise ISO9660Error("The directory in {} is too big.".format(self._path))
+
+        data = self._read_block(record.extent, record.size)
+        records = []
+        offset = 0
+
+        while offset < len(data):
+            length = data[offset]
+
+            if length == 0:
+                # Records don't cross the block boundaries.
+                offset = (offset // ISO_BLOCK_SIZE + 1) * ISO_BLOCK_SIZE
+                continue
+
+            try:
+                child = self._parse_record(data[offset:offset + length], joliet)
+            except (IndexError, struct.error) as e:
+                raise ISO9660Error("Invalid directory record in {}.".format(self._path)) from e
+
+            if child.name:
+                records.append(child)
+
+            offset += length
+
+        self._directories[key] = records
+        return records
+
+    def _find_record(self, path):
+        """Return a directory record of the given path or None."""
+        components = [c for c in path.split("/") if c and c != "."]
+
+        for root, joliet in self._roots:
+            record = root
+
+            for component in components:
+                if not record.is_dir:
+                    record = None
+                    break
+
+                records = self._list_directory(record, joliet)
+                match = [r for r in records if r.name == component] \
+                    or [r for r in records if r.name.lower() == component.lower()]
+
+                if not match:
+                    record = None
+                    break
+
+                record = match[0]
+
+            if record is not None:
+                return record
+
+        return None
+
+    def is_file(self, path):
+        """Is there a file at the given path?"""
+        record = self._find_record(path)
+        return record is not None and not record.is_dir
+
+    def is_dir(self, path):
+        """Is there a directory at the given path?"""
+        record = self._find_record(path)
+        return record is not None and record.is_dir
+
+    def read_file(self, path):
+        """Read a file from the image.
+
+        :param path: a path to the file in the image
+        :return: the content of the file in bytes or None if it doesn't exist
+        :raise: ISO9660Error if the file can't be read
+        """
+        record = self._find_record(path)
+
+        if record is None or record.is_dir:
+            return None
+
+        if record.size > ISO_READ_MAX:
+            raise ISO9660Error("The file {} in {} is too big.".format(path, self._path))
+
+        return self._read_block(record.extent, record.size)
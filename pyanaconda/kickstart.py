@@ -22,6 +22,9 @@ import glob
 import os
 import os.path
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 
 import requests
 import shlex
@@ -45,7 +48,7 @@ from pyanaconda.bootloader.grub2 import GRUB2
 from pyanaconda.core.constants import ADDON_PATHS, IPMI_ABORTED, THREAD_STORAGE, SELINUX_DEFAULT, \
     SETUP_ON_BOOT_DISABLED, SETUP_ON_BOOT_RECONFIG, \
     CLEAR_PARTITIONS_ALL, BOOTLOADER_LOCATION_PARTITION, FIREWALL_ENABLED, FIREWALL_DISABLED, \
-    FIREWALL_USE_SYSTEM_DEFAULTS
+    FIREWALL_USE_SYSTEM_DEFAULTS, THREAD_ISCSI_LOGIN, ISCSI_LOGIN_WORKERS
 from pyanaconda.dbus.structure import apply_structure
 from pyanaconda.desktop import Desktop
 from pyanaconda.errors import ScriptError, errorHandler
@@ -281,6 +284,23 @@ class RemovedCommand(KickstartCommand, metaclass=ABCMeta):
         """
         return ""
 
+    def generate_module_kickstart(self, service):
+        """Generate a temporary kickstart of the given DBus module.
+
+        Use the kickstart collected by the handler if possible.
+        Otherwise, ask the module.
+
+        :param service: an identifier of a DBus service
+        :return: a kickstart string
+        """
+        module_kickstarts = getattr(self.handler, "module_kickstarts", None) or {}
+
+        if service.service_name in module_kickstarts:
+            return module_kickstarts[service.service_name]
+
+        proxy = service.get_proxy()
+        return proxy.GenerateTemporaryKickstart()
+
     def parse(self, args):
         """Do not parse anything.
 
@@ -480,8 +500,7 @@ class Realm(RemovedCommand):
 
 class ClearPart(RemovedCommand):
     def __str__(self):
-        storage_module_proxy = STORAGE.get_proxy()
-        return storage_module_proxy.GenerateTemporaryKickstart()
+        return self.generate_module_kickstart(STORAGE)
 
 class Firewall(RemovedCommand):
     def __init__(self, *args, **kwargs):
@@ -589,6 +608,10 @@ class Group(COMMANDS.Group):
                 group_log.warning(str(e))
 
 class Iscsi(COMMANDS.Iscsi):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending_targets = []
+
     def parse(self, args):
         tg = super().parse(args)
 
@@ -607,18 +630,60 @@ class Iscsi(COMMANDS.Iscsi):
             raise KickstartParseError(lineno=self.lineno,
                     msg=_("iscsi --iface must be specified (binding used) either for all targets or for none"))
 
-        try:
-            blivet.iscsi.iscsi.add_target(tg.ipaddr, tg.port, tg.user,
-                                          tg.password, tg.user_in,
-                                          tg.password_in,
-                                          target=tg.target,
-                                          iface=tg.iface)
-            iscsi_log.info("added iscsi target %s at %s via %s", tg.target, tg.ipaddr, tg.iface)
-        except (IOError, ValueError) as e:
-            raise KickstartParseError(lineno=self.lineno, msg=str(e))
-
+        # The target will be added by add_targets.
+        self._pending_targets.append((self.lineno, tg))
         return tg
 
+    def add_targets(self, max_workers=ISCSI_LOGIN_WORKERS):
+        """Discover and log into the parsed iSCSI targets.
+
+        Targets of different portals are added in parallel, targets
+        of the same portal one after another.
+
+        :param max_workers: how many portals can be processed at once
+        :raise: KickstartParseError for the first line that failed
+        """
+        portals = OrderedDict()
+
+        for lineno, tg in self._pending_targets:
+            portals.setdefault((tg.ipaddr, tg.port), []).append((lineno, tg))
+
+        self._pending_targets = []
+
+        if not portals:
+            return
+
+        workers = max(1, min(max_workers, len(portals)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=THREAD_ISCSI_LOGIN) as executor:
+            results = executor.map(self._add_portal_targets, portals.values())
+            errors = sorted(chain.from_iterable(results))
+
+        if errors:
+            lineno, msg = errors[0]
+            raise KickstartParseError(lineno=lineno, msg=msg)
+
+    @staticmethod
+    def _add_portal_targets(targets):
+        """Add targets of one portal.
+
+        :return: a list of (lineno, message) tuples of failed targets
+        """
+        errors = []
+
+        for lineno, tg in targets:
+            try:
+                blivet.iscsi.iscsi.add_target(tg.ipaddr, tg.port, tg.user,
+                                              tg.password, tg.user_in,
+                                              tg.password_in,
+                                              target=tg.target,
+                                              iface=tg.iface)
+                iscsi_log.info("added iscsi target %s at %s via %s", tg.target, tg.ipaddr, tg.iface)
+            except (IOError, ValueError) as e:
+                iscsi_log.error("failed to add iscsi target %s at %s: %s", tg.target, tg.ipaddr, e)
+                errors.append((lineno, str(e)))
+
+        return errors
+
 class IscsiName(COMMANDS.IscsiName):
     def parse(self, args):
         retval = super().parse(args)
@@ -628,8 +693,7 @@ class IscsiName(COMMANDS.IscsiName):
 
 class Lang(RemovedCommand):
     def __str__(self):
-        localization_proxy = LOCALIZATION.get_proxy()
-        return localization_proxy.GenerateKickstart()
+        return self.generate_module_kickstart(LOCALIZATION)
 
     def execute(self, *args, **kwargs):
         localization_proxy = LOCALIZATION.get_proxy()
@@ -793,8 +857,7 @@ class ReqPart(COMMANDS.ReqPart):
 class RootPw(RemovedCommand):
 
     def __str__(self):
-        users_proxy = USERS.get_proxy()
-        return users_proxy.GenerateTemporaryKickstart()
+        return self.generate_module_kickstart(USERS)
 
     def execute(self, storage, ksdata, users):
 
@@ -826,8 +889,7 @@ class SELinux(RemovedCommand):
     }
 
     def __str__(self):
-        security_proxy = SECURITY.get_proxy()
-        return security_proxy.GenerateKickstart()
+        return self.generate_module_kickstart(SECURITY)
 
     def execute(self, *args):
         security_proxy = SECURITY.get_proxy()
@@ -852,19 +914,21 @@ class SELinux(RemovedCommand):
 class Services(RemovedCommand):
 
     def __str__(self):
-        services_proxy = SERVICES.get_proxy()
-        return services_proxy.GenerateKickstart()
+        return self.generate_module_kickstart(SERVICES)
 
     def execute(self, storage, ksdata):
         services_proxy = SERVICES.get_proxy()
+        batch = util.SystemdUnitBatch()
 
         for svc in services_proxy.DisabledServices:
             log.debug("Disabling the service %s.", svc)
-            util.disable_service(svc)
+            batch.disable(svc)
 
         for svc in services_proxy.EnabledServices:
             log.debug("Enabling the service %s.", svc)
-            util.enable_service(svc)
+            batch.enable(svc)
+
+        batch.apply()
 
 class SshKey(COMMANDS.SshKey):
     def execute(self, storage, ksdata, users):
@@ -878,8 +942,7 @@ class Timezone(RemovedCommand):
         self.packages = []
 
     def __str__(self):
-        timezone_proxy = TIMEZONE.get_proxy()
-        return timezone_proxy.GenerateKickstart()
+        return self.generate_module_kickstart(TIMEZONE)
 
     def setup(self, ksdata):
         timezone_proxy = TIMEZONE.get_proxy()
@@ -1286,8 +1349,18 @@ class AnacondaKSHandler(superclass):
         # The %anaconda section uses its own handler for a limited set of commands
         self.anaconda = AnacondaSectionHandler()
 
+        # Kickstarts of the DBus modules collected for the output.
+        self.module_kickstarts = {}
+
     def __str__(self):
-        return super().__str__() + "\n" + str(self.addons) + str(self.anaconda)
+        # Ask all DBus modules for their kickstarts at once.
+        boss_proxy = BOSS.get_proxy()
+        self.module_kickstarts = boss_proxy.GenerateTemporaryKickstarts()
+
+        try:
+            return super().__str__() + "\n" + str(self.addons) + str(self.anaconda)
+        finally:
+            self.module_kickstarts = {}
 
 class AnacondaPreParser(KickstartParser):
     # A subclass of KickstartParser that only looks for %pre scripts and
@@ -1392,6 +1465,9 @@ def parseKickstart(f, strict_mode=False, pass_to_boss=False):
             # Parse the kickstart file in anaconda.
             ksparser.readKickstart(f)
 
+            # Log into the iSCSI targets all at once.
+            handler.iscsi.add_targets()
+
             # Process pykickstart warnings in the strict mode:
             if strict_mode and kswarnings:
                 raise KickstartError("Please modify your kickstart file to fix the warnings "
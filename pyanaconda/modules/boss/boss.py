@@ -124,6 +124,14 @@ class Boss(MainModule):
         log.info("Distributing kickstart.")
         return self._kickstart_manager.distribute()
 
+    def generate_kickstarts(self, temporary=False):
+        """Generate kickstarts of all modules.
+
+        FIXME: This is a temporary method, because it provides
+        an implementation to the AnacondaBossInterface.
+        """
+        return self._kickstart_manager.generate_kickstarts(temporary)
+
     def install_system_with_task(self):
         """Install the system.
 
@@ -84,3 +84,22 @@ class AnacondaBossInterface(BossInterface):
             "line_number": get_variant(Int, result["line_number"]),
             "error_message": get_variant(Str, result["error_message"])
         } for result in results]
+
+    def GenerateKickstarts(self) -> Dict[Str, Str]:
+        """Return kickstart representations of all available modules.
+
+        The modules are asked at once and their kickstarts are
+        cached until they change.
+
+        :return: a dictionary of service names and kickstart strings
+        """
+        return self.implementation.generate_kickstarts()
+
+    def GenerateTemporaryKickstarts(self) -> Dict[Str, Str]:
+        """Return temporary kickstart representations of all available modules.
+
+        FIXME: This is just a temporary workaround.
+
+        :return: a dictionary of service names and kickstart strings
+        """
+        return self.implementation.generate_kickstarts(temporary=True)
@@ -16,6 +16,9 @@
 # License and may only be used or replicated with the express permission of
 # Red Hat, Inc.
 #
+from concurrent.futures import ThreadPoolExecutor
+
+from pyanaconda.core.constants import INSTALLATION_TASKS_COLLECT_WORKERS
 from pyanaconda.dbus import DBus
 from pyanaconda.modules.boss.install_manager.installation import SystemInstallationTask
 
@@ -56,27 +59,44 @@ class InstallManager(object):
     def _collect_installation_tasks(self):
         """Collect installation tasks from modules.
 
+        The modules are asked at once, but the tasks
+        are returned in the order of the modules.
+
         :return: a list of tasks proxies
         """
         tasks = []
 
         if not self._module_observers:
             log.error("Starting installation without available modules.")
+            return tasks
+
+        with ThreadPoolExecutor(max_workers=INSTALLATION_TASKS_COLLECT_WORKERS) as executor:
+            for module_tasks in executor.map(self._collect_module_tasks, self._module_observers):
+                tasks.extend(module_tasks)
+
+        return tasks
+
+    def _collect_module_tasks(self, observer):
+        """Collect installation tasks from one module.
+
+        :param observer: a module observer
+        :return: a list of tasks proxies
+        """
+        tasks = []
+
+        # FIXME: This check is here for testing purposes only.
+        # Normally, all given modules should be available once
+        # we start the installation.
+        if not observer.is_service_available:
+            log.error("Module %s is not available!", observer.service_name)
+            return tasks
+
+        service_name = observer.service_name
+        task_paths = observer.proxy.InstallWithTasks()
 
-        for observer in self._module_observers:
-            # FIXME: This check is here for testing purposes only.
-            # Normally, all given modules should be available once
-            # we start the installation.
-            if not observer.is_service_available:
-                log.error("Module %s is not available!", observer.service_name)
-                continue
-
-            service_name = observer.service_name
-            task_paths = observer.proxy.InstallWithTasks()
-
-            for object_path in task_paths:
-                log.debug("Getting task %s from module %s", object_path, service_name)
-                task_proxy = DBus.get_proxy(service_name, object_path)
-                tasks.append(task_proxy)
+        for object_path in task_paths:
+            log.debug("Getting task %s from module %s", object_path, service_name)
+            task_proxy = DBus.get_proxy(service_name, object_path)
+            tasks.append(task_proxy)
 
         return tasks
@@ -17,6 +17,7 @@
 # License and may only be used or replicated with the express permission of
 # Red Hat, Inc.
 #
+from pyanaconda.core.constants import TASK_RESOURCE_ALL
 from pyanaconda.modules.common.task import AbstractTask
 
 from pyanaconda.anaconda_loggers import get_module_logger
@@ -26,12 +27,24 @@ __all__ = ['SystemInstallationTask']
 
 
 class SystemInstallationTask(AbstractTask):
+    """The installation of the system.
+
+    The installation tasks are run in the given order, but a task
+    doesn't have to wait for the previous tasks if they don't claim
+    the same resources. Independent tasks of different modules can
+    run at the same time.
+    """
 
     def __init__(self, installation_tasks):
         super().__init__()
         self._subtasks = installation_tasks
-        self._current_subtask = None
-        self._subscriptions = []
+        self._dependencies = {}
+        self._running_subtasks = []
+        self._finished_subtasks = []
+        self._failed_subtasks = []
+        self._subscriptions = {}
+        self._current_steps = {}
+        self._scheduling = False
         self._total_steps = self._count_steps()
         self._finished_steps = 0
 
@@ -51,21 +64,61 @@ class SystemInstallationTask(AbstractTask):
     @property
     def is_running(self):
         """Is the installation running?"""
-        return bool(self._current_subtask and self._current_subtask.IsRunning)
+        return any(t.IsRunning for t in self._running_subtasks)
 
     def start(self):
         """Start the installation."""
         log.info("Installation has started.")
+        self._dependencies = self._resolve_dependencies(self._subtasks)
         self._task_started_callback()
         self._task_run_callback()
 
+    @staticmethod
+    def _resolve_dependencies(subtasks):
+        """Find out which tasks have to run before other tasks.
+
+        A task depends on all previous tasks that claim
+        any of its resources.
+
+        :param subtasks: a list of task proxies
+        :return: a dictionary of task indexes and sets of task indexes
+        """
+        resources = [set(t.Resources) for t in subtasks]
+        dependencies = {}
+
+        for i, claimed in enumerate(resources):
+            dependencies[i] = {
+                j for j in range(i) if TASK_RESOURCE_ALL in claimed
+                or TASK_RESOURCE_ALL in resources[j]
+                or claimed & resources[j]
+            }
+
+        return dependencies
+
     def _task_run_callback(self):
-        """Start the next installation task."""
-        self._disconnect_all()
+        """Start the installation tasks that can run."""
+        # A task can stop while we are starting other tasks.
+        # The loop below will take care of it.
+        if self._scheduling:
+            return
 
-        if not self._subtasks:
-            log.info("Installation is complete.")
-            self._task_stopped_callback()
+        self._scheduling = True
+
+        try:
+            while not self.check_cancel():
+                ready = self._get_ready_subtasks()
+
+                if not ready:
+                    break
+
+                subtask = ready[0]
+                self._running_subtasks.append(subtask)
+                self._connect(subtask)
+                subtask.Start()
+        finally:
+            self._scheduling = False
+
+        if self._running_subtasks:
             return
 
         if self.check_cancel():
@@ -73,59 +126,93 @@ class SystemInstallationTask(AbstractTask):
             self._task_stopped_callback()
             return
 
-        self._current_subtask = self._subtasks.pop(0)
-        self._connect(self._current_subtask)
-        self._current_subtask.Start()
-
-    def _connect(self, subtask):
-        """Connect to signals of the current task."""
-        s = subtask.Started.connect(self._subtask_started_callback)
-        self._subscriptions.append(s)
+        if len(self._finished_subtasks) == len(self._subtasks):
+            log.info("Installation is complete.")
+            self._task_stopped_callback()
 
-        s = subtask.Failed.connect(self._subtask_failed_callback)
-        self._subscriptions.append(s)
+    def _get_ready_subtasks(self):
+        """Return tasks that can be started.
 
-        s = subtask.Stopped.connect(self._subtask_stopped_callback)
-        self._subscriptions.append(s)
+        The task can be started if it wasn't started yet
+        and all its dependencies are finished.
+        """
+        finished = {self._get_index(t) for t in self._finished_subtasks}
+        started = finished | {self._get_index(t) for t in self._running_subtasks}
 
-        s = subtask.ProgressChanged.connect(self._subtask_progress_changed)
-        self._subscriptions.append(s)
+        return [
+            t for i, t in enumerate(self._subtasks)
+            if i not in started and self._dependencies[i] <= finished
+        ]
 
-    def _disconnect_all(self):
-        """Disconnect from all signals of the previous task."""
-        while self._subscriptions:
-            s = self._subscriptions.pop(0)
-            s.disconnect()
+    def _get_index(self, subtask):
+        """Return the index of the task."""
+        for i, t in enumerate(self._subtasks):
+            if t is subtask:
+                return i
 
-    def _subtask_started_callback(self):
-        log.info("'%s' has started.", self._current_subtask.Name)
+        raise ValueError("Unknown task.")
 
-    def _subtask_failed_callback(self):
-        log.info("'%s' has failed.", self._current_subtask.Name)
-        self._task_failed_callback()
-        self.cancel()
+    def _connect(self, subtask):
+        """Connect to signals of the task."""
+        self._subscriptions[id(subtask)] = [
+            subtask.Started.connect(
+                lambda: self._subtask_started_callback(subtask)
+            ),
+            subtask.Failed.connect(
+                lambda: self._subtask_failed_callback(subtask)
+            ),
+            subtask.Stopped.connect(
+                lambda: self._subtask_stopped_callback(subtask)
+            ),
+            subtask.ProgressChanged.connect(
+                lambda step, msg: self._subtask_progress_changed(subtask, step, msg)
+            ),
+        ]
+
+    def _disconnect(self, subtask):
+        """Disconnect from all signals of the task."""
+        for s in self._subscriptions.pop(id(subtask), []):
+            s.disconnect()
 
-    def _subtask_stopped_callback(self):
-        log.info("'%s' has stopped.", self._current_subtask.Name)
-        self._finished_steps += self._current_subtask.Steps
+    def _subtask_started_callback(self, subtask):
+        log.info("'%s' has started.", subtask.Name)
+
+    def _subtask_failed_callback(self, subtask):
+        log.info("'%s' has failed.", subtask.Name)
+        self._failed_subtasks.append(subtask)
+
+        # Report only the first failure.
+        if len(self._failed_subtasks) == 1:
+            self._task_failed_callback()
+            self.cancel()
+
+    def _subtask_stopped_callback(self, subtask):
+        log.info("'%s' has stopped.", subtask.Name)
+        self._disconnect(subtask)
+        self._running_subtasks.remove(subtask)
+        self._finished_subtasks.append(subtask)
+        self._current_steps.pop(id(subtask), None)
+        self._finished_steps += subtask.Steps
         self._task_run_callback()
 
-    def _subtask_progress_changed(self, step, msg):
-        log.debug("%s (%s/%s)", msg, step, self.steps)
-        self.report_progress(msg, step_number=self._finished_steps + step)
+    def _subtask_progress_changed(self, subtask, step, msg):
+        self._current_steps[id(subtask)] = step
+        step_number = self._finished_steps + sum(self._current_steps.values())
+        log.debug("%s (%s/%s)", msg, step_number, self.steps)
+        self.report_progress(msg, step_number=step_number)
 
     def cancel(self):
         """Cancel the installation."""
         super().cancel()
 
-        if self._current_subtask:
-            self._current_subtask.Cancel()
+        for subtask in self._running_subtasks:
+            subtask.Cancel()
 
     def finish(self):
         """Finish the installation.
 
         If the installation failed, we should raise an error
-        from the last running installation task.
+        from the first failed installation task.
         """
-        if self._current_subtask:
-            self._current_subtask.Finish()
+        for subtask in self._failed_subtasks + self._finished_subtasks:
+            subtask.Finish()
@@ -16,6 +16,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from pyanaconda.core.constants import KICKSTART_GENERATE_WORKERS
+from pyanaconda.dbus import DBus
 from pyanaconda.modules.common.errors.kickstart import SplitKickstartSectionParsingError, \
     SplitKickstartMissingIncludeError
 from pyanaconda.modules.boss.kickstart_manager.parser import SplitKickstartParser,\
@@ -36,6 +41,8 @@ class KickstartManager(object):
         self._kickstart_path = None
         self._elements = None
         self._module_observers = []
+        self._kickstarts = {}
+        self._subscriptions = {}
 
     @property
     def module_observers(self):
@@ -50,6 +57,7 @@ class KickstartManager(object):
         :type modules: list(DBusObjectObserver)
         """
         self._module_observers = modules
+        self._kickstarts.clear()
 
     @property
     def elements(self):
@@ -84,6 +92,9 @@ class KickstartManager(object):
         """
         errors = []
 
+        # The modules will change.
+        self._kickstarts.clear()
+
         for observer in self._module_observers:
 
             if not observer.is_service_available:
@@ -119,6 +130,77 @@ class KickstartManager(object):
 
         return errors
 
-    def collect(self):
-        """Collect kickstarts from configured modules."""
-        pass
+    def generate_kickstarts(self, temporary=False):
+        """Generate kickstarts of the available modules.
+
+        The modules are asked at once. The kickstart of a module
+        is cached until the module reports a change of its state.
+
+        :param temporary: generate temporary kickstarts
+        :return: a dictionary of service names and kickstarts
+        """
+        observers = [o for o in self._module_observers if o.is_service_available]
+        missing = [o for o in observers if (o.service_name, temporary) not in self._kickstarts]
+
+        if missing:
+            log.debug("Generating kickstarts of %s.", ", ".join(map(str, missing)))
+
+            for observer in missing:
+                self._watch_module(observer.service_name)
+
+            generate = partial(self._generate_module_kickstart, temporary=temporary)
+
+            with ThreadPoolExecutor(max_workers=KICKSTART_GENERATE_WORKERS) as executor:
+                for observer, kickstart in zip(missing, executor.map(generate, missing)):
+                    self._kickstarts[(observer.service_name, temporary)] = kickstart
+
+        return {o.service_name: self._kickstarts[(o.service_name, temporary)] for o in observers}
+
+    @staticmethod
+    def _generate_module_kickstart(observer, temporary):
+        """Generate a kickstart of one module.
+
+        :param observer: a module observer
+        :param temporary: generate a temporary kickstart
+        :return: a kickstart string
+        """
+        if temporary:
+            return observer.proxy.GenerateTemporaryKickstart()
+
+        return observer.proxy.GenerateKickstart()
+
+    def _watch_module(self, service_name):
+        """Invalidate the cached kickstarts when the module changes.
+
+        Every change of the module state is announced with the
+        PropertiesChanged signal of one of the module objects.
+        A new owner of the service name is a new module.
+
+        :param service_name: a DBus name of the module
+        """
+        if service_name in self._subscriptions:
+            return
+
+        connection = DBus.connection
+        callback = partial(self._module_changed_callback, service_name)
+
+        self._subscriptions[service_name] = [
+            connection.subscribe(
+                sender=service_name,
+                iface="org.freedesktop.DBus.Properties",
+                signal="PropertiesChanged",
+                signal_fired=callback
+            ),
+            connection.subscribe(
+                sender="org.freedesktop.DBus",
+                iface="org.freedesktop.DBus",
+                signal="NameOwnerChanged",
+                arg0=service_name,
+                signal_fired=callback
+            )
+        ]
+
+    def _module_changed_callback(self, service_name, *args):
+        """Drop the cached kickstarts of the module."""
+        for key in [k for k in self._kickstarts if k[0] == service_name]:
+            del self._kickstarts[key]
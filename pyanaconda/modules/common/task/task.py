@@ -23,7 +23,7 @@
 import traceback
 from abc import abstractmethod
 
-from pyanaconda.core.constants import THREAD_DBUS_TASK
+from pyanaconda.core.constants import THREAD_DBUS_TASK, TASK_RESOURCE_ALL
 from pyanaconda.modules.common.task.cancellable import Cancellable
 from pyanaconda.modules.common.task.progress import ProgressReporter
 from pyanaconda.modules.common.task.runnable import Runnable
@@ -49,6 +49,20 @@ class AbstractTask(Runnable, Cancellable, ProgressReporter):
         """
         return ""
 
+    @property
+    def resources(self):
+        """Resources claimed by this task.
+
+        Tasks that claim the same resource are never run at
+        the same time. By default, the task claims everything,
+        so it doesn't run with other tasks.
+
+        For example: ["target-rpmdb", "target-etc"]
+
+        :returns: a list of resource names
+        """
+        return [TASK_RESOURCE_ALL]
+
 
 class Task(AbstractTask):
     """Abstract class for running a long-term task in a thread."""
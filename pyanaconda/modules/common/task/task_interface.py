@@ -86,6 +86,15 @@ class TaskInterface(InterfaceTemplate):
         """Get total number of steps for this task."""
         return self.implementation.steps
 
+    @property
+    def Resources(self) -> List[Str]:
+        """Get names of resources claimed by this task.
+
+        Installation tasks that claim the same resource
+        are not run at the same time.
+        """
+        return self.implementation.resources
+
     @property
     def IsRunning(self) -> Bool:
         """Return True if this Task is running already."""
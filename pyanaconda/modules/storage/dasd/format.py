@@ -17,10 +17,14 @@
 # License and may only be used or replicated with the express permission of
 # Red Hat, Inc.
 #
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
 import gi
 gi.require_version("BlockDev", "2.0")
 from gi.repository import BlockDev as blockdev
 
+from pyanaconda.core.constants import THREAD_DASDFMT, DASD_FORMAT_WORKERS
 from pyanaconda.modules.common.task import Task
 from pyanaconda.anaconda_loggers import get_module_logger
 
@@ -30,27 +34,55 @@ log = get_module_logger(__name__)
 class DASDFormatTask(Task):
     """A task for formatting DASDs"""
 
-    def __init__(self, dasds):
+    def __init__(self, dasds, max_workers=DASD_FORMAT_WORKERS):
         """Create a new task.
 
+        The DASDs are independent, so more of them are formatted at once.
+
         :param dasds: a list of names of DASDs to format
+        :param max_workers: how many DASDs can be formatted at once
         """
         super().__init__()
         self._dasds = dasds
+        self._max_workers = max_workers
+        self._formatted = 0
+        self._lock = Lock()
 
     @property
     def name(self):
         return "Formatting DASDs"
 
+    @property
+    def steps(self):
+        """One step for the start and one step for every DASD."""
+        return len(self._dasds) + 1
+
     def run(self):
-        for disk_name in self._dasds:
-            self._do_format(disk_name)
+        if not self._dasds:
+            return
+
+        workers = max(1, min(self._max_workers, len(self._dasds)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=THREAD_DASDFMT) as executor:
+            # Wait for all DASDs. The errors are handled in _do_format.
+            list(executor.map(self._do_format, self._dasds))
 
     def _do_format(self, disk_name):
         """Format the specified DASD disk."""
         try:
             self.report_progress("Formatting {}".format(disk_name))
-            blockdev.s390.dasd_format(disk_name)
+            self._format_dasd(disk_name)
         except blockdev.S390Error as err:
-            self.report_progress("Failed formatting {}".format(disk_name))
+            self.report_progress("Failed formatting {}".format(disk_name), step_size=1)
             log.error(err)
+        else:
+            with self._lock:
+                self._formatted += 1
+                formatted = self._formatted
+
+            self.report_progress("Formatted {} ({} of {})".format(
+                disk_name, formatted, len(self._dasds)), step_size=1
+            )
+
+    def _format_dasd(self, disk_name):
+        """Format the DASD with the formatting backend."""
+        blockdev.s390.dasd_format(disk_name)
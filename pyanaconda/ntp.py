@@ -21,16 +21,24 @@ Module facilitating the work with NTP servers and NTP daemon's configuration
 
 """
 
+import asyncio
 import re
 import os
 import tempfile
 import shutil
 import ntplib
 import socket
+import threading
+import time
+from concurrent.futures import Future
 
 from pyanaconda import isys
 from pyanaconda.threading import threadMgr, AnacondaThread
-from pyanaconda.core.constants import THREAD_SYNC_TIME_BASENAME
+from pyanaconda.core.constants import THREAD_SYNC_TIME_BASENAME, THREAD_NTP_PROBE, \
+    NTP_PROBE_TIMEOUT, NTP_PROBE_CACHE_TTL, NTP_PROBE_FAILURE_CACHE_TTL
+
+from pyanaconda.anaconda_loggers import get_module_logger
+log = get_module_logger(__name__)
 
 NTP_CONFIG_FILE = "/etc/chrony.conf"
 
@@ -45,32 +53,212 @@ class NTPconfigError(Exception):
     """Exception class for NTP related problems"""
     pass
 
+class _NTPClientProtocol(asyncio.DatagramProtocol):
+    """A protocol sending one NTP request and waiting for the response."""
+
+    def __init__(self, loop):
+        self.response = loop.create_future()
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+        packet = ntplib.NTPPacket(mode=3, version=2,
+                                  tx_timestamp=ntplib.system_to_ntp_time(time.time()))
+        transport.sendto(packet.to_data())
+
+    def datagram_received(self, data, addr):
+        if not self.response.done():
+            self.response.set_result(data)
+
+    def error_received(self, exc):
+        if not self.response.done():
+            self.response.set_exception(exc)
+
+    def connection_lost(self, exc):
+        if not self.response.done():
+            self.response.set_exception(exc or ConnectionError("Connection lost"))
+
+
+class NTPProbeService(object):
+    """A service for checking NTP servers.
+
+    All queries run concurrently in one event loop in a separate thread.
+    Queries of the same server that are in progress are shared and the
+    results are cached for a limited time, so the servers are not queried
+    again every time the dialogs or spokes check them.
+    """
+
+    def __init__(self, timeout=NTP_PROBE_TIMEOUT, ttl=NTP_PROBE_CACHE_TTL,
+                 failure_ttl=NTP_PROBE_FAILURE_CACHE_TTL, port=123):
+        """Create a new service.
+
+        :param timeout: a timeout of one query in seconds
+        :param ttl: for how long a successful result is cached in seconds
+        :param failure_ttl: for how long a failed result is cached in seconds
+        :param port: a port of the NTP servers
+        """
+        self._timeout = timeout
+        self._ttl = ttl
+        self._failure_ttl = failure_ttl
+        self._port = port
+
+        self._lock = threading.Lock()
+        self._loop = None
+        self._cache = {}
+        self._pending = {}
+
+    def _get_loop(self):
+        """Get the event loop. Start it if it is not running yet."""
+        with self._lock:
+            if not self._loop:
+                self._loop = asyncio.new_event_loop()
+                thread = threading.Thread(name=THREAD_NTP_PROBE,
+                                          target=self._loop.run_forever)
+                thread.daemon = True
+                thread.start()
+
+            return self._loop
+
+    def query(self, server, use_cache=True):
+        """Query the NTP server.
+
+        :param server: hostname or IP address of an NTP server
+        :param use_cache: can be the result taken from the cache?
+        :return: a future with an instance of ntplib.NTPStats or None
+        :rtype: concurrent.futures.Future
+        """
+        with self._lock:
+            if use_cache and server in self._cache:
+                timestamp, stats = self._cache[server]
+                ttl = self._ttl if stats else self._failure_ttl
+
+                if time.monotonic() - timestamp < ttl:
+                    future = Future()
+                    future.set_result(stats)
+                    return future
+
+            if server in self._pending:
+                return self._pending[server]
+
+        loop = self._get_loop()
+
+        with self._lock:
+            # Check again, the lock was released.
+            if server in self._pending:
+                return self._pending[server]
+
+            future = asyncio.run_coroutine_threadsafe(self._request(server), loop)
+            self._pending[server] = future
+
+        # The callback can run immediately in this thread if the future
+        # is already done, so it has to be added without the lock.
+        future.add_done_callback(lambda f: self._finish(server, f))
+        return future
+
+    def _finish(self, server, future):
+        """Cache the result of the finished query."""
+        with self._lock:
+            if self._pending.get(server) is future:
+                del self._pending[server]
+
+            if not future.cancelled() and not future.exception():
+                self._cache[server] = (time.monotonic(), future.result())
+
+    async def _request(self, server):
+        """Send the NTP request and parse the response."""
+        loop = asyncio.get_event_loop()
+        transport = None
+
+        try:
+            infos = await loop.getaddrinfo(server, self._port, type=socket.SOCK_DGRAM)
+            family, _type, _proto, _name, address = infos[0]
+
+            transport, protocol = await loop.create_datagram_endpoint(
+                lambda: _NTPClientProtocol(loop),
+                family=family,
+                remote_addr=address
+            )
+
+            data = await asyncio.wait_for(protocol.response, self._timeout)
+            stats = ntplib.NTPStats()
+            stats.from_data(data)
+            stats.dest_timestamp = ntplib.system_to_ntp_time(time.time())
+            return stats
+
+        # address related error
+        except socket.gaierror as e:
+            log.debug("NTP server %s can't be resolved: %s", server, e)
+        # socket related error
+        # (including "Network is unreachable")
+        except OSError as e:
+            log.debug("NTP server %s can't be reached: %s", server, e)
+        except asyncio.TimeoutError:
+            log.debug("NTP server %s didn't respond in time.", server)
+        except ntplib.NTPException as e:
+            log.debug("NTP server %s sent an invalid response: %s", server, e)
+        finally:
+            if transport:
+                transport.close()
+
+        return None
+
+    def check_server(self, server, callback=None):
+        """Check if the server is working.
+
+        :param server: hostname or IP address of an NTP server
+        :param callback: a function called with the server and the result
+                         in the thread of the service
+        :return: a future with True if the server is working, otherwise False
+        :rtype: concurrent.futures.Future
+        """
+        result = Future()
+
+        def on_done(future):
+            working = not future.cancelled() and not future.exception() \
+                and future.result() is not None
+            result.set_result(working)
+
+            if callback:
+                callback(server, working)
+
+        self.query(server).add_done_callback(on_done)
+        return result
+
+    def check_servers(self, servers):
+        """Check if the servers are working.
+
+        The servers are checked at once. The method blocks until
+        all the servers are checked.
+
+        :param servers: a list of hostnames or IP addresses
+        :return: a dictionary of servers and results
+        """
+        futures = {server: self.check_server(server) for server in servers}
+        return {server: future.result() for server, future in futures.items()}
+
+    def clear_cache(self):
+        """Forget all cached results."""
+        with self._lock:
+            self._cache.clear()
+
+
+# The service shared by the whole installer.
+ntp_probe_service = NTPProbeService()
+
+
 def ntp_server_working(server):
     """
     Tries to do an NTP request to the $server (timeout may take some time).
 
+    The result is taken from the shared NTP probe service.
+
     :param server: hostname or IP address of an NTP server
     :type server: string
     :return: True if the given server is reachable and working, False otherwise
     :rtype: bool
 
     """
-
-    client = ntplib.NTPClient()
-
-    try:
-        client.request(server)
-    except ntplib.NTPException:
-        return False
-    # address related error
-    except socket.gaierror:
-        return False
-    # socket related error
-    # (including "Network is unreachable")
-    except socket.error:
-        return False
-
-    return True
+    return ntp_probe_service.check_server(server).result()
 
 def pools_servers_to_internal(pools, servers):
     ret = []
@@ -211,14 +399,13 @@ def one_time_sync(server, callback=None):
 
     """
 
-    client = ntplib.NTPClient()
-    try:
-        results = client.request(server)
+    # Always ask for the current time.
+    results = ntp_probe_service.query(server, use_cache=False).result()
+
+    if results:
         isys.set_system_time(int(results.tx_time))
         success = True
-    except ntplib.NTPException:
-        success = False
-    except socket.gaierror:
+    else:
         success = False
 
     if callback is not None:
@@ -52,6 +52,7 @@ from pyanaconda.core.util import ProxyString, ProxyStringError
 from pyanaconda.threading import threadMgr, AnacondaThread
 from pyanaconda.core.regexes import VERSION_DIGITS
 from pyanaconda.payload.install_tree_metadata import InstallTreeMetadata
+from pyanaconda.payload.rpmdb import rpm_database
 
 from pykickstart.parser import Group
 
@@ -301,6 +302,10 @@ class Payload(object):
 
         self._install_tree_metadata = None
 
+        # Loaded install tree metadata by URLs. It is kept
+        # only for one setup of the payload.
+        self._install_tree_metadata_cache = {}
+
         self._first_payload_reset = True
 
         # A list of verbose error strings from the subclass
@@ -319,11 +324,14 @@ class Payload(object):
         """Do any payload-specific setup."""
         self.storage = storage
         self.verbose_errors = []
+        self._install_tree_metadata_cache = {}
 
     def unsetup(self):
         """Invalidate a previously setup payload."""
         self.storage = None
         self._install_tree_metadata = None
+        self._install_tree_metadata_cache = {}
+        rpm_database.invalidate()
 
     def postSetup(self):
         """Run specific payload post-configuration tasks on the end of
@@ -630,6 +638,11 @@ class Payload(object):
         if not url:
             return
 
+        if url in self._install_tree_metadata_cache:
+            log.debug("using cached treeinfo from %s", url)
+            self._install_tree_metadata = self._install_tree_metadata_cache[url]
+            return
+
         if hasattr(self.data.method, "proxy"):
             proxy_url = self.data.method.proxy
         else:
@@ -664,6 +677,8 @@ class Payload(object):
             log.warning("Install tree metadata can't be loaded!")
             self._install_tree_metadata = None
 
+        self._install_tree_metadata_cache[url] = self._install_tree_metadata
+
     def _getReleaseVersion(self, url):
         """Return the release version of the tree at the specified URL."""
         try:
@@ -865,15 +880,12 @@ class Payload(object):
             return
 
         try:
-            import rpm
+            has_graphical_login = rpm_database.count("provides", 'service(graphical-login)')
         except ImportError:
             log.info("failed to import rpm -- not adjusting default runlevel")
         else:
-            ts = rpm.TransactionSet(util.getSysroot())
-
             # XXX one day this might need to account for anaconda's display mode
-            if ts.dbMatch("provides", 'service(graphical-login)').count() and \
-               not flags.usevnc:
+            if has_graphical_login and not flags.usevnc:
                 # We only manipulate the ksdata.  The symlink is made later
                 # during the config write out.
                 services_proxy.SetDefaultTarget(GRAPHICAL_TARGET)
@@ -883,18 +895,13 @@ class Payload(object):
     def dracutSetupArgs(self):
         args = []
         try:
-            import rpm
-        except ImportError:
-            pass
-        else:
-            util.resetRpmDb()
-            ts = rpm.TransactionSet(util.getSysroot())
-
             # Only add "rhgb quiet" on non-s390, non-serial installs
             if util.isConsoleOnVirtualTerminal() and \
-               (ts.dbMatch('provides', 'rhgb').count() or \
-                ts.dbMatch('provides', 'plymouth').count()):
+               (rpm_database.count('provides', 'rhgb') or \
+                rpm_database.count('provides', 'plymouth')):
                 args.extend(["rhgb", "quiet"])
+        except ImportError:
+            pass
 
         return args
 
@@ -1035,20 +1042,14 @@ class PackagePayload(Payload):
 
         # If a PackagePayload is in use, rpm needs to be available
         try:
-            import rpm
+            filenames = rpm_database.get_filenames('providename', 'kernel')
         except ImportError:
             raise PayloadError("failed to import rpm-python, cannot determine kernel versions")
 
-        files = []
-
-        ts = rpm.TransactionSet(util.getSysroot())
-        mi = ts.dbMatch('providename', 'kernel')
-        for hdr in mi:
-            unicode_fnames = (f.decode("utf-8") for f in hdr.filenames)
-            # Find all /boot/vmlinuz- files and strip off vmlinuz-
-            files.extend((f.split("/")[-1][8:] for f in unicode_fnames
-                if fnmatch(f, "/boot/vmlinuz-*") or
-                   fnmatch(f, "/boot/efi/EFI/%s/vmlinuz-*" % conf.bootloader.efi_dir)))
+        # Find all /boot/vmlinuz- files and strip off vmlinuz-
+        files = [f.split("/")[-1][8:] for f in filenames
+                 if fnmatch(f, "/boot/vmlinuz-*") or
+                 fnmatch(f, "/boot/efi/EFI/%s/vmlinuz-*" % conf.bootloader.efi_dir)]
 
         return sorted(files, key=functools.cmp_to_key(versionCmp))
 
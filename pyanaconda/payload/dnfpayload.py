@@ -35,6 +35,7 @@ from pyanaconda.kickstart import RepoData
 import pyanaconda.errors as errors
 import pyanaconda.localization
 import pyanaconda.payload as payload
+from pyanaconda.payload.rpmdb import rpm_database
 
 import configparser
 import collections
@@ -45,6 +46,7 @@ import shutil
 import sys
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from requests.exceptions import RequestException
 
 
@@ -1052,6 +1054,8 @@ class DNFPayload(payload.PackagePayload):
             (token, msg) = queue_instance.get()
 
         process.join()
+        # The transaction has changed the RPM database.
+        rpm_database.invalidate()
         # Don't close the mother base here, because we still need it.
         if os.path.exists(self._download_location):
             log.info("Cleaning up downloaded packages: %s", self._download_location)
@@ -1074,15 +1078,25 @@ class DNFPayload(payload.PackagePayload):
             return super().isRepoEnabled(repo_id)
 
     def verifyAvailableRepositories(self):
-        """Verify availability of repositories."""
+        """Verify availability of repositories.
+
+        The repositories are verified at once.
+        """
         if not self._repoMD_list:
             return False
 
-        for repo in self._repoMD_list:
-            if not repo.verify_repoMD():
+        workers = min(len(self._repoMD_list), constants.REPOMD_CHECK_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers,
+                                thread_name_prefix=constants.THREAD_REPOMD_CHECK) as executor:
+            results = [(repo, executor.submit(repo.verify_repoMD)) for repo in self._repoMD_list]
+
+        available = True
+        for repo, future in results:
+            if not future.result():
                 log.debug("Can't reach repo %s", repo.id)
-                return False
-        return True
+                available = False
+
+        return available
 
     def languageGroups(self):
         localization_proxy = LOCALIZATION.get_proxy()
@@ -1340,11 +1354,20 @@ class DNFPayload(payload.PackagePayload):
         Save repomd hash to test if the repositories can be reached.
         """
         super().postSetup()
-        self._repoMD_list = []
-        for repo in self._base.repos.iter_enabled():
-            repoMD = RepoMDMetaHash(self, repo)
-            repoMD.store_repoMD_hash()
-            self._repoMD_list.append(repoMD)
+        self._repoMD_list = [RepoMDMetaHash(self, repo)
+                             for repo in self._base.repos.iter_enabled()]
+
+        if not self._repoMD_list:
+            return
+
+        workers = min(len(self._repoMD_list), constants.REPOMD_CHECK_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers,
+                                thread_name_prefix=constants.THREAD_REPOMD_CHECK) as executor:
+            futures = [executor.submit(repoMD.store_repoMD_hash)
+                       for repoMD in self._repoMD_list]
+
+        for future in futures:
+            future.result()
 
     def postInstall(self):
         """Perform post-installation tasks."""
@@ -1378,12 +1401,20 @@ class DNFPayload(payload.PackagePayload):
 class RepoMDMetaHash(object):
     """Class that holds hash of a repomd.xml file content from a repository.
     This class can test availability of this repository by comparing hashes.
+
+    The base URLs of the repository are probed at once with a timeout. The
+    validators of the stored repomd.xml file are sent with the requests, so
+    an unchanged file doesn't have to be downloaded again. A requests session
+    is not thread-safe, so every request uses its own session.
     """
     def __init__(self, dnf_payload, repo):
         self._repoId = repo.id
         self._method = dnf_payload.data.method
         self._urls = repo.baseurl
         self._repomd_hash = ""
+        self._repomd_url = None
+        self._validators = {}
+        self._proxies = self._get_proxies(self._method)
 
     @property
     def repoMD_hash(self):
@@ -1397,25 +1428,53 @@ class RepoMDMetaHash(object):
 
     def store_repoMD_hash(self):
         """Download and store hash of the repomd.xml file content."""
-        repomd = self._download_repoMD(self._method)
-        self._repomd_hash = self._calculate_hash(repomd)
+        url, response = self._download_repoMD()
+        self._repomd_url = url
+        self._validators = self._get_validators(response)
+        self._repomd_hash = self._calculate_hash(response.text if response else "")
 
     def verify_repoMD(self):
-        """Download and compare with stored repomd.xml file."""
-        new_repomd = self._download_repoMD(self._method)
-        new_repomd_hash = self._calculate_hash(new_repomd)
-        return new_repomd_hash == self._repomd_hash
+        """Download and compare with stored repomd.xml file.
+
+        The repository is available if any of its URLs returns the stored
+        repomd.xml file or reports that it hasn't been modified.
+        """
+        urls = self._urls or []
+
+        if not urls:
+            return self._calculate_hash("") == self._repomd_hash
+
+        executor = ThreadPoolExecutor(max_workers=min(len(urls), constants.REPOMD_CHECK_WORKERS),
+                                      thread_name_prefix=constants.THREAD_REPOMD_CHECK)
+        try:
+            futures = [executor.submit(self._request_repoMD, url) for url in urls]
+
+            for future in as_completed(futures):
+                response = future.result()
+
+                if response is None:
+                    continue
+
+                if response.status_code == 304:
+                    log.debug("The repomd.xml of %s has not been modified.", self.id)
+                    return True
+
+                if self._calculate_hash(response.text) == self._repomd_hash:
+                    return True
+
+            # None of the URLs works, compare with the hash of an empty file.
+            return self._calculate_hash("") == self._repomd_hash
+        finally:
+            # Don't wait for the unresponsive URLs.
+            executor.shutdown(wait=False)
 
     def _calculate_hash(self, data):
         m = hashlib.sha256()
         m.update(data.encode('ascii', 'backslashreplace'))
         return m.digest()
 
-    def _download_repoMD(self, method):
+    def _get_proxies(self, method):
         proxies = {}
-        repomd = ""
-        headers = {"user-agent": USER_AGENT}
-        sslverify = not flags.noverifyssl
 
         if hasattr(method, "proxy"):
             proxy_url = method.proxy
@@ -1427,20 +1486,73 @@ class RepoMDMetaHash(object):
                 log.info("Failed to parse proxy for test if repo available %s: %s",
                          proxy_url, e)
 
-        session = util.requests_session()
+        return proxies
 
-        # Test all urls for this repo. If any of these is working it is enough.
-        for url in self._urls:
-            try:
+    def _get_validators(self, response):
+        """Return headers of a conditional request for the same file."""
+        validators = {}
+
+        if response is None:
+            return validators
+
+        if response.headers.get("ETag"):
+            validators["If-None-Match"] = response.headers["ETag"]
+
+        if response.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = response.headers["Last-Modified"]
+
+        return validators
+
+    def _request_repoMD(self, url):
+        """Request the repomd.xml file from the given URL.
+
+        The request is conditional if the stored file was downloaded from
+        this URL.
+
+        :return: a response with the status code 200 or 304 or None
+        """
+        headers = {"user-agent": USER_AGENT}
+        sslverify = not flags.noverifyssl
+
+        if url == self._repomd_url:
+            headers.update(self._validators)
+
+        try:
+            with util.requests_session() as session:
                 result = session.get("%s/repodata/repomd.xml" % url, headers=headers,
-                                     proxies=proxies, verify=sslverify)
-                if result.ok:
-                    repomd = result.text
-                    break
-                else:
-                    log.debug("Server returned %i code when downloading repomd", result.status_code)
-                    continue
-            except RequestException as e:
-                log.debug("Can't download new repomd.xml from %s with proxy: %s. Error: %s", url, proxies, e)
+                                     proxies=self._proxies, verify=sslverify,
+                                     timeout=constants.REPOMD_CHECK_TIMEOUT)
+            if result.ok or result.status_code == 304:
+                return result
+            else:
+                log.debug("Server returned %i code when downloading repomd", result.status_code)
+        except RequestException as e:
+            log.debug("Can't download new repomd.xml from %s with proxy: %s. Error: %s",
+                      url, self._proxies, e)
+
+        return None
+
+    def _download_repoMD(self):
+        """Download the repomd.xml file.
+
+        Test all urls for this repo. If any of these is working it is enough.
+        The first working URL is used.
+
+        :return: a tuple of the URL and the response or (None, None)
+        """
+        urls = self._urls or []
+
+        if not urls:
+            return None, None
+
+        with ThreadPoolExecutor(max_workers=min(len(urls), constants.REPOMD_CHECK_WORKERS),
+                                thread_name_prefix=constants.THREAD_REPOMD_CHECK) as executor:
+            responses = [(url, executor.submit(self._request_repoMD, url)) for url in urls]
+
+        for url, future in responses:
+            response = future.result()
+
+            if response is not None and response.ok:
+                return url, response
 
-        return repomd
+        return None, None
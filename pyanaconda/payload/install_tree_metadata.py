@@ -20,6 +20,7 @@
 import time
 import requests
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from productmd.treeinfo import TreeInfo
 from pyanaconda.core import util, constants
@@ -29,6 +30,9 @@ log = get_packaging_logger()
 
 MAX_TREEINFO_DOWNLOAD_RETRIES = 6
 
+# Names of the treeinfo files in the order of preference.
+TREEINFO_FILE_NAMES = (".treeinfo", "treeinfo")
+
 
 class InstallTreeMetadata(object):
 
@@ -56,6 +60,18 @@ class InstallTreeMetadata(object):
 
         return True
 
+    def load_text(self, text, root_path=""):
+        """Loads installation tree metadata from the content of the .treeinfo file.
+
+        :param text: Content of the .treeinfo file.
+        :type text: str
+        :param root_path: Path to the installation root.
+        :type root_path: str
+        """
+        self._clear()
+        self._tree_info.loads(text)
+        self._path = root_path
+
     def load_url(self, url, proxies, sslverify, headers):
         """Load URL link.
 
@@ -63,6 +79,10 @@ class InstallTreeMetadata(object):
 
         Parameters here are passed to requests object so make them compatible with requests.
 
+        The .treeinfo and treeinfo files are requested at once. The .treeinfo
+        file is used if both of them are available. Every request uses its
+        own requests session, because a session is not thread-safe.
+
         :param url: URL poiting to the installation tree.
         :param proxies: Proxy used for the request.
         :param sslverify: sslverify object which will be used in request.
@@ -78,44 +98,33 @@ class InstallTreeMetadata(object):
 
         xdelay = util.xprogressive_delay()
         response = None
-        ret_code = [None, None]
-        session = util.requests_session()
-
-        for retry_count in range(0, MAX_TREEINFO_DOWNLOAD_RETRIES + 1):
-            if retry_count > 0:
-                time.sleep(next(xdelay))
-            # Downloading .treeinfo
-            log.info("Trying to download '.treeinfo'")
-            (response, ret_code[0]) = self._download_treeinfo_file(session, url, ".treeinfo",
-                                                                   headers, proxies, sslverify)
-            if response:
-                break
-            # Downloading treeinfo
-            log.info("Trying to download 'treeinfo'")
-            (response, ret_code[1]) = self._download_treeinfo_file(session, url, "treeinfo",
-                                                                   headers, proxies, sslverify)
-            if response:
-                break
-
-            # The [.]treeinfo wasn't downloaded. Try it again if [.]treeinfo
-            # is on the server.
-            #
-            # Server returned HTTP 404 code -> no need to try again
-            if (ret_code[0] is not None and ret_code[0] == 404
-                    and ret_code[1] is not None and ret_code[1] == 404):
-                response = None
-                log.error("Got HTTP 404 Error when downloading [.]treeinfo files")
-                break
-            if retry_count < MAX_TREEINFO_DOWNLOAD_RETRIES:
-                # retry
-                log.info("Retrying repo info download for %s, retrying (%d/%d)",
-                         url, retry_count + 1, MAX_TREEINFO_DOWNLOAD_RETRIES)
-            else:
-                # run out of retries
-                err_msg = ("Repo info download for %s failed after %d retries" %
-                           (url, retry_count))
-                log.error(err_msg)
-                raise IOError("Can't get .treeinfo file from the url {}".format(url))
+
+        with ThreadPoolExecutor(max_workers=len(TREEINFO_FILE_NAMES),
+                                thread_name_prefix=constants.THREAD_TREEINFO_DOWNLOAD) as executor:
+            for retry_count in range(0, MAX_TREEINFO_DOWNLOAD_RETRIES + 1):
+                if retry_count > 0:
+                    time.sleep(next(xdelay))
+
+                # Downloading .treeinfo and treeinfo
+                log.info("Trying to download '.treeinfo' and 'treeinfo'")
+                futures = [executor.submit(self._download_treeinfo_file, url, name,
+                                           headers, proxies, sslverify)
+                           for name in TREEINFO_FILE_NAMES]
+                results = [future.result() for future in futures]
+                ret_code = [code for _response, code in results]
+
+                # Prefer the .treeinfo file.
+                response = next((r for r, _code in results if r), None)
+
+                for r, _code in results:
+                    if r and r is not response:
+                        r.close()
+
+                if response:
+                    break
+
+                if not self._should_retry(url, ret_code, retry_count):
+                    break
 
         if response:
             # get the treeinfo contents
@@ -130,10 +139,37 @@ class InstallTreeMetadata(object):
         return False
 
     @staticmethod
-    def _download_treeinfo_file(session, url, file_name, headers, proxies, verify):
+    def _should_retry(url, ret_code, retry_count):
+        """Should the download of the treeinfo files be tried again?
+
+        :raise: IOError if there are no retries left
+        """
+        # The [.]treeinfo wasn't downloaded. Try it again if [.]treeinfo
+        # is on the server.
+        #
+        # Server returned HTTP 404 code -> no need to try again
+        if ret_code[0] == 404 and ret_code[1] == 404:
+            log.error("Got HTTP 404 Error when downloading [.]treeinfo files")
+            return False
+
+        if retry_count < MAX_TREEINFO_DOWNLOAD_RETRIES:
+            # retry
+            log.info("Retrying repo info download for %s, retrying (%d/%d)",
+                     url, retry_count + 1, MAX_TREEINFO_DOWNLOAD_RETRIES)
+            return True
+
+        # run out of retries
+        err_msg = ("Repo info download for %s failed after %d retries" %
+                   (url, retry_count))
+        log.error(err_msg)
+        raise IOError("Can't get .treeinfo file from the url {}".format(url))
+
+    @staticmethod
+    def _download_treeinfo_file(url, file_name, headers, proxies, verify):
         try:
-            result = session.get("%s/%s" % (url, file_name), headers=headers,
-                                 proxies=proxies, verify=verify)
+            with util.requests_session() as session:
+                result = session.get("%s/%s" % (url, file_name), headers=headers,
+                                     proxies=proxies, verify=verify)
             # Server returned HTTP 4XX or 5XX codes
             if 400 <= result.status_code < 600:
                 log.info("Server returned %i code", result.status_code)
@@ -66,6 +66,7 @@ class LiveImagePayload(ImagePayload):
         self.pct = 0
         self.pct_lock = None
         self.source_size = 1
+        self._space_required = None
 
         self._kernelVersionList = []
 
@@ -91,6 +92,10 @@ class LiveImagePayload(ImagePayload):
         source = os.statvfs(INSTALL_TREE)
         self.source_size = source.f_frsize * (source.f_blocks - source.f_bfree)
 
+        # The used space of the image is known without walking its files.
+        self._space_required = Size(self.source_size)
+        log.debug("live image size is %s", self._space_required)
+
     def unsetup(self):
         super().unsetup()
 
@@ -209,7 +214,12 @@ class LiveImagePayload(ImagePayload):
 
     @property
     def spaceRequired(self):
-        return Size(util.getDirSize("/") * 1024)
+        if self._space_required is None:
+            # The image is not mounted yet, so walk the running system once.
+            log.debug("computing the size of the live root")
+            self._space_required = Size(util.getDirSize("/") * 1024)
+
+        return self._space_required
 
     def _updateKernelVersionList(self):
         files = glob.glob(INSTALL_TREE + "/boot/vmlinuz-*")
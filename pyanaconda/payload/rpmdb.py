@@ -0,0 +1,178 @@
+# Cached queries of the RPM database of the installed system.
+#
+# Copyright (C) 2019  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import os
+from threading import RLock
+
+from pyanaconda.core import util
+
+from pyanaconda.anaconda_loggers import get_packaging_logger
+log = get_packaging_logger()
+
+__all__ = ["RPMDatabase", "rpm_database"]
+
+# Possible locations of the RPM database in the root.
+RPM_DATABASE_PATHS = ["/var/lib/rpm", "/usr/lib/sysimage/rpm"]
+
+# Files of the database that change without a change of the data.
+RPM_DATABASE_IGNORED_PREFIXES = ("__db.", ".")
+RPM_DATABASE_IGNORED_SUFFIXES = ("-shm", )
+
+
+class RPMDatabase(object):
+    """Cached queries of the RPM database of the installed system.
+
+    Only the results of the queries are kept in memory. The transaction
+    set is opened for a query that is not cached and closed right after
+    it, so the database of the installed system is not kept open. The
+    cache is dropped if the root changes, if the files of the database
+    change (for example after a transaction) or if it is invalidated
+    explicitly.
+
+    The rpm module is imported on demand, so the queries raise
+    ImportError if it is not available. The query callbacks run under
+    a lock, because the transaction set is shared.
+    """
+
+    def __init__(self, root=None):
+        """Create a new database.
+
+        :param root: a path to the root or None for the sysroot
+        """
+        self._root = root
+        self._lock = RLock()
+        self._stamp = None
+        self._ts = None
+        self._cache = {}
+
+    @property
+    def root(self):
+        """The root of the installed system."""
+        return self._root or util.getSysroot()
+
+    def invalidate(self):
+        """Drop the cached results and the transaction set."""
+        with self._lock:
+            log.debug("Invalidating the cached queries of the RPM database.")
+            self._stamp = None
+            self._cache = {}
+            self._close_transaction_set()
+
+    def _get_stamp(self):
+        """Get a stamp of the current state of the database."""
+        root = self.root
+        stamp = [root]
+
+        for path in RPM_DATABASE_PATHS:
+            try:
+                entries = list(os.scandir(os.path.join(root, path.lstrip("/"))))
+            except OSError:
+                continue
+
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.name.startswith(RPM_DATABASE_IGNORED_PREFIXES) \
+                        or entry.name.endswith(RPM_DATABASE_IGNORED_SUFFIXES):
+                    continue
+
+                try:
+                    sinfo = entry.stat()
+                except OSError:
+                    continue
+
+                stamp.append((entry.path, sinfo.st_mtime_ns, sinfo.st_size))
+
+        return tuple(stamp)
+
+    def _open_transaction_set(self):
+        """Open a new transaction set."""
+        import rpm
+
+        # Remove stale environment files left by the installation.
+        if self.root == util.getSysroot():
+            util.resetRpmDb()
+
+        log.debug("Opening the RPM database in %s.", self.root)
+        return rpm.TransactionSet(self.root)
+
+    def _close_transaction_set(self):
+        """Close the transaction set if it is open."""
+        if self._ts is None:
+            return
+
+        log.debug("Closing the RPM database in %s.", self.root)
+        self._ts.closeDB()
+        self._ts = None
+
+    def _query(self, key, callback):
+        """Return the cached result of the query or run it."""
+        with self._lock:
+            stamp = self._get_stamp()
+
+            if stamp != self._stamp:
+                self._stamp = stamp
+                self._cache = {}
+
+            if key not in self._cache:
+                try:
+                    self._ts = self._open_transaction_set()
+                    self._cache[key] = callback(self._ts)
+                finally:
+                    self._close_transaction_set()
+
+            return self._cache[key]
+
+    def count(self, tag, value):
+        """Count the packages that match the query.
+
+        :param tag: a name of the tag, for example "provides"
+        :param value: a value of the tag
+        :return: a number of packages
+        """
+        return self._query(
+            ("count", tag, value),
+            lambda ts: ts.dbMatch(tag, value).count()
+        )
+
+    def get_names(self, tag, value):
+        """Get names of the packages that match the query.
+
+        :param tag: a name of the tag, for example "basenames"
+        :param value: a value of the tag
+        :return: a tuple of package names
+        """
+        return self._query(
+            ("names", tag, value),
+            lambda ts: tuple(hdr.name.decode("utf-8") for hdr in ts.dbMatch(tag, value))
+        )
+
+    def get_filenames(self, tag, value):
+        """Get files of the packages that match the query.
+
+        :param tag: a name of the tag, for example "providename"
+        :param value: a value of the tag
+        :return: a tuple of file names
+        """
+        return self._query(
+            ("filenames", tag, value),
+            lambda ts: tuple(f.decode("utf-8") for hdr in ts.dbMatch(tag, value)
+                             for f in hdr.filenames)
+        )
+
+
+# The shared database of the installed system.
+rpm_database = RPMDatabase()
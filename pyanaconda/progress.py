@@ -16,6 +16,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import queue
+
 from pyanaconda.core.i18n import _
 
 from pyanaconda.anaconda_loggers import get_module_logger
@@ -51,3 +53,73 @@ def progress_init(steps):
 
 def progress_complete():
     progressQ.send_complete()
+
+
+class ProgressUpdate(object):
+    """The latest state of the progress collected from the pending messages."""
+
+    def __init__(self):
+        # The number of steps from the last init message or None.
+        self.total_steps = None
+        # The number of steps since the last init message or the last update.
+        self.steps = 0
+        # The last message or None.
+        self.message = None
+        # Was the complete message received?
+        self.complete = False
+        # The exit code from the quit message or None.
+        self.exit_code = None
+        # The number of collected messages.
+        self.backlog = 0
+
+
+_max_backlog = 0
+
+
+def collect_progress_update(block=False, timeout=None):
+    """Collect the pending progress messages into one update.
+
+    The step and message events are collapsed, so only the number of
+    steps and the last message are kept. The collection stops at the
+    complete and quit messages, so they are never dropped and messages
+    sent after them stay in the queue for the next update.
+
+    :param block: wait for the first message
+    :param timeout: the maximal number of seconds to wait for the first message
+    :return: an instance of ProgressUpdate or None if there are no messages
+    """
+    global _max_backlog
+    update = ProgressUpdate()
+
+    while True:
+        try:
+            # Wait only for the first message.
+            (code, args) = progressQ.q.get(block and not update.backlog, timeout)
+        except queue.Empty:
+            break
+
+        progressQ.q.task_done()
+        update.backlog += 1
+
+        if code == progressQ.PROGRESS_CODE_INIT:
+            update.total_steps = args[0]
+            update.steps = 0
+        elif code == progressQ.PROGRESS_CODE_STEP:
+            update.steps += 1
+        elif code == progressQ.PROGRESS_CODE_MESSAGE:
+            update.message = args[0]
+        elif code == progressQ.PROGRESS_CODE_COMPLETE:
+            update.complete = True
+            break
+        elif code == progressQ.PROGRESS_CODE_QUIT:
+            update.exit_code = args[0]
+            break
+
+    if not update.backlog:
+        return None
+
+    if update.backlog > _max_backlog:
+        _max_backlog = update.backlog
+        log.debug("The largest backlog of progress messages has %d messages.", _max_backlog)
+
+    return update
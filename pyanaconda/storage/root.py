@@ -17,18 +17,24 @@
 #
 import os
 import shlex
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from blivet import util as blivet_util
 from blivet.storage_log import log_exception_info
 
 from pyanaconda.core import util
+from pyanaconda.core.constants import THREAD_EXISTING_INSTALLATIONS, \
+    EXISTING_INSTALLATIONS_PROBE_WORKERS
 from pyanaconda.core.i18n import _
 from pyanaconda.storage.fsset import BlkidTab, CryptTab
 
 from pyanaconda.anaconda_loggers import get_module_logger
 log = get_module_logger(__name__)
 
-__all__ = ["mount_existing_system", "find_existing_installations", "Root"]
+__all__ = ["mount_existing_system", "find_existing_installations",
+           "reset_existing_installations_cache", "Root"]
 
 
 def mount_existing_system(fsset, root_device, read_only=None):
@@ -73,79 +79,263 @@ def find_existing_installations(devicetree, teardown_all=True):
 def _find_existing_installations(devicetree):
     """Find existing GNU/Linux installations on devices from the device tree.
 
+    Devices are set up one by one, but the probes of the prepared devices
+    run in parallel, each with its own private mount point. Results of the
+    probes are cached, so devices that didn't change since the last call
+    are not mounted again. That includes devices without /etc/fstab.
+
     :param devicetree: a device tree to find existing installations in
     :return: roots of all found installations
     """
     if not os.path.exists(util.getTargetPhysicalRoot()):
         blivet_util.makedirs(util.getTargetPhysicalRoot())
 
-    sysroot = util.getSysroot()
     roots = []
+    candidates = []
     direct_devices = (dev for dev in devicetree.devices if dev.direct)
     for device in direct_devices:
         if not device.format.linux_native or not device.format.mountable or \
            not device.controllable:
             continue
 
+        cached = _probe_cache.get(devicetree, device)
+        if cached is _NO_FSTAB:
+            log.debug("using cached probe of %s, no fstab", device.name)
+            continue
+        elif cached is not None:
+            log.debug("using cached probe of %s", device.name)
+            roots.append((device, cached))
+            continue
+
         try:
             device.setup()
         except Exception:  # pylint: disable=broad-except
             log_exception_info(log.warning, "setup of %s failed", [device.name])
             continue
 
+        candidates.append(device)
+
+    if candidates:
+        workers = min(len(candidates), EXISTING_INSTALLATIONS_PROBE_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers,
+                                thread_name_prefix=THREAD_EXISTING_INSTALLATIONS) as executor:
+            probes = [(device, executor.submit(_probe_device, devicetree, device))
+                      for device in candidates]
+
+        for device, future in probes:
+            probe = future.result()
+
+            if probe is None:
+                continue
+
+            _probe_cache.set(device, probe)
+
+            if probe is _NO_FSTAB:
+                device.teardown()
+                continue
+
+            roots.append((device, probe))
+
+    # Keep the order of the device tree.
+    order = {device.id: i for i, device in enumerate(devicetree.devices)}
+    roots.sort(key=lambda item: order.get(item[0].id, len(order)))
+    return [probe.get_root(devicetree) for _device, probe in roots
+            if not probe.empty]
+
+
+# A marker of a device without a readable /etc/fstab.
+_NO_FSTAB = object()
+
+
+def _probe_device(devicetree, device):
+    """Look for an existing installation on the given device.
+
+    The device has to be already set up. It will be mounted read-only
+    at a private mount point, so more devices can be probed at once.
+
+    :param devicetree: a device tree
+    :param device: a device to probe
+    :return: an instance of _InstallationProbe, _NO_FSTAB or None
+    """
+    mountpoint = tempfile.mkdtemp(prefix="existing-",
+                                  dir=util.getTargetPhysicalRoot())
+    try:
         options = device.format.options + ",ro"
         try:
-            device.format.mount(options=options, mountpoint=sysroot)
+            device.format.mount(options=options, mountpoint=mountpoint)
         except Exception:  # pylint: disable=broad-except
-            log_exception_info(log.warning, "mount of %s as %s failed", [device.name, device.format.type])
-            blivet_util.umount(mountpoint=sysroot)
-            continue
-
-        if not os.access(sysroot + "/etc/fstab", os.R_OK):
-            blivet_util.umount(mountpoint=sysroot)
-            device.teardown()
-            continue
+            log_exception_info(log.warning, "mount of %s as %s failed",
+                               [device.name, device.format.type])
+            blivet_util.umount(mountpoint=mountpoint)
+            return None
 
         try:
-            (architecture, product, version) = get_release_string()
-        except ValueError:
-            name = _("Linux on %s") % device.name
+            return _inspect_mounted_device(devicetree, device, mountpoint)
+        finally:
+            blivet_util.umount(mountpoint=mountpoint)
+    finally:
+        try:
+            os.rmdir(mountpoint)
+        except OSError as e:
+            log.warning("failed to remove the mount point %s: %s", mountpoint, e)
+
+
+def _inspect_mounted_device(devicetree, device, sysroot):
+    """Inspect a device mounted at the given sysroot.
+
+    :param devicetree: a device tree
+    :param device: a mounted device
+    :param sysroot: a mount point of the device
+    :return: an instance of _InstallationProbe or _NO_FSTAB
+    """
+    if not os.access(sysroot + "/etc/fstab", os.R_OK):
+        return _NO_FSTAB
+
+    try:
+        (architecture, product, version) = get_release_string(sysroot)
+    except ValueError:
+        name = _("Linux on %s") % device.name
+    else:
+        # I'd like to make this finer grained, but it'd be very difficult
+        # to translate.
+        if not product or not version or not architecture:
+            name = _("Unknown Linux")
+        elif "linux" in product.lower():
+            name = _("%(product)s %(version)s for %(arch)s") % \
+                {"product": product, "version": version, "arch": architecture}
         else:
-            # I'd like to make this finer grained, but it'd be very difficult
-            # to translate.
-            if not product or not version or not architecture:
-                name = _("Unknown Linux")
-            elif "linux" in product.lower():
-                name = _("%(product)s %(version)s for %(arch)s") % \
-                    {"product": product, "version": version, "arch": architecture}
-            else:
-                name = _("%(product)s Linux %(version)s for %(arch)s") % \
-                    {"product": product, "version": version, "arch": architecture}
+            name = _("%(product)s Linux %(version)s for %(arch)s") % \
+                {"product": product, "version": version, "arch": architecture}
+
+    (mounts, swaps) = _parse_fstab(devicetree, chroot=sysroot)
+    return _InstallationProbe(name, mounts, swaps)
+
+
+class _InstallationProbe(object):
+    """A result of a probe of one device.
+
+    The devices are remembered by their names and the UUIDs of their
+    formats, so the result can be used with copies of the device tree
+    and with the device tree of a rescan, if the devices didn't change.
+    """
+
+    def __init__(self, name, mounts, swaps):
+        self.name = name
+        self.mounts = {path: self._get_key(device) for path, device in mounts.items()}
+        self.swaps = [self._get_key(device) for device in swaps]
+
+    @staticmethod
+    def _get_key(device):
+        return device.name, device.format.uuid
+
+    @staticmethod
+    def _get_device(devicetree, key):
+        (name, uuid) = key
+        device = devicetree.get_device_by_name(name)
+
+        if device is None or device.format.uuid != uuid:
+            return None
+
+        return device
+
+    @property
+    def empty(self):
+        """Is the fstab empty?
+
+        Empty /etc/fstab. weird, but I've seen it happen.
+        """
+        return not self.mounts and not self.swaps
+
+    def is_valid(self, devicetree):
+        """Are all the devices still in the given device tree?"""
+        keys = list(self.mounts.values()) + self.swaps
+        return all(self._get_device(devicetree, key) for key in keys)
+
+    def get_root(self, devicetree):
+        """Create a root with devices from the given device tree."""
+        mounts = {path: self._get_device(devicetree, key) for path, key in self.mounts.items()}
+        swaps = [self._get_device(devicetree, key) for key in self.swaps]
+        return Root(mounts=mounts, swaps=swaps, name=self.name)
+
+
+class _InstallationProbeCache(object):
+    """A thread-safe cache of probed devices.
+
+    The results are keyed by the UUID of the file system and the state
+    of the device, so a reformatted or resized device is probed again.
+    Devices without /etc/fstab are cached too. A probe that refers to
+    devices missing in the device tree is dropped on its own.
+    """
+
+    def __init__(self):
+        self._probes = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_key(device):
+        if not device.format.exists or not device.format.uuid:
+            return None
+
+        return (device.format.uuid, device.format.type, device.name, device.size)
+
+    def get(self, devicetree, device):
+        """Return a valid cached probe of the device, _NO_FSTAB or None."""
+        key = self._get_key(device)
+
+        if not key:
+            return None
+
+        with self._lock:
+            probe = self._probes.get(key)
+
+            if probe is None or probe is _NO_FSTAB:
+                return probe
+
+            if not probe.is_valid(devicetree):
+                del self._probes[key]
+                return None
+
+        return probe
+
+    def set(self, device, probe):
+        """Cache a probe of the device."""
+        key = self._get_key(device)
+
+        if not key:
+            return
+
+        with self._lock:
+            self._probes[key] = probe
+
+    def clear(self):
+        """Drop all cached probes."""
+        with self._lock:
+            self._probes.clear()
+
+
+_probe_cache = _InstallationProbeCache()
 
-        (mounts, swaps) = _parse_fstab(devicetree, chroot=sysroot)
-        blivet_util.umount(mountpoint=sysroot)
-        if not mounts and not swaps:
-            # empty /etc/fstab. weird, but I've seen it happen.
-            continue
-        roots.append(Root(mounts=mounts, swaps=swaps, name=name))
 
-    return roots
+def reset_existing_installations_cache():
+    """Forget the cached results of find_existing_installations."""
+    _probe_cache.clear()
 
 
-def get_release_string():
+def get_release_string(sysroot=None):
     """Identify the installation of a Linux distribution.
 
     Attempt to identify the installation of a Linux distribution by checking
     a previously mounted filesystem for several files.  The filesystem must
     be mounted under the target physical root.
 
+    :param sysroot: a mount point of the filesystem or None for the sysroot
     :returns: The machine's arch, distribution name, and distribution version
     or None for any parts that cannot be determined
     :rtype: (string, string, string)
     """
     rel_name = None
     rel_ver = None
-    sysroot = util.getSysroot()
+    sysroot = sysroot or util.getSysroot()
 
     try:
         rel_arch = blivet_util.capture_output(["arch"], root=sysroot).strip()
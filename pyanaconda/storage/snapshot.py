@@ -18,7 +18,12 @@
 
 
 class StorageSnapshot(object):
-    """R/W snapshot of storage (i.e. a :class:`pyanaconda.storage.InstallerStorage` instance)"""
+    """R/W snapshot of storage (i.e. a :class:`pyanaconda.storage.InstallerStorage` instance)
+
+    The snapshot itself is never modified. Resetting a storage to the
+    snapshot requires a new copy of the snapshot, unless the snapshot
+    is disposed with the reset.
+    """
 
     def __init__(self, storage=None):
         """Create new instance of the class
@@ -64,17 +69,21 @@ class StorageSnapshot(object):
         if not self.created:
             raise ValueError("No snapshot created, cannot reset")
 
-        # we need to create a new copy from the snapshot first -- simple
-        # assignment from the snapshot would result in snapshot being modified
-        # by further changes of 'storage'
-        new_copy = self._storage_snap.copy()
+        if dispose:
+            # The snapshot will not be used anymore, so there is no need
+            # to copy it. The storage can take it over.
+            new_copy = self._storage_snap
+            self.dispose_snapshot()
+        else:
+            # We need to use a new copy of the snapshot -- simple assignment
+            # from the snapshot would result in snapshot being modified by
+            # further changes of 'storage'.
+            new_copy = self._storage_snap.copy()
+
         storage.devicetree = new_copy.devicetree
         storage.roots = new_copy.roots
         storage.fsset = new_copy.fsset
 
-        if dispose:
-            self.dispose_snapshot()
-
 
 # A snapshot of early storage as we got it from scanning disks without doing any changes.
 on_disk_storage = StorageSnapshot()
@@ -350,6 +350,9 @@ class GUISpokeInputCheckHandler(GUIInputCheckHandler, metaclass=ABCMeta):
            Classes implementing this class should run GUISpokeInputCheckHandler.try_to_go_back,
            and if it succeeded, run NormalSpoke.on_back_clicked.
         """
+        # make sure we don't decide based on outdated results
+        self.checker.run_pending_checks()
+
         # check if we can go back
         if self.can_go_back:
             if self.needs_waiver:
@@ -91,45 +91,40 @@ class ProgressHub(Hub):
         self._cycle_rnotes_timer.timeout_sec(60, self._cycle_rnotes)
 
     def _update_progress(self, callback=None):
-        from pyanaconda.progress import progressQ
-        import queue
-
-        q = progressQ.q
-
-        # Grab all messages may have appeared since last time this method ran.
-        while True:
-            # Attempt to get a message out of the queue for how we should update
-            # the progress bar.  If there's no message, don't error out.
-            try:
-                (code, args) = q.get(False)
-            except queue.Empty:
-                break
-
-            if code == progressQ.PROGRESS_CODE_INIT:
-                self._init_progress_bar(args[0])
-            elif code == progressQ.PROGRESS_CODE_STEP:
-                self._step_progress_bar()
-            elif code == progressQ.PROGRESS_CODE_MESSAGE:
-                self._update_progress_message(args[0])
-            elif code == progressQ.PROGRESS_CODE_COMPLETE:
-                q.task_done()
-
-                # we are done, stop the progress indication
-                gtk_call_once(self._progressBar.set_fraction, 1.0)
-                gtk_call_once(self._progressLabel.set_text, _("Complete!"))
-                gtk_call_once(self._spinner.stop)
-                gtk_call_once(self._spinner.hide)
-
-                if callback:
-                    callback()
-
-                # There shouldn't be any more progress bar updates, so return False
-                # to indicate this method should be removed from the idle loop.
-                return False
-            elif code == progressQ.PROGRESS_CODE_QUIT:
-                sys.exit(args[0])
-
-            q.task_done()
+        from pyanaconda.progress import collect_progress_update
+
+        # Collapse all messages that have appeared since last time this
+        # method ran, so the progress bar is redrawn only once.
+        update = collect_progress_update()
+
+        if not update:
+            return True
+
+        if update.total_steps is not None:
+            self._init_progress_bar(update.total_steps)
+
+        if update.steps:
+            self._step_progress_bar(update.steps)
+
+        if update.message is not None:
+            self._update_progress_message(update.message)
+
+        if update.complete:
+            # we are done, stop the progress indication
+            gtk_call_once(self._progressBar.set_fraction, 1.0)
+            gtk_call_once(self._progressLabel.set_text, _("Complete!"))
+            gtk_call_once(self._spinner.stop)
+            gtk_call_once(self._spinner.hide)
+
+            if callback:
+                callback()
+
+            # There shouldn't be any more progress bar updates, so return False
+            # to indicate this method should be removed from the idle loop.
+            return False
+
+        if update.exit_code is not None:
+            sys.exit(update.exit_code)
 
         return True
 
@@ -284,11 +279,11 @@ class ProgressHub(Hub):
 
         gtk_call_once(self._progressBar.set_fraction, 0.0)
 
-    def _step_progress_bar(self):
+    def _step_progress_bar(self, steps=1):
         if not self._totalSteps:
             return
 
-        self._currentStep += 1
+        self._currentStep += steps
         gtk_call_once(self._progressBar.set_fraction, self._currentStep/self._totalSteps)
 
     def _update_progress_message(self, message):
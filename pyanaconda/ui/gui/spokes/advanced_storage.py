@@ -62,6 +62,53 @@ DiskStoreRow = namedtuple("DiskStoreRow", ["visible", "selected", "mutable",
                                            "wwid", "paths", "port", "target",
                                            "lun", "ccw", "wwpn", "namespace", "mode"])
 
+DISK_STORE_NAME_COLUMN = DiskStoreRow._fields.index("name")
+
+
+class DiskStoreUpdater(object):
+    """Update the disk store in place.
+
+    The pages append rows of their disks on every refresh. The rows
+    of known disks are updated only if they have changed and the rows
+    of disks that were not appended again are removed, so the filter
+    models don't have to process the whole store again.
+    """
+
+    def __init__(self, store):
+        self._store = store
+        self._iters = {}
+        self._appended = set()
+
+    def start(self):
+        """Start a new update of the store."""
+        self._appended = set()
+
+    def append(self, row):
+        """Add or update the row of a disk."""
+        name = row[DISK_STORE_NAME_COLUMN]
+        self._appended.add(name)
+        itr = self._iters.get(name)
+
+        if itr is None:
+            self._iters[name] = self._store.append(row)
+            return
+
+        old_row = self._store[itr]
+        changes = []
+
+        for column, value in enumerate(row):
+            if old_row[column] != value:
+                changes.extend((column, value))
+
+        if changes:
+            self._store.set(itr, *changes)
+
+    def finish(self):
+        """Remove rows of disks that were not appended."""
+        for name in list(self._iters.keys()):
+            if name not in self._appended:
+                self._store.remove(self._iters.pop(name))
+
 class FilterPage(object):
     """A FilterPage is the logic behind one of the notebook tabs on the filter
        UI spoke.  Each page has its own specific filtered model overlaid on top
@@ -95,6 +142,31 @@ class FilterPage(object):
 
         self.filterActive = False
 
+        # Disks by names and their cached identifiers.
+        self._devices = {}
+        self._long_identifiers = {}
+        self._path_links = {}
+
+    def update_devices(self, disks):
+        """Set all disks that can be shown in the store.
+
+           The rows of the store are matched with the disks by names, so
+           the filtering doesn't have to search the device tree.
+        """
+        self._devices = {disk.name: disk for disk in disks}
+        self._long_identifiers = {}
+        self._path_links = {}
+
+    def _get_device(self, model, itr):
+        """Return the disk of the given row of the model."""
+        name = model.get_value(itr, DISK_STORE_NAME_COLUMN)
+        device = self._devices.get(name)
+
+        if device is None:
+            device = self.storage.devicetree.get_device_by_name(name, hidden=True)
+
+        return device
+
     def ismember(self, device):
         """Does device belong on this page?  This function should taken into
            account what kind of thing device is.  It should not be concerned
@@ -153,17 +225,30 @@ class FilterPage(object):
         if items:
             combo.set_active(1)
 
+    def _path_link(self, disk):
+        # Return the first by-path link of the disk or None.
+        if disk.name not in self._path_links:
+            self._path_links[disk.name] = next(
+                (link for link in disk.device_links if "by-path" in link), None
+            )
+
+        return self._path_links[disk.name]
+
     def _long_identifier(self, disk):
         # For iSCSI devices, we want the long ip-address:port-iscsi-tgtname-lun-XX
         # identifier, but blivet doesn't expose that in any useful way and I don't
         # want to go asking udev.  Instead, we dig around in the deviceLinks and
         # default to the name if we can't figure anything else out.
-        for link in disk.device_links:
-            if "by-path" in link:
+        if disk.name not in self._long_identifiers:
+            link = self._path_link(disk)
+
+            if link:
                 lastSlash = link.rindex("/")+1
-                return link[lastSlash:]
+                self._long_identifiers[disk.name] = link[lastSlash:]
+            else:
+                self._long_identifiers[disk.name] = disk.name
 
-        return disk.name
+        return self._long_identifiers[disk.name]
 
 class SearchPage(FilterPage):
     # Match these to searchTypeCombo ids in glade
@@ -244,8 +329,7 @@ class SearchPage(FilterPage):
             return self._wwidEntry.get_text() in getattr(device, "wwn", self._long_identifier(device))
 
     def visible_func(self, model, itr, *args):
-        obj = DiskStoreRow(*model[itr])
-        device = self.storage.devicetree.get_device_by_name(obj.name, hidden=True)
+        device = self._get_device(model, itr)
         return self._filter_func(device)
 
 class MultipathPage(FilterPage):
@@ -317,8 +401,7 @@ class MultipathPage(FilterPage):
         if not flags.mpath:
             return False
 
-        obj = DiskStoreRow(*model[itr])
-        device = self.storage.devicetree.get_device_by_name(obj.name, hidden=True)
+        device = self._get_device(model, itr)
         return self.ismember(device) and self._filter_func(device)
 
 class OtherPage(FilterPage):
@@ -392,15 +475,15 @@ class OtherPage(FilterPage):
         elif filterBy == self.SEARCH_TYPE_INTERCONNECT:
             return device.bus == self._icCombo.get_active_text()
         elif filterBy == self.SEARCH_TYPE_ID:
-            for link in device.device_links:
-                if "by-path" in link:
-                    return self._idEntry.get_text().strip() in link
+            link = self._path_link(device)
+
+            if link:
+                return self._idEntry.get_text().strip() in link
 
             return False
 
     def visible_func(self, model, itr, *args):
-        obj = DiskStoreRow(*model[itr])
-        device = self.storage.devicetree.get_device_by_name(obj.name, hidden=True)
+        device = self._get_device(model, itr)
         return self.ismember(device) and self._filter_func(device)
 
 class ZPage(FilterPage):
@@ -480,8 +563,7 @@ class ZPage(FilterPage):
         return False
 
     def visible_func(self, model, itr, *args):
-        obj = DiskStoreRow(*model[itr])
-        device = self.storage.devicetree.get_device_by_name(obj.name, hidden=True)
+        device = self._get_device(model, itr)
         return self.ismember(device) and self._filter_func(device)
 
 class NvdimmPage(FilterPage):
@@ -548,8 +630,7 @@ class NvdimmPage(FilterPage):
             return device.devname == ns
 
     def visible_func(self, model, itr, *args):
-        obj = DiskStoreRow(*model[itr])
-        device = self.storage.devicetree.get_device_by_name(obj.name, hidden=True)
+        device = self._get_device(model, itr)
         return self.ismember(device) and self._filter_func(device)
 
     def get_selected_namespaces(self):
@@ -581,7 +662,7 @@ class FilterSpoke(NormalSpoke):
         super().__init__(*args)
         self.applyOnSkip = True
 
-        self.ancestors = []
+        self.ancestors = set()
         self.disks = []
         self.selected_disks = []
 
@@ -631,6 +712,7 @@ class FilterSpoke(NormalSpoke):
             self.builder.get_object("addISCSIButton").destroy()
 
         self._store = self.builder.get_object("diskStore")
+        self._store_updater = DiskStoreUpdater(self._store)
 
         # The button is sensitive only on NVDIMM page
         self._reconfigureNVDIMMButton.set_sensitive(False)
@@ -651,9 +733,12 @@ class FilterSpoke(NormalSpoke):
         disk_select_proxy = STORAGE.get_proxy(DISK_SELECTION)
         self.selected_disks = disk_select_proxy.SelectedDisks
 
-        self.ancestors = [d.name for disk in self.disks for d in self._real_ancestors(disk)]
+        self.ancestors = {d.name for disk in self.disks for d in self._real_ancestors(disk)}
 
-        self._store.clear()
+        for page in self.pages.values():
+            page.update_devices(self.disks)
+
+        self._store_updater.start()
 
         allDisks = []
         multipathDisks = []
@@ -678,11 +763,16 @@ class FilterSpoke(NormalSpoke):
 
             allDisks.append(disk)
 
-        self.pages[PAGE_SEARCH].setup(self._store, self.selected_disks, allDisks)
-        self.pages[PAGE_MULTIPATH].setup(self._store, self.selected_disks, multipathDisks)
-        self.pages[PAGE_OTHER].setup(self._store, self.selected_disks, otherDisks)
-        self.pages[PAGE_NVDIMM].setup(self._store, self.selected_disks, nvdimmDisks)
-        self.pages[PAGE_Z].setup(self._store, self.selected_disks, zDisks)
+        selected_names = set(self.selected_disks)
+        store = self._store_updater
+
+        self.pages[PAGE_SEARCH].setup(store, selected_names, allDisks)
+        self.pages[PAGE_MULTIPATH].setup(store, selected_names, multipathDisks)
+        self.pages[PAGE_OTHER].setup(store, selected_names, otherDisks)
+        self.pages[PAGE_NVDIMM].setup(store, selected_names, nvdimmDisks)
+        self.pages[PAGE_Z].setup(store, selected_names, zDisks)
+
+        self._store_updater.finish()
 
         self._update_summary()
 
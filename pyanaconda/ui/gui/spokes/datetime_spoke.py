@@ -288,12 +288,15 @@ class NTPconfigDialog(GUIObject, GUIDialogInputCheckHandler):
 
         return rc
 
-    def _set_server_ok_nok(self, itr, epoch_started):
+    def _set_server_ok_nok(self, itr, epoch_started, orig_hostname, server_working):
         """
         If the server is working, set its data to NTP_SERVER_OK, otherwise set its
         data to NTP_SERVER_NOK.
 
         :param itr: iterator of the $server's row in the self._serversStore
+        :param epoch_started: the epoch of the dialog when the check started
+        :param orig_hostname: the checked hostname
+        :param server_working: the result of the check
 
         """
 
@@ -311,9 +314,6 @@ class NTPconfigDialog(GUIObject, GUIDialogInputCheckHandler):
             (store, itr, column, value) = arg_tuple
             store.set_value(itr, column, value)
 
-        orig_hostname = self._serversStore[itr][SERVER_HOSTNAME]
-        server_working = ntp.ntp_server_working(self._serversStore[itr][SERVER_HOSTNAME])
-
         #do not let dialog change epoch while we are modifying data
         self._epoch_lock.acquire()
 
@@ -333,12 +333,20 @@ class NTPconfigDialog(GUIObject, GUIDialogInputCheckHandler):
 
     @async_action_nowait
     def _refresh_server_working(self, itr):
-        """ Runs a new thread with _set_server_ok_nok(itr) as a taget. """
+        """ Checks the server with the shared NTP probe service.
+
+        The servers are checked at once by the service and the result
+        is set with _set_server_ok_nok.
+        """
 
         self._serversStore.set_value(itr, SERVER_WORKING, constants.NTP_SERVER_QUERY)
-        threadMgr.add(AnacondaThread(prefix=constants.THREAD_NTP_SERVER_CHECK,
-                                     target=self._set_server_ok_nok,
-                                     args=(itr, self._epoch)))
+        epoch_started = self._epoch
+
+        def on_checked(server, working):
+            self._set_server_ok_nok(itr, epoch_started, server, working)
+
+        ntp.ntp_probe_service.check_server(self._serversStore[itr][SERVER_HOSTNAME],
+                                           callback=on_checked)
 
     def _add_server(self, server, pool=False):
         """
@@ -65,6 +65,8 @@ class PassphraseDialog(GUIObject):
                                                        policy = input_checking.get_policy(self.data, "luks"))
         # configure the checker for passphrase checking
         self._checker.secret_type = constants.SecretType.PASSPHRASE
+        # don't check the passphrase on every keystroke in the main thread
+        self._checker.asynchronous = True
         # connect UI updates to check results
         self._checker.checks_done.connect(self._set_status)
 
@@ -190,6 +192,9 @@ class PassphraseDialog(GUIObject):
         self.passphrase = self._passphrase_entry.get_text()
 
     def on_entry_activated(self, entry):
+        # make sure the status of the save button is up to date
+        self._checker.run_pending_checks()
+
         if self._save_button.get_sensitive() and \
            entry.get_text() == self._passphrase_entry.get_text():
             self._save_button.emit("clicked")
@@ -35,12 +35,14 @@ from pyanaconda.ui.gui.spokes import NormalSpoke, StandaloneSpoke
 from pyanaconda.ui.categories.system import SystemCategory
 from pyanaconda.ui.gui.hubs.summary import SummaryHub
 from pyanaconda.ui.gui.utils import gtk_call_once, escape_markup, really_hide, really_show
+from pyanaconda.ui.lib.network import DeviceConfigurationIndex
 from pyanaconda.ui.common import FirstbootSpokeMixIn
 from pyanaconda.core.configuration.anaconda import conf
 from pyanaconda.core.util import startProgram
 from pyanaconda.core.process_watchers import PidWatcher
-from pyanaconda.core.constants import ANACONDA_ENVIRON
+from pyanaconda.core.constants import ANACONDA_ENVIRON, NETWORK_DEVICE_REFRESH_DELAY
 from pyanaconda.core import glib
+from pyanaconda.core.timer import Timer
 from pyanaconda.modules.common.constants.services import NETWORK
 
 from pyanaconda import network
@@ -214,8 +216,29 @@ class DeviceConfiguration(object):
         }
 
     def __init__(self, device=None, con=None):
-        self.device = device
-        self.con = con
+        self._device = device
+        self._con = con
+        self.index = None
+
+    @property
+    def device(self):
+        return self._device
+
+    @device.setter
+    def device(self, device):
+        self._device = device
+        if self.index:
+            self.index.update(self)
+
+    @property
+    def con(self):
+        return self._con
+
+    @con.setter
+    def con(self, con):
+        self._con = con
+        if self.index:
+            self.index.update(self)
 
     def get_device_type(self):
         if self.device:
@@ -332,6 +355,15 @@ class NetworkControlBox(GObject.GObject):
         self._add_device_columns(treeview)
         self.dev_cfg_store = self.builder.get_object("liststore_devices")
         self.dev_cfg_store.set_sort_column_id(2, Gtk.SortType.ASCENDING)
+        self.dev_cfg_index = DeviceConfigurationIndex(
+            get_order=lambda: (row[DEVICES_COLUMN_OBJECT] for row in self.dev_cfg_store)
+        )
+
+        # refreshes triggered by signals of devices are coalesced
+        self._pending_refreshes = {}
+        self._carrier_info_outdated = False
+        self._refresh_timer = Timer()
+        self._refresh_scheduled = False
         selection = treeview.get_selection()
         selection.set_mode(Gtk.SelectionMode.BROWSE)
         selection.connect("changed", self.on_device_selection_changed)
@@ -492,15 +524,44 @@ class NetworkControlBox(GObject.GObject):
         self.emit("device-state-changed", device.get_iface(), new_state, *args)
         if new_state == NM.DeviceState.SECONDARIES:
             return
-        self._refresh_carrier_info()
-        dev_cfg = self.selected_dev_cfg()
-        if dev_cfg and dev_cfg.device == device:
-            self.refresh_ui(state=new_state)
+        self._carrier_info_outdated = True
+        self._schedule_refresh(device, new_state)
 
     def on_device_config_changed(self, device, *args):
+        self._schedule_refresh(device)
+
+    def _schedule_refresh(self, device, state=None):
+        """Refresh the device at most once per frame."""
+        udi = device.get_udi()
+
+        # keep the last state reported by a signal
+        if state is None and udi in self._pending_refreshes:
+            state = self._pending_refreshes[udi][1]
+
+        self._pending_refreshes[udi] = (device, state)
+
+        if not self._refresh_scheduled:
+            self._refresh_scheduled = True
+            self._refresh_timer.timeout_msec(NETWORK_DEVICE_REFRESH_DELAY,
+                                             self._refresh_pending_devices)
+
+    def _refresh_pending_devices(self):
+        pending = self._pending_refreshes
+        self._pending_refreshes = {}
+        self._refresh_scheduled = False
+
+        if self._carrier_info_outdated:
+            self._carrier_info_outdated = False
+            self._refresh_carrier_info()
+
         dev_cfg = self.selected_dev_cfg()
-        if dev_cfg and dev_cfg.device == device:
-            self.refresh_ui()
+        if dev_cfg and dev_cfg.device:
+            device, state = pending.get(dev_cfg.device.get_udi(), (None, None))
+            if device and dev_cfg.device == device:
+                self.refresh_ui(state=state)
+
+        # run only once
+        return False
 
     def on_wireless_ap_changed_cb(self, combobox, *args):
         if self._updating_device:
@@ -726,6 +787,7 @@ class NetworkControlBox(GObject.GObject):
             return None
         dev_cfg = model[itr][DEVICES_COLUMN_OBJECT]
         model.remove(itr)
+        self.dev_cfg_index.remove(dev_cfg)
         if dev_cfg.con:
             dev_cfg.con.delete()
 
@@ -756,6 +818,7 @@ class NetworkControlBox(GObject.GObject):
             self._dev_title(dev_cfg),
             dev_cfg
         ])
+        self.dev_cfg_index.add(dev_cfg)
 
     def add_device_to_list(self, device):
         if device.get_device_type() not in self.supported_device_types:
@@ -885,21 +948,7 @@ class NetworkControlBox(GObject.GObject):
     def dev_cfg(self, uuid=None, device=None, iface=None):
         if not any([uuid, device, iface]):
             return None
-        for row in self.dev_cfg_store:
-            dev_cfg = row[DEVICES_COLUMN_OBJECT]
-            if uuid:
-                if dev_cfg.get_uuid() != uuid:
-                    continue
-            if device:
-                if not dev_cfg.device \
-                   or dev_cfg.device.get_udi() != device.get_udi():
-                    continue
-            if iface:
-                if not dev_cfg.device \
-                   or dev_cfg.device.get_iface() != iface:
-                    continue
-            return dev_cfg
-        return None
+        return self.dev_cfg_index.find(uuid=uuid, device=device, iface=iface)
 
     def remove_device(self, device):
         # This should not concern wifi and ethernet devices,
@@ -1280,6 +1329,11 @@ class NetworkControlBox(GObject.GObject):
         self.label_current_hostname.set_text(value)
 
     def disconnect_client_callbacks(self):
+        if self._refresh_scheduled:
+            self._refresh_timer.cancel()
+            self._refresh_scheduled = False
+            self._pending_refreshes = {}
+
         for cb in [self.on_device_added, self.on_device_removed,
                    self.on_connection_added, self.on_wireless_enabled,
                    self.on_nm_state_changed]:
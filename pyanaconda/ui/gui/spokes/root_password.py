@@ -92,6 +92,8 @@ class PasswordSpoke(FirstbootSpokeMixIn, NormalSpoke, GUISpokeInputCheckHandler)
         )
         # configure the checker for password checking
         self.checker.secret_type = constants.SecretType.PASSWORD
+        # don't check the password on every keystroke in the main thread
+        self.checker.asynchronous = True
         # remove any placeholder texts if either password or confirmation field changes content from initial state
         self.checker.password.changed_from_initial_state.connect(self.remove_placeholder_texts)
         self.checker.password_confirmation.changed_from_initial_state.connect(self.remove_placeholder_texts)
@@ -286,6 +286,8 @@ class UserSpoke(FirstbootSpokeMixIn, NormalSpoke, GUISpokeInputCheckHandler):
         # configure the checker for password checking
         self.checker.username = self.username
         self.checker.secret_type = constants.SecretType.PASSWORD
+        # don't check the password on every keystroke in the main thread
+        self.checker.asynchronous = True
         # remove any placeholder texts if either password or confirmation field changes content from initial state
         self.checker.password.changed_from_initial_state.connect(self.remove_placeholder_texts)
         self.checker.password_confirmation.changed_from_initial_state.connect(self.remove_placeholder_texts)
@@ -515,7 +517,7 @@ class UserSpoke(FirstbootSpokeMixIn, NormalSpoke, GUISpokeInputCheckHandler):
         self._empty_check.skip = not new_username
         self._validity_check.skip = not new_username
         # Re-run the password checks against the new username
-        self.checker.run_checks()
+        self.checker.schedule_checks()
 
     def on_full_name_changed(self, editable, data=None):
         """Called by Gtk callback when the full name field changes."""
@@ -529,7 +531,7 @@ class UserSpoke(FirstbootSpokeMixIn, NormalSpoke, GUISpokeInputCheckHandler):
         self.checker.fullname = fullname
 
         # rerun the checks
-        self.checker.run_checks()
+        self.checker.schedule_checks()
 
     def on_admin_toggled(self, togglebutton, data=None):
         # Add or remove "wheel" from the grouplist on changes to the admin checkbox
@@ -18,13 +18,15 @@
 #
 
 from blivet.devices import MultipathDevice, iScsiDiskDevice, FcoeDiskDevice
+from blivet.size import Size
 
 from pyanaconda.core.i18n import P_
 from pyanaconda.modules.common.constants.objects import DISK_SELECTION, DISK_INITIALIZATION
 from pyanaconda.modules.common.constants.services import STORAGE
 from pyanaconda.core.configuration.anaconda import conf
 
-__all__ = ["FakeDiskLabel", "FakeDisk", "getDisks", "isLocalDisk"]
+__all__ = ["FakeDiskLabel", "FakeDisk", "getDisks", "isLocalDisk", "DiskListPager",
+           "DiskSelectionSummary"]
 
 class FakeDiskLabel(object):
     def __init__(self, free=0):
@@ -128,3 +130,173 @@ def checkDiskSelection(storage, selected_disks):
                            "unselected": ",".join(missing)})
 
     return errors
+
+
+def get_disk_search_text(disk):
+    """Get a text that can be searched for the given disk.
+
+    The text contains the name, the size, the vendor, the model,
+    the serial number and the WWID of the disk.
+    """
+    values = [disk.name, str(disk.size)]
+
+    for attr in ("vendor", "model", "serial", "wwn", "wwid"):
+        value = getattr(disk, attr, None)
+        if value:
+            values.append(str(value))
+
+    return " ".join(values).lower()
+
+
+class DiskListPager(object):
+    """Filter a list of disks and split it into pages.
+
+    The filter is a case-insensitive text that has to be found in
+    the search text of a disk, for example a part of its name, vendor
+    or WWID. A filter that starts with > or < compares sizes of disks
+    with the given size, for example ">500 GiB".
+    """
+
+    def __init__(self, page_size):
+        self._page_size = page_size
+        self._search_texts = []
+        self._matches = []
+        self._filter = ""
+        self._page = 0
+
+    def set_disks(self, disks, get_search_text=get_disk_search_text):
+        """Set the disks and reset the page.
+
+        :param disks: a list of disks
+        :param get_search_text: a function that returns a search text of a disk
+        """
+        self._search_texts = [(disk, get_search_text(disk)) for disk in disks]
+        self._apply_filter()
+
+    @property
+    def filter(self):
+        """The current filter."""
+        return self._filter
+
+    def set_filter(self, text):
+        """Set the filter and reset the page.
+
+        :param text: a filter or an empty string
+        """
+        self._filter = text.strip()
+        self._apply_filter()
+
+    def _apply_filter(self):
+        """Find the disks that match the filter."""
+        self._page = 0
+        match = self._get_match_function(self._filter)
+        self._matches = [disk for disk, text in self._search_texts if match(disk, text)]
+
+    def _get_match_function(self, text):
+        """Get a function that decides if a disk matches the filter."""
+        if not text:
+            return lambda disk, search_text: True
+
+        if text[0] in "<>":
+            try:
+                size = Size(text[1:].strip())
+            except ValueError:
+                pass
+            else:
+                if text[0] == "<":
+                    return lambda disk, search_text: disk.size < size
+                else:
+                    return lambda disk, search_text: disk.size > size
+
+        text = text.lower()
+        return lambda disk, search_text: text in search_text
+
+    @property
+    def matches(self):
+        """All disks that match the filter."""
+        return self._matches
+
+    @property
+    def page(self):
+        """The index of the current page."""
+        return self._page
+
+    @property
+    def page_count(self):
+        """The number of pages."""
+        return max(1, -(-len(self._matches) // self._page_size))
+
+    @property
+    def disks(self):
+        """Disks on the current page."""
+        start = self._page * self._page_size
+        return self._matches[start:start + self._page_size]
+
+    def next_page(self):
+        """Go to the next page.
+
+        :return: True if the page has changed, otherwise False
+        """
+        if self._page + 1 >= self.page_count:
+            return False
+
+        self._page += 1
+        return True
+
+    def previous_page(self):
+        """Go to the previous page.
+
+        :return: True if the page has changed, otherwise False
+        """
+        if self._page <= 0:
+            return False
+
+        self._page -= 1
+        return True
+
+
+class DiskSelectionSummary(object):
+    """A summary of the selected disks updated with every change."""
+
+    def __init__(self, disks, selected_names, free_space):
+        """Create a new summary.
+
+        :param disks: a list of disks
+        :param selected_names: names of the selected disks
+        :param free_space: a dictionary of free space returned by get_free_space
+        """
+        self._free = {name: free for name, (free, _fs_free) in free_space.items()}
+        self._selected = set()
+        self.count = 0
+        self.capacity = Size(0)
+        self.free = Size(0)
+
+        selected_names = set(selected_names)
+
+        for disk in disks:
+            if disk.name in selected_names:
+                self.select(disk)
+
+    def is_selected(self, disk):
+        """Is the disk selected?"""
+        return disk.name in self._selected
+
+    def select(self, disk):
+        """Add the disk to the summary."""
+        if disk.name in self._selected:
+            return
+
+        self._selected.add(disk.name)
+        self.count += 1
+        self.capacity += disk.size
+        self.free += self._free.get(disk.name, Size(0))
+
+    def deselect(self, disk):
+        """Remove the disk from the summary."""
+        if disk.name not in self._selected:
+            return
+
+        self._selected.remove(disk.name)
+        self.count -= 1
+        self.capacity -= disk.size
+        self.free -= self._free.get(disk.name, Size(0))
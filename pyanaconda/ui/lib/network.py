@@ -0,0 +1,112 @@
+#
+# Copyright (C) 2019  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+
+__all__ = ["DeviceConfigurationIndex"]
+
+
+class DeviceConfigurationIndex(object):
+    """Index of device configurations by uuid, device udi and iface.
+
+    The index is updated by the device configurations when their
+    device or connection change. If more device configurations match,
+    the first one in the given order is found. The network spoke uses
+    the current order of the rows in its sorted store. By default, the
+    device configurations are ordered as they were added.
+    """
+
+    def __init__(self, get_order=None):
+        """Create a new index.
+
+        :param get_order: a function that returns all device configurations
+                          in the requested order or None
+        """
+        self._get_order = get_order
+        self._indexes = ({}, {}, {})
+        self._keys = {}
+        self._positions = {}
+        self._next_position = 0
+
+    def _get_keys(self, dev_cfg):
+        device = dev_cfg.device
+        if device:
+            return dev_cfg.get_uuid(), device.get_udi(), device.get_iface()
+        else:
+            return dev_cfg.get_uuid(), None, None
+
+    def _index(self, dev_cfg):
+        keys = self._get_keys(dev_cfg)
+        self._keys[dev_cfg] = keys
+
+        for index, key in zip(self._indexes, keys):
+            if key:
+                index.setdefault(key, []).append(dev_cfg)
+
+    def _unindex(self, dev_cfg):
+        keys = self._keys.pop(dev_cfg, ())
+
+        for index, key in zip(self._indexes, keys):
+            if key and dev_cfg in index.get(key, []):
+                index[key].remove(dev_cfg)
+                if not index[key]:
+                    del index[key]
+
+    def add(self, dev_cfg):
+        """Add a device configuration appended to the store."""
+        self._positions[dev_cfg] = self._next_position
+        self._next_position += 1
+        dev_cfg.index = self
+        self._index(dev_cfg)
+
+    def remove(self, dev_cfg):
+        """Remove a device configuration removed from the store."""
+        self._unindex(dev_cfg)
+        self._positions.pop(dev_cfg, None)
+        dev_cfg.index = None
+
+    def update(self, dev_cfg):
+        """Update the keys of a device configuration.
+
+        The position of the device configuration doesn't change.
+        """
+        self._unindex(dev_cfg)
+        self._index(dev_cfg)
+
+    def find(self, uuid=None, device=None, iface=None):
+        """Find the first device configuration matching all given values."""
+        keys = (uuid, device and device.get_udi(), iface)
+        candidates = None
+
+        for index, key in zip(self._indexes, keys):
+            if not key:
+                continue
+            found = index.get(key, [])
+            if candidates is None:
+                candidates = found
+            else:
+                candidates = [dev_cfg for dev_cfg in candidates if dev_cfg in found]
+
+        if not candidates:
+            return None
+
+        if len(candidates) == 1:
+            return candidates[0]
+
+        if self._get_order:
+            return next(dev_cfg for dev_cfg in self._get_order() if dev_cfg in candidates)
+
+        return min(candidates, key=self._positions.get)
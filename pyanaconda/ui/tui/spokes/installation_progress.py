@@ -60,58 +60,48 @@ class ProgressSpoke(StandaloneTUISpoke):
     def _update_progress(self):
         """Handle progress updates from install thread."""
 
-        from pyanaconda.progress import progressQ
-        import queue
+        from pyanaconda.progress import collect_progress_update
 
-        q = progressQ.q
-
-        # Grab all messages may have appeared since last time this method ran.
         while True:
-            # Attempt to get a message out of the queue for how we should update
-            # the progress bar.  If there's no message, don't error out.
+            # Collapse all messages that have appeared since last time,
+            # so we print only the latest message.
             # Also flush the communication Queue at least once a second and
             # process it's events so we can react to async evens (like a thread
             # throwing an exception)
-            while True:
-                try:
-                    (code, args) = q.get(timeout=1)
-                    break
-                except queue.Empty:
-                    pass
-                finally:
-                    loop = App.get_event_loop()
-                    loop.process_signals()
-
-            if code == progressQ.PROGRESS_CODE_INIT:
-                # Text mode doesn't have a finite progress bar
-                pass
-            elif code == progressQ.PROGRESS_CODE_STEP:
-                # Instead of updating a progress bar, we just print a pip
-                # but print it without a new line.
-                sys.stdout.write('.')
+            try:
+                update = collect_progress_update(block=True, timeout=1)
+            finally:
+                loop = App.get_event_loop()
+                loop.process_signals()
+
+            if not update:
+                continue
+
+            if update.steps:
+                # Instead of updating a progress bar, we just print pips
+                # but print them without a new line.
+                sys.stdout.write('.' * update.steps)
                 sys.stdout.flush()
                 # Use _stepped as an indication to if we need a newline before
                 # the next message
                 self._stepped = True
-            elif code == progressQ.PROGRESS_CODE_MESSAGE:
+
+            if update.message is not None:
                 # This should already be translated
                 if self._stepped:
                     # Get a new line in case we've done a step before
                     self._stepped = False
                     print('')
-                print(args[0])
-            elif code == progressQ.PROGRESS_CODE_COMPLETE:
-                # There shouldn't be any more progress updates, so return
-                q.task_done()
+                print(update.message)
 
+            if update.complete:
+                # There shouldn't be any more progress updates, so return
                 if self._stepped:
                     print('')
                 return True
-            elif code == progressQ.PROGRESS_CODE_QUIT:
-                sys.exit(args[0])
 
-            q.task_done()
-        return True
+            if update.exit_code is not None:
+                sys.exit(update.exit_code)
 
     def show_all(self):
         super().show_all()
@@ -25,7 +25,7 @@ from pyanaconda.modules.common.constants.objects import DISK_SELECTION, DISK_INI
     BOOTLOADER, AUTO_PARTITIONING, MANUAL_PARTITIONING
 from pyanaconda.modules.common.constants.services import STORAGE
 from pyanaconda.ui.lib.disks import getDisks, applyDiskSelection, checkDiskSelection, \
-    getDisksByNames
+    getDisksByNames, get_disk_search_text, DiskListPager, DiskSelectionSummary
 from pyanaconda.ui.categories.system import SystemCategory
 from pyanaconda.ui.tui.spokes import NormalTUISpoke
 from pyanaconda.ui.tui.tuiobject import Dialog, PasswordDialog
@@ -47,7 +47,8 @@ from pyanaconda.core.constants import THREAD_STORAGE, THREAD_STORAGE_WATCHER, \
     DEFAULT_AUTOPART_TYPE, PAYLOAD_STATUS_PROBING_STORAGE, CLEAR_PARTITIONS_ALL, \
     CLEAR_PARTITIONS_LINUX, CLEAR_PARTITIONS_NONE, CLEAR_PARTITIONS_DEFAULT, \
     BOOTLOADER_LOCATION_MBR, BOOTLOADER_DRIVE_UNSET, AUTOPART_TYPE_DEFAULT, SecretType, \
-    MOUNT_POINT_REFORMAT, MOUNT_POINT_PATH, MOUNT_POINT_DEVICE, MOUNT_POINT_FORMAT
+    MOUNT_POINT_REFORMAT, MOUNT_POINT_PATH, MOUNT_POINT_DEVICE, MOUNT_POINT_FORMAT, \
+    TUI_DISKS_PAGE_SIZE
 from pyanaconda.core.i18n import _, P_, N_, C_
 from pyanaconda.bootloader import BootLoaderError
 from pyanaconda.storage.osinstall import storage_initialize
@@ -115,6 +116,15 @@ class StorageSpoke(NormalTUISpoke):
         self.errors = []
         self.warnings = []
 
+        # Only one page of the filtered disks is shown at once. The
+        # descriptions of the disks are formatted when the list is set.
+        self._disks_pager = DiskListPager(TUI_DISKS_PAGE_SIZE)
+        self._disks_info = {}
+
+        # The summary is updated with every change of the selection
+        # and created again when the disks or the storage change.
+        self._disks_summary = None
+
         if not flags.automatedInstall:
             # default to using autopart for interactive installs
             self._auto_part_observer.proxy.SetEnabled(True)
@@ -159,32 +169,35 @@ class StorageSpoke(NormalTUISpoke):
         """ Update self.selected_disks based on the selection."""
 
         name = disk.name
+        summary = self._get_disks_summary()
 
         # if the disk isn't already selected, select it.
-        if name not in self.selected_disks:
+        if not summary.is_selected(disk):
             self.selected_disks.append(name)
+            summary.select(disk)
         # If the disk is already selected, deselect it.
-        elif name in self.selected_disks:
+        else:
             self.selected_disks.remove(name)
+            summary.deselect(disk)
 
-    def _update_summary(self):
-        """ Update the summary based on the UI. """
-        count = 0
-        capacity = 0
-        free = Size(0)
+    def _get_disks_summary(self):
+        """ Get the summary of the selected disks. """
+        if self._disks_summary is None:
+            # pass in our disk list so hidden disks' free space is available
+            free_space = self.storage.get_free_space(disks=self.disks)
+            self._disks_summary = DiskSelectionSummary(self.disks, self.selected_disks,
+                                                       free_space)
 
-        # pass in our disk list so hidden disks' free space is available
-        free_space = self.storage.get_free_space(disks=self.disks)
-        selected = [d for d in self.disks if d.name in self.selected_disks]
+        return self._disks_summary
 
-        for disk in selected:
-            capacity += disk.size
-            free += free_space[disk.name][0]
-            count += 1
+    def _update_summary(self):
+        """ Update the summary based on the UI. """
+        summary = self._get_disks_summary()
+        count = summary.count
 
         summary = (P_(("%d disk selected; %s capacity; %s free ..."),
                       ("%d disks selected; %s capacity; %s free ..."),
-                      count) % (count, str(Size(capacity)), free))
+                      count) % (count, str(summary.capacity), summary.free))
 
         if len(self.disks) == 0:
             summary = _("No disks detected.  Please shut down the computer, "
@@ -223,33 +236,70 @@ class StorageSpoke(NormalTUISpoke):
 
         message = self._update_summary()
 
-        # loop through the disks and present them.
-        for disk in self.disks:
-            disk_info = self._format_disk_info(disk)
-            c = CheckboxWidget(title=disk_info, completed=(disk.name in self.selected_disks))
+        summary = self._get_disks_summary()
+
+        # loop through the disks on the current page and present them.
+        for disk in self._disks_pager.disks:
+            disk_info = self._disks_info[disk.name]
+            c = CheckboxWidget(title=disk_info, completed=summary.is_selected(disk))
             self._container.add(c, self._update_disk_list_callback, disk)
 
         # if we have more than one disk, present an option to just
-        # select all disks
-        if len(self.disks) > 1:
+        # select all disks that match the filter
+        if len(self._disks_pager.matches) > 1:
             c = CheckboxWidget(title=_("Select all"), completed=self.select_all)
             self._container.add(c, self._select_all_disks_callback)
 
         self.window.add_with_separator(self._container)
+
+        if self._is_disks_pager_used():
+            self.window.add_with_separator(TextWidget(self._format_pager_info()))
+
         self.window.add_with_separator(TextWidget(message))
 
+    def _is_disks_pager_used(self):
+        """ Are the disks filtered or split into pages? """
+        return len(self.disks) > TUI_DISKS_PAGE_SIZE or bool(self._disks_pager.filter)
+
+    def _format_pager_info(self):
+        """ Describe the shown page of disks. """
+        pager = self._disks_pager
+        info = _("Page %(page)d of %(count)d, %(disks)d of %(total)d disks") % {
+            "page": pager.page + 1,
+            "count": pager.page_count,
+            "disks": len(pager.matches),
+            "total": len(self.disks)
+        }
+
+        if pager.filter:
+            info += "\n" + _("Filter: %s") % pager.filter
+
+        return info
+
     def _select_all_disks_callback(self, data):
-        """ Mark all disks as selected for use in partitioning. """
+        """ Mark all disks that match the filter as selected for use in partitioning. """
         self.select_all = True
-        for disk in self.disks:
-            if disk.name not in self.selected_disks:
+        summary = self._get_disks_summary()
+
+        for disk in self._disks_pager.matches:
+            if not summary.is_selected(disk):
                 self._update_disk_list(disk)
 
+    def _set_disks_filter(self):
+        """ Ask for a new filter of the disks. """
+        dialog = Dialog(_("Filter by name, size, vendor or WWID"))
+        self._disks_pager.set_filter(dialog.run())
+        self.select_all = False
+
     def _update_disk_list_callback(self, data):
         disk = data
         self.select_all = False
         self._update_disk_list(disk)
 
+    def _get_disk_search_text(self, disk):
+        """ Get a text that can be searched for the disk. """
+        return get_disk_search_text(disk) + " " + self._disks_info[disk.name].lower()
+
     def _format_disk_info(self, disk):
         """ Some specialized disks are difficult to identify in the storage
             spoke, so add and return extra identifying information about them.
@@ -284,11 +334,26 @@ class StorageSpoke(NormalTUISpoke):
 
         return format_str
 
+    def prompt(self, args=None):
+        prompt = super().prompt(args)
+
+        if self._is_disks_pager_used():
+            # TRANSLATORS: 'n' to show the next page of disks
+            prompt.add_option(C_('TUI|Spoke Navigation|Storage', 'n'), _("next page"))
+            # TRANSLATORS: 'p' to show the previous page of disks
+            prompt.add_option(C_('TUI|Spoke Navigation|Storage', 'p'), _("previous page"))
+            # TRANSLATORS: 'f' to filter disks
+            prompt.add_option(C_('TUI|Spoke Navigation|Storage', 'f'), _("filter disks"))
+
+        return prompt
+
     def input(self, args, key):
         """Grab the disk choice and update things"""
         self.errors = []
         if self._container.process_user_input(key):
             return InputState.PROCESSED_AND_REDRAW
+        elif self._is_disks_pager_used() and self._process_pager_input(key):
+            return InputState.PROCESSED_AND_REDRAW
         else:
             # TRANSLATORS: 'c' to continue
             if key.lower() == C_('TUI|Spoke Navigation', 'c'):
@@ -333,6 +398,26 @@ class StorageSpoke(NormalTUISpoke):
             else:
                 return super().input(args, key)
 
+    def _process_pager_input(self, key):
+        """ Change the page or the filter of the disks.
+
+        :return: True if the key was processed, otherwise False
+        """
+        # TRANSLATORS: 'n' to show the next page of disks
+        if key.lower() == C_('TUI|Spoke Navigation|Storage', 'n'):
+            self._disks_pager.next_page()
+            return True
+        # TRANSLATORS: 'p' to show the previous page of disks
+        elif key.lower() == C_('TUI|Spoke Navigation|Storage', 'p'):
+            self._disks_pager.previous_page()
+            return True
+        # TRANSLATORS: 'f' to filter disks
+        elif key.lower() == C_('TUI|Spoke Navigation|Storage', 'f'):
+            self._set_disks_filter()
+            return True
+
+        return False
+
     def run_dasdfmt_dialog(self, dasd_formatting):
         """Do DASD formatting if user agrees."""
         # Prepare text of the dialog.
@@ -482,6 +567,8 @@ class StorageSpoke(NormalTUISpoke):
             self.warnings = report.warnings
         finally:
             resetCustomStorageData(self.data)
+            # The free space of the disks could change.
+            self._disks_summary = None
             self._ready = True
 
     def initialize(self):
@@ -496,6 +583,7 @@ class StorageSpoke(NormalTUISpoke):
                                      target=self._initialize))
 
         self.selected_disks = self._disk_select_observer.proxy.SelectedDisks
+        self._disks_summary = None
         # Probably need something here to track which disks are selected?
 
     def _initialize(self):
@@ -523,6 +611,12 @@ class StorageSpoke(NormalTUISpoke):
 
         self.disks = sorted(getDisks(self.storage.devicetree),
                             key=lambda d: d.name)
+
+        # format the descriptions only once
+        self._disks_info = {d.name: self._format_disk_info(d) for d in self.disks}
+        self._disks_pager.set_disks(self.disks, self._get_disk_search_text)
+        self._disks_summary = None
+
         # if only one disk is available, go ahead and mark it as selected
         if len(self.disks) == 1:
             self._update_disk_list(self.disks[0])
@@ -24,7 +24,6 @@ from pyanaconda import timezone
 from pyanaconda import ntp
 from pyanaconda.core import constants
 from pyanaconda.core.i18n import N_, _, C_
-from pyanaconda.threading import threadMgr, AnacondaThread
 from pyanaconda.flags import flags
 
 from collections import OrderedDict, namedtuple
@@ -111,19 +110,15 @@ class TimeSpoke(FirstbootSpokeMixIn, NormalTUISpoke):
         :param list servers: list of servers to check
         """
         for server in servers:
-            threadMgr.add(AnacondaThread(prefix=constants.THREAD_NTP_SERVER_CHECK,
-                                         target=self._check_ntp_server,
-                                         args=(server,)))
+            log.debug("checking NTP server %s", server)
+            ntp.ntp_probe_service.check_server(server, callback=self._on_ntp_server_checked)
 
-    def _check_ntp_server(self, server):
-        """Check if an NTP server appears to be working.
+    def _on_ntp_server_checked(self, server, result):
+        """Set the status of a checked NTP server.
 
         :param str server: NTP server address
-        :returns: True if the server appears to be working, False if not
-        :rtype: bool
+        :param bool result: True if the server appears to be working, False if not
         """
-        log.debug("checking NTP server %s", server)
-        result = ntp.ntp_server_working(server)
         if result:
             log.debug("NTP server %s appears to be working", server)
             self.set_ntp_server_status(server, constants.NTP_SERVER_OK)
@@ -0,0 +1,142 @@
+#!/usr/bin/python3
+#
+# Copyright (C) 2019  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Measure the latency of acquiring DBus proxies and the number of DBus
+# messages sent during a simulated refresh of a hub with and without
+# the pool of proxies.
+#
+# The benchmark starts a private message bus with dbus-daemon.
+#
+# Usage: PYTHONPATH=. python3 tests/benchmarks/dbus_proxy_benchmark.py [SPOKES] [REFRESHES]
+#
+import subprocess
+import sys
+import time
+from threading import Thread
+
+from gi.repository import GLib
+import pydbus
+
+from pyanaconda.dbus.connection import DBusConnection
+
+SERVICE_NAME = "org.fedoraproject.Anaconda.Benchmark"
+OBJECT_PATH = "/org/fedoraproject/Anaconda/Benchmark/Spoke{}"
+
+
+class Spoke(object):
+    """
+    <node>
+      <interface name="org.fedoraproject.Anaconda.Benchmark.Spoke">
+        <property name="IsComplete" type="b" access="read" />
+        <property name="Status" type="s" access="read" />
+      </interface>
+    </node>
+    """
+
+    IsComplete = True
+    Status = "Ready"
+
+
+class CountingConnection(object):
+    """Wrapper of a Gio connection counting the sent messages."""
+
+    def __init__(self, con):
+        self._con = con
+        self.messages = 0
+
+    def call_sync(self, *args, **kwargs):
+        self.messages += 1
+        return self._con.call_sync(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._con, name)
+
+
+class UnpooledConnection(DBusConnection):
+    """Connection that creates a new proxy every time."""
+
+    def get_proxy(self, service_name, object_path):
+        return self.connection.get(service_name, object_path)
+
+
+def start_service(address, spokes):
+    """Publish the objects of the spokes in a new thread."""
+    bus = pydbus.connect(address)
+
+    for i in range(spokes):
+        bus.register_object(OBJECT_PATH.format(i), Spoke(), Spoke.__doc__)
+
+    bus.request_name(SERVICE_NAME)
+    loop = GLib.MainLoop()
+
+    thread = Thread(target=loop.run)
+    thread.daemon = True
+    thread.start()
+
+
+def refresh_hub(message_bus, spokes):
+    """Read the status of every spoke like the hub does."""
+    for i in range(spokes):
+        proxy = message_bus.get_proxy(SERVICE_NAME, OBJECT_PATH.format(i))
+        proxy.IsComplete  # pylint: disable=pointless-statement
+        proxy.Status  # pylint: disable=pointless-statement
+
+
+def measure(message_bus, spokes, refreshes):
+    """Return the mean latency of get_proxy in ms and the messages per refresh."""
+    counter = CountingConnection(message_bus.connection.con)
+    message_bus.connection.con = counter
+
+    start = time.perf_counter()
+    for _i in range(refreshes):
+        for j in range(spokes):
+            message_bus.get_proxy(SERVICE_NAME, OBJECT_PATH.format(j))
+    latency = (time.perf_counter() - start) * 1000 / (spokes * refreshes)
+
+    counter.messages = 0
+    for _i in range(refreshes):
+        refresh_hub(message_bus, spokes)
+
+    return latency, counter.messages / refreshes
+
+
+def main(spokes=20, refreshes=50):
+    daemon = subprocess.Popen(
+        ["dbus-daemon", "--session", "--nofork", "--print-address"],
+        stdout=subprocess.PIPE,
+        universal_newlines=True
+    )
+
+    try:
+        address = daemon.stdout.readline().strip()
+        start_service(address, spokes)
+
+        print("{:>10} {:>14} {:>20}".format("proxies", "latency [ms]", "messages / refresh"))
+
+        for name, message_bus in (("unpooled", UnpooledConnection(address)),
+                                  ("pooled", DBusConnection(address))):
+            latency, messages = measure(message_bus, spokes, refreshes)
+            print("{:>10} {:>14.3f} {:>20.1f}".format(name, latency, messages))
+            message_bus.disconnect()
+    finally:
+        daemon.terminate()
+        daemon.wait()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
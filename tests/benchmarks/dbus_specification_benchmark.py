@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+#
+# Copyright (C) 2019  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Measure the import time of the DBus interfaces of the modules with
+# the generated and with the precompiled DBus specifications.
+#
+# Usage: PYTHONPATH=. python3 tests/benchmarks/dbus_specification_benchmark.py [RUNS]
+#
+import os
+import subprocess
+import sys
+import tempfile
+
+from pyanaconda.dbus import precompiled
+
+IMPORT_SCRIPT = """
+import time
+start = time.perf_counter()
+
+from pyanaconda.dbus import precompiled
+precompiled._specifications = precompiled.load_specifications({path!r})
+
+{imports}
+print(time.perf_counter() - start)
+"""
+
+
+def get_interface_modules():
+    """Get names of the modules with DBus interfaces."""
+    return sorted({entry["module"] for entry in precompiled.collect_specifications().values()})
+
+
+def measure(path, modules):
+    """Import the modules in a new process and return the time in ms."""
+    script = IMPORT_SCRIPT.format(
+        path=path,
+        imports="\n".join("import {}".format(name) for name in modules)
+    )
+    output = subprocess.check_output([sys.executable, "-c", script], universal_newlines=True)
+    return float(output) * 1000
+
+
+def main(runs=10):
+    modules = get_interface_modules()
+
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "specifications.json")
+        precompiled.main(["--output", path])
+
+        print("{:>14} {:>12}".format("specifications", "import [ms]"))
+
+        for name, specifications in (("generated", "/nonexistent"), ("precompiled", path)):
+            times = [measure(specifications, modules) for _i in range(runs)]
+            print("{:>14} {:>12.1f}".format(name, min(times)))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,149 @@
+#!/usr/bin/python3
+#
+# Copyright (C) 2019  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Measure the time needed to create and apply DBus structures of a list
+# of data objects with the fields, with the codec and with the list API.
+#
+# Usage: PYTHONPATH=. python3 tests/benchmarks/dbus_structure_benchmark.py [COUNT]
+#
+import sys
+import time
+
+from pyanaconda.dbus.structure import dbus_structure, get_structure, apply_structure, \
+    get_structure_list, apply_structure_list, get_fields
+from pyanaconda.dbus.typing import *  # pylint: disable=wildcard-import
+from pyanaconda.dbus.typing import DBusType
+
+
+@dbus_structure
+class MountPointData(object):
+    """Data similar to the mount point requests."""
+
+    def __init__(self):
+        self._mount_point = ""
+        self._device_spec = ""
+        self._format_type = ""
+        self._size = 0
+        self._options = []
+
+    @property
+    def mount_point(self) -> Str:
+        return self._mount_point
+
+    @mount_point.setter
+    def mount_point(self, value):
+        self._mount_point = value
+
+    @property
+    def device_spec(self) -> Str:
+        return self._device_spec
+
+    @device_spec.setter
+    def device_spec(self, value):
+        self._device_spec = value
+
+    @property
+    def format_type(self) -> Str:
+        return self._format_type
+
+    @format_type.setter
+    def format_type(self, value):
+        self._format_type = value
+
+    @property
+    def size(self) -> UInt64:
+        return self._size
+
+    @size.setter
+    def size(self, value):
+        self._size = value
+
+    @property
+    def options(self) -> List[Str]:
+        return self._options
+
+    @options.setter
+    def options(self, value):
+        self._options = value
+
+
+def get_structure_with_fields(obj):
+    """Create the structure like before the codecs."""
+    return {
+        name: Variant(DBusType.get_dbus_representation(field.type_hint), field.get_data(obj))
+        for name, field in get_fields(obj).items()
+    }
+
+
+def apply_structure_with_fields(structure, obj):
+    """Apply the structure like before the codecs."""
+    fields = get_fields(obj)
+
+    for name, value in structure.items():
+        fields[name].set_data(obj, value)
+
+    return obj
+
+
+def create_data(count):
+    """Create a list of data objects."""
+    data = []
+
+    for i in range(count):
+        item = MountPointData()
+        item.mount_point = "/mnt/{}".format(i)
+        item.device_spec = "/dev/sda{}".format(i)
+        item.format_type = "xfs"
+        item.size = i * 1024
+        item.options = ["defaults", "noatime"]
+        data.append(item)
+
+    return data
+
+
+def measure(callback):
+    """Return the time in ms."""
+    start = time.perf_counter()
+    callback()
+    return (time.perf_counter() - start) * 1000
+
+
+def main(count=10000):
+    data = create_data(count)
+    structures = [{k: v.unpack() for k, v in get_structure(item).items()} for item in data]
+
+    print("{:>10} {:>12} {:>12}".format("method", "get [ms]", "apply [ms]"))
+
+    results = [
+        ("fields",
+         measure(lambda: [get_structure_with_fields(item) for item in data]),
+         measure(lambda: [apply_structure_with_fields(s, MountPointData()) for s in structures])),
+        ("codec",
+         measure(lambda: [get_structure(item) for item in data]),
+         measure(lambda: [apply_structure(s, MountPointData()) for s in structures])),
+        ("list",
+         measure(lambda: get_structure_list(data)),
+         measure(lambda: apply_structure_list(structures, MountPointData))),
+    ]
+
+    for name, get_time, apply_time in results:
+        print("{:>10} {:>12.1f} {:>12.1f}".format(name, get_time, apply_time))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
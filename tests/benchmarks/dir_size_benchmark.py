@@ -0,0 +1,86 @@
+#!/usr/bin/python3
+#
+# Copyright (C) 2019  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Measure the time needed to compute the size of a directory with the
+# walk based on os.listdir, with the walk based on os.scandir and from
+# the used space of the file system.
+#
+# Usage: PYTHONPATH=. python3 tests/benchmarks/dir_size_benchmark.py [DIRECTORY]
+#
+import os
+import stat
+import sys
+import time
+
+from pyanaconda.core.util import getDirSize
+
+
+def get_dir_size_with_listdir(directory):
+    """Get the size in kilobytes like before the os.scandir."""
+    def get_subdir_size(directory):
+        try:
+            mydev = os.lstat(directory)[stat.ST_DEV]
+            dirlist = os.listdir(directory)
+        except OSError:
+            return 0
+
+        dsize = 0
+        for f in dirlist:
+            curpath = '%s/%s' % (directory, f)
+            try:
+                sinfo = os.lstat(curpath)
+            except OSError:
+                continue
+
+            if stat.S_ISDIR(sinfo[stat.ST_MODE]):
+                if os.path.ismount(curpath):
+                    continue
+                if mydev == sinfo[stat.ST_DEV]:
+                    dsize += get_subdir_size(curpath)
+            elif stat.S_ISREG(sinfo[stat.ST_MODE]):
+                dsize += sinfo[stat.ST_SIZE]
+
+        return dsize
+    return get_subdir_size(directory) // 1024
+
+
+def get_used_space(directory):
+    """Get the used space of the file system in kilobytes."""
+    source = os.statvfs(directory)
+    return source.f_frsize * (source.f_blocks - source.f_bfree) // 1024
+
+
+def measure(callback, directory):
+    """Return the result and the time in ms."""
+    start = time.perf_counter()
+    result = callback(directory)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main(directory="/usr"):
+    print("{:>10} {:>14} {:>12}".format("method", "size [KiB]", "time [ms]"))
+
+    for name, callback in (("listdir", get_dir_size_with_listdir),
+                           ("scandir", getDirSize),
+                           ("statvfs", get_used_space)):
+        size, duration = measure(callback, directory)
+        print("{:>10} {:>14} {:>12.1f}".format(name, size, duration))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -0,0 +1,83 @@
+#!/usr/bin/python3
+#
+# Copyright (C) 2019  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# Measure the time and memory needed to copy the storage and to reset
+# it to a snapshot for a growing number of devices. A reset copies the
+# snapshot, a reset with dispose hands the snapshot over to the storage.
+#
+# Usage: PYTHONPATH=. python3 tests/benchmarks/storage_snapshot_benchmark.py [COUNT ...]
+#
+import sys
+import time
+import tracemalloc
+
+from blivet.devices import DiskDevice
+from blivet.formats import get_format
+from blivet.size import Size
+
+from pyanaconda.storage.osinstall import InstallerStorage
+from pyanaconda.storage.snapshot import StorageSnapshot
+
+DEFAULT_COUNTS = [10, 100, 500, 1000]
+
+
+def create_storage(count):
+    """Create a storage with the given number of formatted disks."""
+    storage = InstallerStorage()
+
+    for i in range(count):
+        disk = DiskDevice("disk%d" % i, size=Size("10 GiB"), exists=True)
+        disk.format = get_format("ext4", device=disk.path, exists=True)
+        storage.devicetree._add_device(disk)
+
+    return storage
+
+
+def measure(callback):
+    """Return the time in seconds and the peak of allocated memory in MiB."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    callback()
+    duration = time.perf_counter() - start
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration, peak / 1024 / 1024
+
+
+def main(counts):
+    print("{:>8} {:>12} {:>12} {:>12} {:>12}".format(
+        "devices", "copy [s]", "copy [MiB]", "reset [s]", "dispose [s]"
+    ))
+
+    for count in counts:
+        storage = create_storage(count)
+        copy_time, copy_memory = measure(storage.copy)
+
+        snapshot = StorageSnapshot(storage)
+        reset_time, _memory = measure(lambda: snapshot.reset_to_snapshot(storage))
+        dispose_time, _memory = measure(
+            lambda: snapshot.reset_to_snapshot(storage, dispose=True)
+        )
+
+        print("{:>8} {:>12.3f} {:>12.1f} {:>12.3f} {:>12.3f}".format(
+            count, copy_time, copy_memory, reset_time, dispose_time
+        ))
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_COUNTS)
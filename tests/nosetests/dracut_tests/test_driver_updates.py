@@ -15,7 +15,7 @@ import sys
 sys.path.append(os.path.normpath(os.path.dirname(__file__)+'/../../dracut'))
 
 from driver_updates import copy_files, move_files, iter_files, ensure_dir
-from driver_updates import append_line, mkdir_seq
+from driver_updates import append_line, mkdir_seq, merge_tree
 
 
 def touch(path):
@@ -174,6 +174,29 @@ class TestMoveFiles(FileTestCaseBase):
         self.assertEqual(set(iter_files(self.destdir)), files)
 
 
+class TestMergeTree(FileTestCaseBase):
+    def test_basic(self):
+        """merge_tree: move the tree into destdir"""
+        self.makefiles("src/file1", "src/subdir/file2", "dest/file3")
+        os.symlink("file1", self.srcdir+"link1")
+        merge_tree(self.srcdir, self.destdir)
+        self.assertEqual(set(listfiles(self.destdir)),
+                         set(["file1", "subdir/file2", "file3", "link1"]))
+        self.assertEqual(os.readlink(self.destdir+"link1"), "file1")
+        self.assertEqual(list(iter_files(self.srcdir)), [])
+
+    def test_overwrite(self):
+        """merge_tree: the files of the merged tree win"""
+        src, dest = self.makefiles("src/sub/file1", "dest/sub/file1")
+        with open(src, 'w') as outf:
+            outf.write("srcfile")
+        with open(dest, 'w') as outf:
+            outf.write("destfile")
+        merge_tree(self.srcdir, self.destdir)
+        self.assertEqual(list(listfiles(self.destdir)), ["sub/file1"])
+        self.assertEqual(open(dest).read(), "srcfile")
+
+
 class TestAppendLine(FileTestCaseBase):
     def test_empty(self):
         """append_line: create file + append \\n when needed"""
@@ -443,19 +466,37 @@ class DDUtilsTestCase(unittest.TestCase):
 
 from driver_updates import extract_drivers, grab_driver_files, load_drivers
 
+def fake_mkdtemp(prefix, dir):
+    fake_mkdtemp.count += 1
+    return "%s/%s%d" % (dir, prefix, fake_mkdtemp.count)
+fake_mkdtemp.count = 0
+
 @mock.patch("driver_updates.ensure_dir")
+@mock.patch("driver_updates.shutil.rmtree")
+@mock.patch("driver_updates.merge_tree")
+@mock.patch("driver_updates.tempfile.mkdtemp", side_effect=fake_mkdtemp)
 @mock.patch("driver_updates.save_repo")
 @mock.patch("driver_updates.append_line")
 @mock.patch("driver_updates.dd_extract")
 class ExtractDriversTestCase(unittest.TestCase):
-    def test_drivers(self, mock_extract, mock_append, mock_save, *args):
+    def setUp(self):
+        fake_mkdtemp.count = 0
+
+    def test_drivers(self, mock_extract, mock_append, mock_save, mock_mkdtemp,
+                     mock_merge, mock_rmtree, *args):
         """extract_drivers: save repo, write pkglist"""
         extract_drivers(drivers=[fake_enhancement, fake_module])
-        # extracts all listed modules
+        # extracts all listed modules into their own directories
         mock_extract.assert_has_calls([
-            mock.call(fake_enhancement.source, "/updates"),
-            mock.call(fake_module.source, "/updates")
+            mock.call(fake_enhancement.source, "/updates/.dd-extract-1"),
+            mock.call(fake_module.source, "/updates/.dd-extract-2")
         ], any_order=True)
+        # merges them in the given order and removes them
+        self.assertEqual(mock_merge.call_args_list, [
+            mock.call("/updates/.dd-extract-1", "/updates"),
+            mock.call("/updates/.dd-extract-2", "/updates")
+        ])
+        self.assertEqual(mock_rmtree.call_count, 2)
         pkglist = "/run/install/dd_packages"
         mock_append.assert_called_once_with(pkglist, fake_module.name)
         mock_save.assert_called_once_with(fake_module.repo)
@@ -464,7 +505,7 @@ class ExtractDriversTestCase(unittest.TestCase):
         """extract_drivers: extract selected drivers, don't save enhancements"""
         extract_drivers(drivers=[fake_enhancement])
         mock_extract.assert_called_once_with(
-            fake_enhancement.source, "/updates"
+            fake_enhancement.source, "/updates/.dd-extract-1"
         )
         self.assertFalse(mock_append.called)
         self.assertFalse(mock_save.called)
@@ -476,14 +517,86 @@ class ExtractDriversTestCase(unittest.TestCase):
             [fake_enhancement, fake_module]]):
             extract_drivers(repos=['enh_repo', 'mod_repo'])
         mock_extract.assert_has_calls([
-            mock.call(fake_enhancement.source, "/updates"),
-            mock.call(fake_enhancement.source, "/updates"),
-            mock.call(fake_module.source, "/updates")
-        ])
+            mock.call(fake_enhancement.source, "/updates/.dd-extract-1"),
+            mock.call(fake_enhancement.source, "/updates/.dd-extract-2"),
+            mock.call(fake_module.source, "/updates/.dd-extract-3")
+        ], any_order=True)
         pkglist = "/run/install/dd_packages"
         mock_append.assert_called_once_with(pkglist, fake_module.name)
         mock_save.assert_called_once_with(fake_module.repo)
 
+    def test_extract_failure(self, mock_extract, mock_append, mock_save, mock_mkdtemp,
+                             mock_merge, mock_rmtree, *args):
+        """extract_drivers: extract all drivers and raise the failure"""
+        def fake_extract(source, outdir):
+            if source == fake_enhancement.source:
+                raise OSError("failed")
+        mock_extract.side_effect = fake_extract
+        with self.assertRaises(OSError):
+            extract_drivers(drivers=[fake_enhancement, fake_module])
+        self.assertEqual(mock_extract.call_count, 2)
+        # nothing is merged, but the directories are removed
+        self.assertFalse(mock_merge.called)
+        self.assertEqual(mock_rmtree.call_count, 2)
+
+
+from driver_updates import list_modules_aliases, run_parallel
+
+modinfo_out = """filename:       /updates/lib/modules/funk.ko
+alias:          pci:v00008086d00001234sv*sd*bc*sc*i*
+alias:          pci:v00008086d00005678sv*sd*bc*sc*i*
+license:        GPL
+filename:       /updates/lib/modules/lolfs.ko.xz
+description:    LOL file system
+filename:       /updates/lib/modules/fs-lolfs.ko
+alias:          fs-lolfs
+"""
+
+class ListModulesAliasesTestCase(unittest.TestCase):
+    @mock.patch("driver_updates.subprocess.Popen")
+    def test_basic(self, popen):
+        """list_modules_aliases: call modinfo once and parse its output"""
+        popen.return_value.communicate.return_value = (modinfo_out, None)
+        popen.return_value.returncode = 0
+        modules = ["/updates/lib/modules/funk.ko",
+                   "/updates/lib/modules/lolfs.ko.xz",
+                   "/updates/lib/modules/fs-lolfs.ko"]
+        aliases = list_modules_aliases(modules)
+        self.assertEqual(popen.call_count, 1)
+        self.assertEqual(popen.call_args[0][0][0], "modinfo")
+        self.assertEqual(aliases, {
+            "/updates/lib/modules/funk.ko": [
+                "pci:v00008086d00001234sv*sd*bc*sc*i*",
+                "pci:v00008086d00005678sv*sd*bc*sc*i*",
+                "/updates/lib/modules/funk.ko"],
+            "/updates/lib/modules/lolfs.ko.xz": [
+                "/updates/lib/modules/lolfs.ko.xz"],
+            "/updates/lib/modules/fs-lolfs.ko": [
+                "fs-lolfs", "/updates/lib/modules/fs-lolfs.ko"],
+        })
+
+    @mock.patch("driver_updates.MODINFO_BATCH_SIZE", 2)
+    @mock.patch("driver_updates.subprocess.Popen")
+    def test_batches(self, popen):
+        """list_modules_aliases: split the modules into batches"""
+        popen.return_value.communicate.return_value = ("", None)
+        popen.return_value.returncode = 0
+        modules = ["/a.ko", "/b.ko", "/c.ko"]
+        aliases = list_modules_aliases(modules)
+        self.assertEqual(popen.call_count, 2)
+        self.assertEqual(aliases, {m: [m] for m in modules})
+
+class RunParallelTestCase(unittest.TestCase):
+    def test_basic(self):
+        """run_parallel: call the function for all items"""
+        results = []
+        run_parallel(results.append, range(10), 3)
+        self.assertEqual(sorted(results), list(range(10)))
+
+    def test_empty(self):
+        """run_parallel: do nothing for no items"""
+        run_parallel(self.fail, [], 3)
+
 
 class GrabDriverFilesTestCase(FileTestCaseBase):
     def test_basic(self):
@@ -501,7 +614,7 @@ class GrabDriverFilesTestCase(FileTestCaseBase):
         with mock.patch.multiple("driver_updates",
                                  MODULE_UPDATES_DIR=mod_upd_dir,
                                  FIRMWARE_UPDATES_DIR=fw_upd_dir,
-                                 list_aliases=lambda _x: []):
+                                 list_modules_aliases=lambda mods: {m: [] for m in mods}):
             moddict = grab_driver_files(outdir)
 
         self.assertEqual(moddict, {"funk": [], "lolfs": []})
@@ -0,0 +1,166 @@
+#
+# Copyright (C) 2019  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from mock import Mock
+
+from pyanaconda.dbus.pool import DBusProxyPool
+
+XML = """
+<node>
+  <interface name="my.example.Interface">
+    <method name="Hello">
+      <arg direction="in" name="name" type="s" />
+      <arg direction="out" name="return" type="s" />
+    </method>
+    <property name="Name" type="s" access="read" />
+  </interface>
+  <interface name="org.freedesktop.DBus.Introspectable">
+    <method name="Introspect">
+      <arg direction="out" name="return" type="s" />
+    </method>
+  </interface>
+</node>
+"""
+
+
+class DBusProxyPoolTestCase(unittest.TestCase):
+    """Test the pool of DBus proxies."""
+
+    def setUp(self):
+        self.message_bus = Mock()
+        self.call_sync = self.message_bus.connection.con.call_sync
+        self.call_sync.return_value.unpack.return_value = (XML,)
+        self.pool = DBusProxyPool(self.message_bus)
+
+    def get_proxy_test(self):
+        """Test the proxies are reused."""
+        proxy = self.pool.get_proxy("my.example", "/my/example/A")
+        self.assertEqual(proxy._bus_name, "my.example")
+        self.assertEqual(proxy._path, "/my/example/A")
+        # Don't read the property, it would call the remote object.
+        self.assertTrue(hasattr(type(proxy), "Hello"))
+        self.assertTrue(hasattr(type(proxy), "Name"))
+        self.assertIsNotNone(proxy["my.example.Interface"])
+        self.call_sync.assert_called_once()
+
+        self.assertIs(self.pool.get_proxy("my.example", "/my/example/A"), proxy)
+        self.call_sync.assert_called_once()
+
+        # Other objects have to be introspected, but share the class.
+        other = self.pool.get_proxy("my.example", "/my/example/B")
+        self.assertIsNot(other, proxy)
+        self.assertIs(type(other), type(proxy))
+        self.assertEqual(self.call_sync.call_count, 2)
+
+    def invalid_object_test(self):
+        """Test the proxy of an invalid object."""
+        self.call_sync.return_value = None
+
+        with self.assertRaises(KeyError):
+            self.pool.get_proxy("my.example", "/my/example/A")
+
+        self.call_sync.return_value = Mock()
+        self.call_sync.return_value.unpack.return_value = ("<node></node>",)
+
+        with self.assertRaises(KeyError):
+            self.pool.get_proxy("my.example", "/my/example/A")
+
+    def name_owner_changed_test(self):
+        """Test the proxies are dropped if the owner of the service changes."""
+        subscribe = self.message_bus.connection.subscribe
+        proxy = self.pool.get_proxy("my.example", "/my/example/A")
+        self.pool.get_proxy("my.example", "/my/example/B")
+        self.pool.get_proxy("my.other", "/my/other")
+        self.assertEqual(self.call_sync.call_count, 3)
+
+        # Only the pooled services are watched.
+        self.assertEqual(subscribe.call_count, 2)
+        self.assertEqual(
+            [c[1]["arg0"] for c in subscribe.call_args_list],
+            ["my.example", "my.other"]
+        )
+
+        callback = subscribe.call_args_list[0][1]["signal_fired"]
+        callback(None, None, None, None, ("my.example", ":1.1", ":1.2"))
+
+        self.assertIsNot(self.pool.get_proxy("my.example", "/my/example/A"), proxy)
+        self.pool.get_proxy("my.other", "/my/other")
+        self.assertEqual(self.call_sync.call_count, 4)
+        self.assertEqual(subscribe.call_count, 2)
+
+    def owner_changed_during_introspection_test(self):
+        """Test a proxy created during the change of the owner."""
+        def introspect(*args):
+            self.pool.invalidate("my.example")
+            return Mock(unpack=Mock(return_value=(XML,)))
+
+        self.call_sync.side_effect = introspect
+        self.pool.get_proxy("my.example", "/my/example/A")
+
+        # The proxy wasn't cached.
+        self.call_sync.side_effect = None
+        self.pool.get_proxy("my.example", "/my/example/A")
+        self.pool.get_proxy("my.example", "/my/example/A")
+        self.assertEqual(self.call_sync.call_count, 2)
+
+    def task_proxy_test(self):
+        """Test the proxies of tasks are not pooled."""
+        subscribe = self.message_bus.connection.subscribe
+        proxy = self.pool.get_proxy("my.example", "/my/example/Tasks/1")
+        self.assertEqual(proxy._path, "/my/example/Tasks/1")
+
+        self.assertIsNot(self.pool.get_proxy("my.example", "/my/example/Tasks/1"), proxy)
+        self.pool.get_proxy("my.example", "/my/example/Tasks/2")
+        self.assertEqual(self.call_sync.call_count, 3)
+        subscribe.assert_not_called()
+
+    def max_size_test(self):
+        """Test the least recently used proxies are dropped."""
+        self.pool = DBusProxyPool(self.message_bus, max_size=2)
+        proxy_a = self.pool.get_proxy("my.example", "/my/example/A")
+        proxy_b = self.pool.get_proxy("my.example", "/my/example/B")
+
+        # Use the proxy A, so the proxy B is dropped.
+        self.assertIs(self.pool.get_proxy("my.example", "/my/example/A"), proxy_a)
+        self.pool.get_proxy("my.example", "/my/example/C")
+        self.assertEqual(self.call_sync.call_count, 3)
+
+        self.assertIs(self.pool.get_proxy("my.example", "/my/example/A"), proxy_a)
+        self.assertEqual(self.call_sync.call_count, 3)
+
+        self.assertIsNot(self.pool.get_proxy("my.example", "/my/example/B"), proxy_b)
+        self.assertEqual(self.call_sync.call_count, 4)
+
+    def clear_test(self):
+        """Test the pool can be cleared."""
+        subscription = self.message_bus.connection.subscribe.return_value
+        proxy = self.pool.get_proxy("my.example", "/my/example/A")
+
+        self.pool.clear()
+        subscription.unsubscribe.assert_called_once_with()
+        self.assertIsNot(self.pool.get_proxy("my.example", "/my/example/A"), proxy)
+
+    def threads_test(self):
+        """Test the pool can be shared by threads."""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            proxies = list(executor.map(
+                lambda _: self.pool.get_proxy("my.example", "/my/example/A"), range(32)
+            ))
+
+        self.assertTrue(all(proxy is proxies[0] for proxy in proxies))
@@ -0,0 +1,165 @@
+#
+# Copyright (C) 2019  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pyanaconda.dbus import precompiled
+from pyanaconda.dbus.interface import dbus_interface
+from pyanaconda.dbus.precompiled import collect_specifications, verify_specifications, \
+    load_specifications
+from pyanaconda.dbus.typing import *  # pylint: disable=wildcard-import
+
+
+class PrecompiledSpecificationTestCase(unittest.TestCase):
+    """Test the precompiled DBus specifications."""
+
+    def setUp(self):
+        self.maxDiff = None
+
+    def load_test(self):
+        """Test the loading of the precompiled specifications."""
+        self.assertEqual(load_specifications("/nonexistent/specifications.json"), {})
+
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "specifications.json")
+            specifications = {
+                "a.B": {"module": "a", "interface": None, "hash": "0", "xml": "<node/>"}
+            }
+
+            with open(path, "wt") as f:
+                json.dump({"specifications": specifications}, f)
+
+            self.assertEqual(load_specifications(path), specifications)
+
+            with open(path, "wt") as f:
+                f.write("invalid")
+
+            self.assertEqual(load_specifications(path), {})
+
+    def decorator_test(self):
+        """Test that the decorator uses the precompiled specifications."""
+        class_id = "{}.{}.decorator_test.<locals>.Example".format(
+            __name__, self.__class__.__qualname__
+        )
+        specifications = {
+            class_id: {"module": __name__, "interface": "my.Example", "hash": "0",
+                       "xml": "<node />"}
+        }
+
+        with patch("pyanaconda.dbus.precompiled._specifications", specifications), \
+                patch("pyanaconda.dbus.precompiled._get_source_hash", return_value="0") as h:
+
+            @dbus_interface("my.Example")
+            class Example(object):
+
+                def Method(self, x: Int):
+                    pass
+
+            self.assertEqual(Example.dbus, "<node />")
+
+            # The specification is for a different interface.
+            @dbus_interface("my.Other")
+            class Example(object):  # pylint: disable=function-redefined
+
+                def Method(self, x: Int):
+                    pass
+
+            self.assertIn("my.Other", Example.dbus)
+            self.assertIn("Method", Example.dbus)
+
+            # The sources of the class have changed.
+            h.return_value = "1"
+
+            @dbus_interface("my.Example")
+            class Example(object):  # pylint: disable=function-redefined
+
+                def Method(self, x: Int):
+                    pass
+
+            self.assertIn("my.Example", Example.dbus)
+            self.assertIn("Method", Example.dbus)
+
+    def source_hash_test(self):
+        """Test the hashes of the sources of the classes."""
+        from pyanaconda.modules.timezone.timezone_interface import TimezoneInterface
+        source_hash = precompiled._get_source_hash(TimezoneInterface)
+        self.assertIsNotNone(source_hash)
+        self.assertEqual(precompiled._get_source_hash(TimezoneInterface), source_hash)
+
+        # The source of one of the modules has changed.
+        with patch("pyanaconda.dbus.precompiled._get_file_hash",
+                   side_effect=lambda path: "0" if path.endswith("typing.py") else path):
+            other_hash = precompiled._get_source_hash(TimezoneInterface)
+
+        with patch("pyanaconda.dbus.precompiled._get_file_hash",
+                   side_effect=lambda path: "1" if path.endswith("typing.py") else path):
+            self.assertNotEqual(precompiled._get_source_hash(TimezoneInterface), other_hash)
+
+        # The source can't be read.
+        with patch("pyanaconda.dbus.precompiled._get_file_hash", return_value=None):
+            self.assertIsNone(precompiled._get_source_hash(TimezoneInterface))
+
+    def verify_test(self):
+        """Test that the precompiled specifications match the generated ones."""
+        specifications = collect_specifications()
+        self.assertIn("pyanaconda.modules.boss.boss_interface.AnacondaBossInterface",
+                      specifications)
+        self.assertEqual(verify_specifications(specifications), [])
+
+        # Change one of the specifications.
+        class_id = sorted(specifications.keys())[0]
+        specifications[class_id] = dict(specifications[class_id], xml="<node />")
+        self.assertEqual(verify_specifications(specifications), [class_id])
+
+        # Remove the class.
+        specifications["pyanaconda.Invalid"] = {"module": "pyanaconda",
+                                                "interface": None,
+                                                "xml": "<node />"}
+        self.assertEqual(verify_specifications(specifications), ["pyanaconda.Invalid",
+                                                                 class_id])
+
+    def main_test(self):
+        """Test the generation and verification of the file."""
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "specifications.json")
+
+            self.assertEqual(precompiled.main(["--output", path, "pyanaconda.modules.timezone"]), 0)
+
+            with open(path, "rt") as f:
+                data = json.load(f)
+
+            self.assertIn("pyanaconda.modules.timezone.timezone_interface.TimezoneInterface",
+                          data["specifications"])
+            self.assertEqual(precompiled.main(["--verify", path]), 0)
+
+    def stale_specification_test(self):
+        """Test that the classes with stale specifications are generated again."""
+        from pyanaconda.modules.common.base import KickstartModuleInterface
+        from pyanaconda.modules.timezone.timezone_interface import TimezoneInterface
+        expected = collect_specifications(["pyanaconda.modules.timezone"])
+
+        # The specifications of the class and its base class are out of date.
+        with patch.object(TimezoneInterface, "dbus", "<node />"), \
+                patch.object(KickstartModuleInterface, "dbus", "<node />"):
+            specifications = collect_specifications(["pyanaconda.modules.timezone"])
+            self.assertEqual(verify_specifications(specifications), [])
+
+        self.assertEqual(specifications, expected)
@@ -21,7 +21,7 @@ import unittest
 
 from pyanaconda.dbus.typing import *  # pylint: disable=wildcard-import
 from pyanaconda.dbus.structure import dbus_structure, get_structure, apply_structure, \
-    DBusStructureError
+    get_structure_list, apply_structure_list, DBusStructureError
 
 
 class DBusStructureTestCase(unittest.TestCase):
@@ -288,3 +288,41 @@ class DBusStructureTestCase(unittest.TestCase):
         data.c = [True, False]
 
         self.assertEqual(repr(data), "StringData(a=123, b='HELLO', c=[True, False])")
+
+    def get_structure_list_test(self):
+        self.assertEqual(get_structure_list([]), [])
+
+        data = [self.ComplicatedData() for _i in range(3)]
+
+        for i, item in enumerate(data):
+            item.dictionary = {i: str(i)}
+            item.bool_list = [bool(i)]
+            item.very_long_property_name = "Item {}".format(i)
+
+        self.assertEqual(
+            get_structure_list(data),
+            [get_structure(item) for item in data]
+        )
+
+    def apply_structure_list_test(self):
+        self.assertEqual(apply_structure_list([], self.SimpleData), [])
+
+        data = apply_structure_list([{'x': 1}, {'x': 2}, {}], self.SimpleData)
+        self.assertEqual([type(item) for item in data], [self.SimpleData] * 3)
+        self.assertEqual([item.x for item in data], [1, 2, 0])
+
+        with self.assertRaises(DBusStructureError) as cm:
+            apply_structure_list([{'x': 1}, {'y': 2}], self.SimpleData)
+
+        self.assertEqual(str(cm.exception), "Field 'y' doesn't exist.")
+
+    def invalid_structure_list_test(self):
+        with self.assertRaises(DBusStructureError) as cm:
+            get_structure_list([self.InvalidData()])
+
+        self.assertEqual(str(cm.exception), """Fields are not defined at '__dbus_fields__'.""")
+
+        with self.assertRaises(DBusStructureError) as cm:
+            apply_structure_list([{'x': 1}], self.InvalidData)
+
+        self.assertEqual(str(cm.exception), """Fields are not defined at '__dbus_fields__'.""")
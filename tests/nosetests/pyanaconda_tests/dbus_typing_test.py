@@ -124,6 +124,20 @@ class DBusTypingTests(unittest.TestCase):
         self._compare(Dict[Str, Tuple[Int, Int, Double]], "a{s(iid)}")
         self._compare(Dict[Str, Tuple[Int, Int, Dict[Int, Str]]], "a{s(iia{is})}")
 
+    def cache_test(self):
+        """Test the cache of DBus types."""
+        get_dbus_type.cache_clear()
+
+        self._compare(List[Tuple[Int, Str]], "a(is)")
+        self.assertEqual(get_dbus_type.cache_info().misses, 1)
+
+        self._compare(List[Tuple[Int, Str]], "a(is)")
+        self.assertEqual(get_dbus_type.cache_info().hits, 1)
+
+        self._compare(List[Tuple[Int32, Str]], "a(is)")
+        self._compare(List[Tuple[UInt32, Str]], "a(us)")
+        self.assertEqual(get_dbus_type.cache_info().misses, 3)
+
 
 class DBusTypingVariantTests(unittest.TestCase):
 
@@ -0,0 +1,175 @@
+#
+# Copyright (C) 2019  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import unittest
+from mock import Mock
+
+from pyanaconda.ui.lib.network import DeviceConfigurationIndex
+
+
+def _device(udi, iface):
+    device = Mock()
+    device.get_udi.return_value = udi
+    device.get_iface.return_value = iface
+    return device
+
+
+class FakeDeviceConfiguration(object):
+    """A device configuration that updates the index like the real one."""
+
+    def __init__(self, uuid=None, device=None):
+        self._uuid = uuid
+        self._device = device
+        self.index = None
+
+    @property
+    def device(self):
+        return self._device
+
+    @device.setter
+    def device(self, device):
+        self._device = device
+        if self.index:
+            self.index.update(self)
+
+    def get_uuid(self):
+        return self._uuid
+
+    def set_uuid(self, uuid):
+        self._uuid = uuid
+        if self.index:
+            self.index.update(self)
+
+
+class DeviceConfigurationIndexTestCase(unittest.TestCase):
+    """Test the index of device configurations."""
+
+    def setUp(self):
+        self.index = DeviceConfigurationIndex()
+
+    def add_test(self):
+        """Test the addition of device configurations."""
+        device = _device("/devices/1", "ens3")
+        dev_cfg = FakeDeviceConfiguration("uuid-1", device)
+        self.index.add(dev_cfg)
+
+        self.assertIs(dev_cfg.index, self.index)
+        self.assertIs(self.index.find(uuid="uuid-1"), dev_cfg)
+        self.assertIs(self.index.find(device=device), dev_cfg)
+        self.assertIs(self.index.find(iface="ens3"), dev_cfg)
+        self.assertIs(self.index.find(uuid="uuid-1", device=device, iface="ens3"), dev_cfg)
+
+        self.assertIsNone(self.index.find(uuid="uuid-2"))
+        self.assertIsNone(self.index.find(uuid="uuid-1", iface="ens4"))
+        self.assertIsNone(self.index.find())
+
+        # A connection without a device.
+        other = FakeDeviceConfiguration("uuid-2")
+        self.index.add(other)
+        self.assertIs(self.index.find(uuid="uuid-2"), other)
+        self.assertIs(self.index.find(iface="ens3"), dev_cfg)
+
+    def update_test(self):
+        """Test the updates of device configurations."""
+        dev_cfg = FakeDeviceConfiguration("uuid-1")
+        self.index.add(dev_cfg)
+        self.assertIsNone(self.index.find(iface="ens3"))
+
+        device = _device("/devices/1", "ens3")
+        dev_cfg.device = device
+        self.assertIs(self.index.find(iface="ens3"), dev_cfg)
+        self.assertIs(self.index.find(uuid="uuid-1", device=device), dev_cfg)
+
+        dev_cfg.set_uuid("uuid-2")
+        self.assertIsNone(self.index.find(uuid="uuid-1"))
+        self.assertIs(self.index.find(uuid="uuid-2", iface="ens3"), dev_cfg)
+
+        dev_cfg.device = None
+        self.assertIsNone(self.index.find(iface="ens3"))
+        self.assertIsNone(self.index.find(device=device))
+        self.assertIs(self.index.find(uuid="uuid-2"), dev_cfg)
+
+    def remove_test(self):
+        """Test the removal of device configurations."""
+        device = _device("/devices/1", "ens3")
+        dev_cfg = FakeDeviceConfiguration("uuid-1", device)
+        self.index.add(dev_cfg)
+        self.index.remove(dev_cfg)
+
+        self.assertIsNone(dev_cfg.index)
+        self.assertIsNone(self.index.find(uuid="uuid-1"))
+        self.assertIsNone(self.index.find(device=device))
+        self.assertIsNone(self.index.find(iface="ens3"))
+
+        # The removed configuration doesn't update the index.
+        dev_cfg.set_uuid("uuid-2")
+        self.assertIsNone(self.index.find(uuid="uuid-2"))
+
+        # Remove a configuration that shares the keys.
+        first = FakeDeviceConfiguration("uuid-1", device)
+        second = FakeDeviceConfiguration("uuid-2", device)
+        self.index.add(first)
+        self.index.add(second)
+        self.index.remove(first)
+        self.assertIs(self.index.find(iface="ens3"), second)
+
+    def order_test(self):
+        """Test that the first added device configuration is found."""
+        device = _device("/devices/1", "ens3")
+        first = FakeDeviceConfiguration("uuid-1", device)
+        second = FakeDeviceConfiguration("uuid-2", device)
+        self.index.add(first)
+        self.index.add(second)
+        self.assertIs(self.index.find(iface="ens3"), first)
+
+        # The update doesn't move the configuration to the end.
+        first.device = _device("/devices/1", "ens3")
+        self.assertIs(self.index.find(iface="ens3"), first)
+        self.assertIs(self.index.find(device=device), first)
+
+        # The order of the first searched key doesn't matter.
+        first.set_uuid("uuid-3")
+        second.set_uuid("uuid-3")
+        first.set_uuid("uuid-3")
+        self.assertIs(self.index.find(uuid="uuid-3", iface="ens3"), first)
+
+        # A configuration added again is the last one.
+        self.index.remove(first)
+        self.index.add(first)
+        self.assertIs(self.index.find(iface="ens3"), second)
+
+    def store_order_test(self):
+        """Test that the first device configuration in the store is found."""
+        store = []
+        index = DeviceConfigurationIndex(get_order=lambda: iter(store))
+
+        device = _device("/devices/1", "ens3")
+        first = FakeDeviceConfiguration("uuid-1", device)
+        second = FakeDeviceConfiguration("uuid-2", device)
+
+        for dev_cfg in (first, second):
+            store.append(dev_cfg)
+            index.add(dev_cfg)
+
+        self.assertIs(index.find(iface="ens3"), first)
+        self.assertIs(index.find(uuid="uuid-2", iface="ens3"), second)
+
+        # The store was sorted.
+        store.reverse()
+        self.assertIs(index.find(iface="ens3"), second)
+        self.assertIs(index.find(device=device), second)
+        self.assertIs(index.find(uuid="uuid-1", iface="ens3"), first)
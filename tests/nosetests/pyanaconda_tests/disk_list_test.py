@@ -0,0 +1,112 @@
+#
+# Copyright (C) 2019  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import unittest
+
+from blivet.size import Size
+
+from pyanaconda.ui.lib.disks import FakeDisk, DiskListPager, DiskSelectionSummary
+
+
+class DiskListTestCase(unittest.TestCase):
+    """Test the helpers for long lists of disks."""
+
+    def _get_disks(self, count):
+        disks = []
+
+        for i in range(count):
+            disk = FakeDisk("sd{}".format(i), size=Size("{} GiB".format(i + 1)),
+                            vendor="Vendor{}".format(i % 2), model="Model")
+            disk.wwn = "0x5000{:04d}".format(i)
+            disks.append(disk)
+
+        return disks
+
+    def _get_names(self, disks):
+        return [d.name for d in disks]
+
+    def pages_test(self):
+        """Test the pages of disks."""
+        pager = DiskListPager(page_size=2)
+        self.assertEqual(pager.disks, [])
+        self.assertEqual(pager.page_count, 1)
+
+        pager.set_disks(self._get_disks(5))
+        self.assertEqual(pager.page_count, 3)
+        self.assertEqual(self._get_names(pager.disks), ["sd0", "sd1"])
+
+        self.assertFalse(pager.previous_page())
+        self.assertTrue(pager.next_page())
+        self.assertTrue(pager.next_page())
+        self.assertEqual(self._get_names(pager.disks), ["sd4"])
+
+        self.assertFalse(pager.next_page())
+        self.assertEqual(pager.page, 2)
+
+        self.assertTrue(pager.previous_page())
+        self.assertEqual(self._get_names(pager.disks), ["sd2", "sd3"])
+
+    def filter_test(self):
+        """Test the filter of disks."""
+        pager = DiskListPager(page_size=2)
+        pager.set_disks(self._get_disks(5))
+        pager.next_page()
+
+        pager.set_filter("vendor1")
+        self.assertEqual(pager.page, 0)
+        self.assertEqual(self._get_names(pager.matches), ["sd1", "sd3"])
+
+        pager.set_filter("0X50000004")
+        self.assertEqual(self._get_names(pager.matches), ["sd4"])
+
+        pager.set_filter("> 3 GiB")
+        self.assertEqual(self._get_names(pager.matches), ["sd3", "sd4"])
+
+        pager.set_filter("<2 GiB")
+        self.assertEqual(self._get_names(pager.matches), ["sd0"])
+
+        pager.set_filter("nothing")
+        self.assertEqual(pager.matches, [])
+        self.assertEqual(pager.page_count, 1)
+
+        pager.set_filter(" ")
+        self.assertEqual(pager.filter, "")
+        self.assertEqual(len(pager.matches), 5)
+
+    def summary_test(self):
+        """Test the summary of the selected disks."""
+        disks = self._get_disks(3)
+        free_space = {d.name: (Size("1 GiB"), Size(0)) for d in disks}
+
+        summary = DiskSelectionSummary(disks, ["sd1", "sdx"], free_space)
+        self.assertEqual(summary.count, 1)
+        self.assertEqual(summary.capacity, Size("2 GiB"))
+        self.assertEqual(summary.free, Size("1 GiB"))
+        self.assertTrue(summary.is_selected(disks[1]))
+
+        summary.select(disks[2])
+        summary.select(disks[2])
+        self.assertEqual(summary.count, 2)
+        self.assertEqual(summary.capacity, Size("5 GiB"))
+        self.assertEqual(summary.free, Size("2 GiB"))
+
+        summary.deselect(disks[1])
+        summary.deselect(disks[0])
+        self.assertEqual(summary.count, 1)
+        self.assertEqual(summary.capacity, Size("3 GiB"))
+        self.assertEqual(summary.free, Size("1 GiB"))
+        self.assertFalse(summary.is_selected(disks[1]))
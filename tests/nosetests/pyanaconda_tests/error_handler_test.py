@@ -0,0 +1,98 @@
+#
+# Copyright (C) 2019  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import unittest
+import unittest
+from threading import Thread
+from mock import Mock, patch
+
+from blivet.errors import DiskLabelScanError
+
+from pyanaconda.errors import ErrorHandler, ERROR_RAISE, ERROR_RETRY
+from pyanaconda.storage.osinstall import storage_initialize
+
+
+class ErrorHandlerTestCase(unittest.TestCase):
+    """Test the error handler."""
+
+    TIMEOUT = 3
+
+    def setUp(self):
+        self.handler = ErrorHandler()
+
+    def no_ui_test(self):
+        """Test the error handling without the UI."""
+        with self.assertRaises(DiskLabelScanError):
+            self.handler.cb(DiskLabelScanError("Fake error."))
+
+        # The main thread doesn't wait for the UI.
+        self.handler.defer()
+
+        with self.assertRaises(DiskLabelScanError):
+            self.handler.cb(DiskLabelScanError("Fake error."))
+
+    @patch("pyanaconda.storage.osinstall._platform")
+    @patch("pyanaconda.storage.osinstall.update_blivet_flags")
+    def storage_initialize_before_ui_test(self, update_flags, platform):
+        """Test an error of the storage initialization before the UI exists."""
+        storage = Mock()
+        storage.reset.side_effect = [DiskLabelScanError("Fake error."), None]
+        storage.devices = []
+
+        ui = Mock()
+        ui.showDetailedError.return_value = True
+        results = []
+
+        def initialize():
+            try:
+                storage_initialize(storage, Mock(), [])
+            except Exception as e:  # pylint: disable=broad-except
+                results.append(e)
+            else:
+                results.append(None)
+
+        self.handler.defer()
+
+        with patch("pyanaconda.storage.osinstall.error_handler", self.handler):
+            thread = Thread(target=initialize)
+            thread.start()
+
+            # The error waits for the UI.
+            thread.join(0.5)
+            self.assertTrue(thread.is_alive())
+            self.assertEqual(storage.reset.call_count, 1)
+
+            # Set up the UI.
+            self.handler.ui = ui
+            self.handler.set_ready()
+
+            thread.join(self.TIMEOUT)
+            self.assertFalse(thread.is_alive())
+
+        # The error was reported and the storage was reset again.
+        self.assertEqual(results, [None])
+        ui.showDetailedError.assert_called_once()
+        self.assertEqual(storage.reset.call_count, 2)
+
+    def storage_reset_handler_test(self):
+        """Test the handler of the storage reset errors."""
+        self.handler.ui = Mock()
+        self.handler.ui.showDetailedError.return_value = True
+        self.assertEqual(self.handler.cb(DiskLabelScanError("Fake error.")), ERROR_RETRY)
+
+        self.handler.ui.showDetailedError.return_value = False
+        self.assertEqual(self.handler.cb(DiskLabelScanError("Fake error.")), ERROR_RAISE)
@@ -0,0 +1,98 @@
+#
+# Copyright (C) 2019  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pyanaconda.exception import BoundedSection, CrashDumpBudget, collect_section, \
+    get_file_callback
+
+
+class CrashDumpTestCase(unittest.TestCase):
+    """Test the collection of the crash dump."""
+
+    def _get_lines(self, count):
+        return ["line {}\n".format(i) for i in range(count)]
+
+    def section_test(self):
+        """Test a section that fits."""
+        section = BoundedSection(max_size=100, head_size=10)
+
+        for line in self._get_lines(5):
+            section.add_line(line)
+
+        self.assertEqual(section.dropped, 0)
+        self.assertEqual(section.get_text(), "".join(self._get_lines(5)))
+
+    def truncated_section_test(self):
+        """Test a truncated section."""
+        section = BoundedSection(max_size=28, head_size=14)
+
+        for line in self._get_lines(10):
+            section.add_line(line)
+
+        self.assertEqual(section.dropped, 6)
+        self.assertEqual(section.get_text(),
+                         "line 0\nline 1\n"
+                         "\n[... 6 lines truncated ...]\n\n"
+                         "line 8\nline 9\n")
+
+    def long_line_test(self):
+        """Test a line longer than the section."""
+        section = BoundedSection(max_size=10, head_size=0)
+        section.add_line("x" * 100 + "end\n")
+
+        self.assertEqual(section.dropped, 1)
+        self.assertTrue(section.get_text().endswith("xxxxxxend\n"))
+
+    def budget_test(self):
+        """Test the time budget."""
+        budget = CrashDumpBudget(timeout=10)
+
+        with patch("pyanaconda.exception.time.monotonic", return_value=100):
+            self.assertFalse(budget.expired)
+
+        with patch("pyanaconda.exception.time.monotonic", return_value=111):
+            self.assertTrue(budget.expired)
+
+            budget.start()
+            self.assertFalse(budget.expired)
+
+    def interrupted_section_test(self):
+        """Test a section interrupted by the time budget."""
+        budget = CrashDumpBudget(timeout=0)
+        budget.start()
+
+        with patch("pyanaconda.exception.time.monotonic", return_value=float("inf")):
+            text = collect_section(iter(self._get_lines(10)), budget=budget)
+
+        self.assertEqual(text, "\n[... interrupted, the time budget has been spent ...]\n")
+
+    def file_callback_test(self):
+        """Test the callback of a log file."""
+        self.assertEqual(get_file_callback("/nonexistent/file.log")(), "")
+
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "program.log")
+
+            with open(path, "wt") as f:
+                f.writelines(self._get_lines(3))
+
+            with patch("pyanaconda.exception.crash_dump_budget", CrashDumpBudget()):
+                self.assertEqual(get_file_callback(path)(), "line 0\nline 1\nline 2\n")
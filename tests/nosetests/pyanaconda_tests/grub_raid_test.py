@@ -23,6 +23,7 @@ from blivet.devicelibs.raid import RAID1
 from blivet.formats import get_format
 from blivet.size import Size
 
+from pyanaconda.bootloader.base import BootLoaderError
 from pyanaconda.bootloader.grub import GRUB
 
 import unittest
@@ -165,3 +166,35 @@ class GRUBRaidSimpleTest(unittest.TestCase):
         expected_targets = set([(self.sda1, self.boot_btrfs)])
 
         self.assertEqual(install_targets, expected_targets)
+
+    def install_to_targets_test(self):
+        """Test installing to the targets of a mirrored boot set."""
+        installed = []
+
+        def install_target(stage1dev, stage2dev):
+            installed.append((stage1dev, stage2dev))
+
+        targets = [(self.sda, self.boot_md), (self.sdb, self.boot_md), (self.sda1, self.boot_md)]
+        self.grub.install_to_targets(targets, install_target)
+
+        # The targets are installed in the given order.
+        self.assertEqual(installed, targets)
+
+    def install_to_targets_failure_test(self):
+        """Test failures of the installation to the targets."""
+        installed = []
+
+        def install_target(stage1dev, stage2dev):
+            if stage1dev == self.sda:
+                raise BootLoaderError("failed")
+
+            installed.append((stage1dev, stage2dev))
+
+        targets = [(self.sda, self.boot_md), (self.sdb, self.boot_md)]
+
+        with self.assertRaises(BootLoaderError) as cm:
+            self.grub.install_to_targets(targets, install_target)
+
+        # All targets are processed and the errors are reported.
+        self.assertEqual(installed, [(self.sdb, self.boot_md)])
+        self.assertIn("sda: failed", str(cm.exception))
@@ -0,0 +1,134 @@
+#
+# Copyright (C) 2019  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pyanaconda import image
+from pyanaconda.iso9660 import ISO_BLOCK_SIZE
+from tests.nosetests.pyanaconda_tests.iso9660_test import write_iso_image, ISO_FILES
+
+
+class FindIsoImageTestCase(unittest.TestCase):
+    """Test the discovery of ISO images."""
+
+    def setUp(self):
+        image._iso_checks.clear()
+
+    def tearDown(self):
+        image._iso_checks.clear()
+
+    def first_image_test(self):
+        """Test the order of the found images."""
+        with tempfile.TemporaryDirectory() as d:
+            for name in ("a.iso", "b.iso", "c.iso"):
+                open(os.path.join(d, name), "wb").close()
+
+            valid = {os.path.join(d, "b.iso"), os.path.join(d, "c.iso")}
+
+            with patch("pyanaconda.image._check_iso_image", side_effect=valid.__contains__), \
+                    patch("pyanaconda.image.os.listdir", return_value=["a.iso", "b.iso", "c.iso"]):
+                self.assertEqual(image.findFirstIsoImage(d), "b.iso")
+
+            self.assertEqual(image.findFirstIsoImage("/nonexistent"), None)
+
+    def cached_check_test(self):
+        """Test the cached checks of the images."""
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "a.iso")
+            open(path, "wb").close()
+
+            with patch("pyanaconda.image._check_iso_image", return_value=True) as check:
+                self.assertEqual(image.findFirstIsoImage(path), "a.iso")
+                self.assertEqual(image.findFirstIsoImage(d), "a.iso")
+                check.assert_called_once_with(path)
+
+                # The image has changed.
+                with open(path, "wb") as f:
+                    f.write(bytes(ISO_BLOCK_SIZE))
+
+                self.assertEqual(image.findFirstIsoImage(d), "a.iso")
+                self.assertEqual(check.call_count, 2)
+
+    def transient_check_test(self):
+        """Test that the failed checks are not cached."""
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "a.iso")
+            open(path, "wb").close()
+
+            with patch("pyanaconda.image._check_iso_image", return_value=None) as check:
+                self.assertEqual(image.findFirstIsoImage(d), None)
+                self.assertEqual(image.findFirstIsoImage(d), None)
+                self.assertEqual(check.call_count, 2)
+
+            with patch("pyanaconda.image._check_iso_image", return_value=False) as check:
+                self.assertEqual(image.findFirstIsoImage(d), None)
+                self.assertEqual(image.findFirstIsoImage(d), None)
+                check.assert_called_once_with(path)
+
+    def mount_failure_test(self):
+        """Test the check of an image that can't be mounted."""
+        with patch("pyanaconda.image.blivet.util.mount", side_effect=OSError("Fake")), \
+                patch("pyanaconda.image.blivet.util.umount") as umount:
+            self.assertIsNone(image._check_mounted_iso_image("/nonexistent/a.iso"))
+            umount.assert_not_called()
+
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "a.iso")
+
+            # The image isn't readable.
+            with patch("pyanaconda.image.isys.isIsoImage", return_value=False):
+                self.assertIsNone(image._check_iso_image(path))
+
+                open(path, "wb").close()
+                self.assertFalse(image._check_iso_image(path))
+
+    def unmounted_check_test(self):
+        """Test the check of an image without mounting it."""
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "test.iso")
+            write_iso_image(path, ISO_FILES)
+
+            with patch("pyanaconda.image._check_mounted_iso_image") as mounted, \
+                    patch("pyanaconda.image._check_disc_arch", return_value=True), \
+                    patch("pyanaconda.image.DiscInfo"), \
+                    patch("pyanaconda.payload.install_tree_metadata.InstallTreeMetadata") \
+                    as metadata:
+                metadata.return_value.get_base_repo_metadata.return_value.relative_path = "."
+                self.assertTrue(image._check_iso_image(path))
+                mounted.assert_not_called()
+
+                # The negative result is verified by mounting the image.
+                mounted.return_value = False
+                metadata.return_value.get_base_repo_metadata.return_value.relative_path = "os"
+                self.assertFalse(image._check_iso_image(path))
+                mounted.assert_called_once_with(path)
+
+    def mounted_check_test(self):
+        """Test the check of an image the reader can't verify."""
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "test.iso")
+            write_iso_image(path, [(b"README.;1", b"README", b"No discinfo.\n")])
+
+            with patch("pyanaconda.image._check_mounted_iso_image", return_value=True) as mounted:
+                self.assertTrue(image._check_iso_image(path))
+                mounted.assert_called_once_with(path)
+
+            with patch("pyanaconda.image._check_mounted_iso_image", return_value=None):
+                self.assertIsNone(image._check_iso_image(path))
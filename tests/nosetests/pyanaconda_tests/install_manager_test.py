@@ -87,18 +87,28 @@ class InstallManagerTestCase(unittest.TestCase):
 
         observers.append(observer)
 
-        task_proxy = Mock()
-        task_proxy.Steps = 1
-        proxy_getter.return_value = task_proxy
+        task_proxies = {
+            ("A", "/A/1"): Mock(Steps=1),
+            ("B", "/B/1"): Mock(Steps=1),
+            ("B", "/B/2"): Mock(Steps=1),
+        }
+        proxy_getter.side_effect = lambda *args: task_proxies[args]
 
         install_manager = InstallManager()
         install_manager.module_observers = observers
         main_task = install_manager.install_system_with_task()
 
+        # The modules are asked at once.
         proxy_getter.assert_has_calls([
             call("A", "/A/1"),
             call("B", "/B/1"),
             call("B", "/B/2")
-        ])
+        ], any_order=True)
         self.assertIsInstance(main_task, SystemInstallationTask)
-        self.assertEqual(main_task._subtasks, [task_proxy, task_proxy, task_proxy])
+
+        # The tasks are in the order of the modules.
+        self.assertEqual(main_task._subtasks, [
+            task_proxies[("A", "/A/1")],
+            task_proxies[("B", "/B/1")],
+            task_proxies[("B", "/B/2")]
+        ])
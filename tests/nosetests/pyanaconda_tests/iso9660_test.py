@@ -0,0 +1,177 @@
+#
+# Copyright (C) 2019  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import os
+import struct
+import tempfile
+import unittest
+
+from pyanaconda.iso9660 import ISO9660Image, ISO9660Error, ISO_BLOCK_SIZE
+
+
+# Files of the test images: a list of (iso name, real name, content).
+ISO_FILES = [(b"DISCINFO.;1", b".discinfo", b"1234\nFedora\nx86_64\n"),
+             (b"TREEINFO.;1", b".treeinfo", b"[general]\n")]
+
+
+def _both_endian(value):
+    return struct.pack("<I", value) + struct.pack(">I", value)
+
+
+def _record(name, extent, size, is_dir=False, system_use=b""):
+    """Create a directory record."""
+    padding = b"\x00" if len(name) % 2 == 0 else b""
+    data = _both_endian(extent) + _both_endian(size) + bytes(7) \
+        + bytes([0x02 if is_dir else 0x00, 0, 0]) + struct.pack("<HH", 1, 1) \
+        + bytes([len(name)]) + name + padding + system_use
+
+    if (len(data) + 2) % 2:
+        data += b"\x00"
+
+    return bytes([len(data) + 2, 0]) + data
+
+
+def _rock_ridge_name(name):
+    """Create the Rock Ridge NM entry."""
+    return b"NM" + bytes([len(name) + 5, 1, 0]) + name
+
+
+def write_iso_image(path, files, joliet=False, rock_ridge=True):
+    """Write an image with files in the root and in one subdirectory.
+
+    :param files: a list of (iso name, real name, content)
+    """
+    blocks = {}
+    next_block = 30
+
+    def add_data(content):
+        nonlocal next_block
+        block = next_block
+        blocks[block] = content
+        next_block += len(content) // ISO_BLOCK_SIZE + 1
+        return block
+
+    def add_directory(records, dir_block):
+        own = _record(b"\x00", dir_block, ISO_BLOCK_SIZE, is_dir=True)
+        parent = _record(b"\x01", 20, ISO_BLOCK_SIZE, is_dir=True)
+        blocks[dir_block] = own + parent + b"".join(records)
+
+    # The subdirectory with a repomd.xml file.
+    subdir_block = 22
+    repomd_block = add_data(b"<repomd/>")
+
+    primary_sub = [_record(b"REPOMD.XML;1", repomd_block, 9,
+                           system_use=_rock_ridge_name(b"repomd.xml") if rock_ridge else b"")]
+    joliet_sub = [_record("repomd.xml;1".encode("utf-16-be"), repomd_block, 9)]
+    add_directory(primary_sub, subdir_block)
+    add_directory(joliet_sub, subdir_block + 1)
+
+    primary_root = [_record(b"REPODATA", subdir_block, ISO_BLOCK_SIZE, is_dir=True,
+                            system_use=_rock_ridge_name(b"repodata") if rock_ridge else b"")]
+    joliet_root = [_record("repodata".encode("utf-16-be"), subdir_block + 1,
+                           ISO_BLOCK_SIZE, is_dir=True)]
+
+    for iso_name, real_name, content in files:
+        block = add_data(content)
+        primary_root.append(_record(
+            iso_name, block, len(content),
+            system_use=_rock_ridge_name(real_name) if rock_ridge else b""
+        ))
+        joliet_root.append(_record(
+            (real_name.decode() + ";1").encode("utf-16-be"), block, len(content)
+        ))
+
+    add_directory(primary_root, 20)
+    add_directory(joliet_root, 21)
+
+    primary = bytearray(ISO_BLOCK_SIZE)
+    primary[0:7] = b"\x01CD001\x01"
+    primary[156:190] = _record(b"\x00", 20, ISO_BLOCK_SIZE, is_dir=True)
+    blocks[16] = bytes(primary)
+
+    if joliet:
+        supplementary = bytearray(ISO_BLOCK_SIZE)
+        supplementary[0:7] = b"\x02CD001\x01"
+        supplementary[88:91] = b"%/E"
+        supplementary[156:190] = _record(b"\x00", 21, ISO_BLOCK_SIZE, is_dir=True)
+        blocks[17] = bytes(supplementary)
+        blocks[18] = b"\xffCD001\x01"
+    else:
+        blocks[17] = b"\xffCD001\x01"
+
+    with open(path, "wb") as f:
+        for block, content in sorted(blocks.items()):
+            f.seek(block * ISO_BLOCK_SIZE)
+            f.write(content)
+
+        f.seek(next_block * ISO_BLOCK_SIZE)
+        f.truncate()
+
+
+class ISO9660ImageTestCase(unittest.TestCase):
+    """Test the reader of ISO 9660 images."""
+
+    def _check_image(self, path):
+        with ISO9660Image(path) as iso:
+            self.assertEqual(iso.read_file(".discinfo"), b"1234\nFedora\nx86_64\n")
+            self.assertEqual(iso.read_file("/.treeinfo"), b"[general]\n")
+            self.assertEqual(iso.read_file("repodata/repomd.xml"), b"<repomd/>")
+            self.assertEqual(iso.read_file("nonexistent"), None)
+            self.assertEqual(iso.read_file("repodata"), None)
+
+            self.assertTrue(iso.is_dir("./repodata"))
+            self.assertTrue(iso.is_file("repodata/repomd.xml"))
+            self.assertFalse(iso.is_dir(".discinfo"))
+            self.assertFalse(iso.is_file("repodata/nonexistent"))
+
+    def rock_ridge_test(self):
+        """Test an image with Rock Ridge names."""
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "test.iso")
+            write_iso_image(path, ISO_FILES)
+            self._check_image(path)
+
+    def joliet_test(self):
+        """Test an image with Joliet names."""
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "test.iso")
+            write_iso_image(path, ISO_FILES, joliet=True, rock_ridge=False)
+            self._check_image(path)
+
+    def plain_names_test(self):
+        """Test an image with plain ISO 9660 names."""
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "test.iso")
+            write_iso_image(path, [(b"TREEINFO.;1", b"treeinfo", b"[general]\n")],
+                         rock_ridge=False)
+
+            with ISO9660Image(path) as iso:
+                self.assertEqual(iso.read_file("treeinfo"), b"[general]\n")
+                self.assertEqual(iso.read_file(".discinfo"), None)
+                self.assertTrue(iso.is_dir("repodata"))
+
+    def invalid_image_test(self):
+        """Test invalid images."""
+        with self.assertRaises(ISO9660Error):
+            ISO9660Image("/nonexistent/test.iso")
+
+        with tempfile.NamedTemporaryFile() as f:
+            f.write(bytes(20 * ISO_BLOCK_SIZE))
+            f.flush()
+
+            with self.assertRaises(ISO9660Error):
+                ISO9660Image(f.name)
@@ -22,6 +22,7 @@ import tempfile
 import signal
 import shutil
 from threading import Lock
+from unittest.mock import patch, call
 
 from pyanaconda.errors import ExitError
 from pyanaconda.core.process_watchers import WatchProcesses
@@ -472,8 +473,16 @@ class MiscTests(unittest.TestCase):
         self.assertIsInstance(util.getDirSize('/dev/null'), int)
         self.assertIsInstance(util.getDirSize('/dev/null/foo'), int)
 
-        # TODO: mock some dirs and check if their size is
-        # computed correctly
+        # check if the size of nested files is computed correctly
+        with tempfile.TemporaryDirectory() as d:
+            os.makedirs(os.path.join(d, "a/b"))
+
+            for path, size in (("f", 1024), ("a/f", 2048), ("a/b/f", 4096)):
+                with open(os.path.join(d, path), "wb") as f:
+                    f.write(b"x" * size)
+
+            os.symlink(os.path.join(d, "a"), os.path.join(d, "link"))
+            self.assertEqual(util.getDirSize(d), 7)
 
     def mkdir_chain_test(self):
         """Test mkdirChain."""
@@ -835,3 +844,73 @@ class MiscTests(unittest.TestCase):
         util.setSysroot(None)
         self.assertEqual(util.getTargetPhysicalRoot(), "/mnt/sysimage")
         self.assertEqual(util.getSysroot(), "/mnt/sysimage")
+
+
+class SystemdUnitBatchTests(unittest.TestCase):
+    """Test the batch of systemd units."""
+
+    @patch("pyanaconda.core.util.execWithRedirect", return_value=0)
+    def batch_test(self, exec_mock):
+        """Test a successful batch."""
+        batch = util.SystemdUnitBatch(root="/mnt/sysimage")
+        batch.disable("a.service")
+        batch.enable("b.service")
+        batch.enable("c.service")
+        batch.mask("d.service")
+        batch.disable("b.service")
+
+        self.assertEqual(batch.apply(), {})
+        self.assertEqual(exec_mock.call_args_list, [
+            call("systemctl", ["disable", "a.service", "b.service", "--root", "/mnt/sysimage"]),
+            call("systemctl", ["mask", "d.service", "--root", "/mnt/sysimage"]),
+            call("systemctl", ["enable", "c.service", "--root", "/mnt/sysimage"]),
+        ])
+
+        # The requests are applied only once.
+        exec_mock.reset_mock()
+        batch.apply()
+        exec_mock.assert_not_called()
+
+    @patch("pyanaconda.core.util.execWithRedirect")
+    def failed_batch_test(self, exec_mock):
+        """Test a batch with failed units."""
+        exec_mock.side_effect = lambda cmd, args: 1 if "x.service" in args else 0
+
+        batch = util.SystemdUnitBatch(root="/mnt/sysimage")
+        batch.disable("x.service")
+        batch.disable("a.service")
+
+        self.assertEqual(batch.apply(), {"x.service": "disable"})
+        self.assertEqual(exec_mock.call_count, 3)
+
+        batch.enable("b.service")
+        batch.enable("x.service")
+
+        with self.assertRaises(ValueError) as cm:
+            batch.apply()
+
+        self.assertEqual(str(cm.exception), "Error configuring services x.service")
+
+    @patch("pyanaconda.core.util.execWithRedirect")
+    def bisected_batch_test(self, exec_mock):
+        """Test that the failed units are found with a few calls."""
+        exec_mock.side_effect = lambda cmd, args: 1 if "x.service" in args else 0
+        units = ["{}.service".format(i) for i in range(15)] + ["x.service"]
+
+        batch = util.SystemdUnitBatch(root="/mnt/sysimage")
+
+        for unit in units:
+            batch.disable(unit)
+
+        self.assertEqual(batch.apply(), {"x.service": "disable"})
+        self.assertEqual(exec_mock.call_count, 9)
+
+        # The successful halves are applied.
+        applied = set()
+
+        for args, _kwargs in exec_mock.call_args_list:
+            if "x.service" not in args[1]:
+                applied.update(args[1][1:-2])
+
+        self.assertEqual(applied, set(units[:-1]))
+
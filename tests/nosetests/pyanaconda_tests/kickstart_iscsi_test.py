@@ -0,0 +1,134 @@
+#
+# Copyright (C) 2019  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import time
+import unittest
+from threading import Lock
+from unittest.mock import patch
+
+from pykickstart.errors import KickstartParseError
+
+from pyanaconda import kickstart
+
+
+class IscsiTargetSimulator(object):
+    """Simulate the iSCSI initiator of blivet.
+
+    Every portal answers after the given delay and knows
+    only the given targets.
+    """
+
+    def __init__(self, portals, delay=0.2):
+        self.mode = "default"
+        self.portals = portals
+        self.delay = delay
+        self.logged_in = []
+        self.running = 0
+        self.max_running = 0
+        self._lock = Lock()
+
+    def add_target(self, ipaddr, port="3260", user=None, pw=None, user_in=None, pw_in=None,
+                   target=None, iface=None):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.running, self.max_running)
+
+        try:
+            time.sleep(self.delay)
+
+            if target not in self.portals.get(ipaddr, []):
+                raise IOError("No new iSCSI nodes discovered")
+
+            with self._lock:
+                self.logged_in.append((ipaddr, target))
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+class IscsiKickstartTestCase(unittest.TestCase):
+    """Test the iscsi kickstart command."""
+
+    def setUp(self):
+        self.handler = kickstart.AnacondaKSHandler()
+        self.ksparser = kickstart.AnacondaKSParser(self.handler)
+
+    def _parse(self, simulator, ks):
+        with patch("pyanaconda.kickstart.blivet.iscsi.iscsi", simulator):
+            self.ksparser.readKickstartFromString(ks)
+
+            # Nothing is added during the parsing.
+            self.assertEqual(simulator.logged_in, [])
+
+            self.handler.iscsi.add_targets()
+
+    def add_targets_test(self):
+        """Test adding iSCSI targets of more portals."""
+        simulator = IscsiTargetSimulator({
+            "10.0.0.1": ["iqn.2019-01.com.example:a", "iqn.2019-01.com.example:b"],
+            "10.0.0.2": ["iqn.2019-01.com.example:c"],
+            "10.0.0.3": ["iqn.2019-01.com.example:d"],
+        })
+
+        self._parse(simulator, """
+iscsi --ipaddr=10.0.0.1 --target=iqn.2019-01.com.example:a
+iscsi --ipaddr=10.0.0.1 --target=iqn.2019-01.com.example:b
+iscsi --ipaddr=10.0.0.2 --target=iqn.2019-01.com.example:c
+iscsi --ipaddr=10.0.0.3 --target=iqn.2019-01.com.example:d
+""")
+
+        self.assertEqual(sorted(simulator.logged_in), [
+            ("10.0.0.1", "iqn.2019-01.com.example:a"),
+            ("10.0.0.1", "iqn.2019-01.com.example:b"),
+            ("10.0.0.2", "iqn.2019-01.com.example:c"),
+            ("10.0.0.3", "iqn.2019-01.com.example:d"),
+        ])
+
+        # The portals are used at once, the targets of one portal are not.
+        self.assertEqual(simulator.max_running, 3)
+        self.assertLess(
+            simulator.logged_in.index(("10.0.0.1", "iqn.2019-01.com.example:a")),
+            simulator.logged_in.index(("10.0.0.1", "iqn.2019-01.com.example:b"))
+        )
+
+    def add_targets_failure_test(self):
+        """Test failed iSCSI targets."""
+        simulator = IscsiTargetSimulator({
+            "10.0.0.1": ["iqn.2019-01.com.example:a"],
+        })
+
+        with self.assertRaises(KickstartParseError) as cm:
+            self._parse(simulator, """
+iscsi --ipaddr=10.0.0.1 --target=iqn.2019-01.com.example:a
+iscsi --ipaddr=10.0.0.2 --target=iqn.2019-01.com.example:x
+iscsi --ipaddr=10.0.0.3 --target=iqn.2019-01.com.example:y
+""")
+
+        # The first failed line is reported.
+        self.assertEqual(cm.exception.lineno, 3)
+        self.assertEqual(simulator.logged_in, [("10.0.0.1", "iqn.2019-01.com.example:a")])
+
+    def parse_error_test(self):
+        """Test that errors of the parsing are raised during the parsing."""
+        simulator = IscsiTargetSimulator({})
+        simulator.mode = "bind"
+
+        with self.assertRaises(KickstartParseError):
+            with patch("pyanaconda.kickstart.blivet.iscsi.iscsi", simulator):
+                self.ksparser.readKickstartFromString(
+                    "iscsi --ipaddr=10.0.0.1 --target=iqn.2019-01.com.example:a"
+                )
@@ -19,7 +19,7 @@
 import unittest
 import os
 from contextlib import contextmanager
-from mock import Mock
+from mock import Mock, patch
 
 from pyanaconda.modules.boss.kickstart_manager import KickstartManager
 from pyanaconda.modules.common.errors.kickstart import SplitKickstartSectionParsingError, \
@@ -246,6 +246,61 @@ class KickstartManagerTestCase(unittest.TestCase):
 
         self.assertEqual(errors, expected_errors)
 
+    @patch("pyanaconda.modules.boss.kickstart_manager.kickstart_manager.DBus")
+    def generate_kickstarts_test(self, dbus):
+        manager = KickstartManager()
+
+        module1 = TestModule(kickstart="lang cs_CZ.UTF-8\n")
+        module2 = TestModule(kickstart="timezone Europe/Prague\n")
+        module3 = TestModule(kickstart="selinux --enforcing\n")
+
+        unavailable_observer = TestModuleObserver("3", "3", module3)
+        unavailable_observer._is_service_available = False
+
+        manager.module_observers = [
+            TestModuleObserver("1", "1", module1),
+            TestModuleObserver("2", "2", module2),
+            unavailable_observer
+        ]
+
+        expected = {
+            "1": "lang cs_CZ.UTF-8\n",
+            "2": "timezone Europe/Prague\n",
+        }
+
+        self.assertEqual(manager.generate_kickstarts(), expected)
+        self.assertEqual(module1.generated, 1)
+        self.assertEqual(module2.generated, 1)
+        self.assertEqual(module3.generated, 0)
+
+        # The kickstarts are cached.
+        self.assertEqual(manager.generate_kickstarts(), expected)
+        self.assertEqual(module1.generated, 1)
+        self.assertEqual(module2.generated, 1)
+
+        # The temporary kickstarts are cached separately.
+        self.assertEqual(manager.generate_kickstarts(temporary=True), expected)
+        self.assertEqual(module1.generated, 2)
+        self.assertEqual(module2.generated, 2)
+
+        # The modules are watched only once.
+        self.assertEqual(dbus.connection.subscribe.call_count, 4)
+
+        # Change the first module.
+        callbacks = [
+            c[1]["signal_fired"] for c in dbus.connection.subscribe.call_args_list
+            if c[1]["sender"] == "1" and c[1]["signal"] == "PropertiesChanged"
+        ]
+        self.assertEqual(len(callbacks), 1)
+
+        module1.kickstart = "lang en_US.UTF-8\n"
+        callbacks[0]("1", "/1", "org.freedesktop.DBus.Properties", "PropertiesChanged", ())
+
+        expected["1"] = "lang en_US.UTF-8\n"
+        self.assertEqual(manager.generate_kickstarts(), expected)
+        self.assertEqual(module1.generated, 3)
+        self.assertEqual(module2.generated, 2)
+
     def unknown_section_split_test(self):
         ks_content = """
 network --device=ens3
@@ -287,11 +342,12 @@ class TestModuleObserver(DBusObjectObserver):
 
 class TestModule(object):
 
-    def __init__(self, commands=None, sections=None, addons=None):
+    def __init__(self, commands=None, sections=None, addons=None, kickstart=""):
         self.kickstart_commands = commands or []
         self.kickstart_sections = sections or []
         self.kickstart_addons = addons or []
-        self.kickstart = ""
+        self.kickstart = kickstart
+        self.generated = 0
 
     @property
     def KickstartSections(self):
@@ -321,3 +377,10 @@ class TestModule(object):
                 }
 
         return {"success": True}
+
+    def GenerateKickstart(self):
+        self.generated += 1
+        return self.kickstart
+
+    def GenerateTemporaryKickstart(self):
+        return self.GenerateKickstart()
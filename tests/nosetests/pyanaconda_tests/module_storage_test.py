@@ -19,6 +19,7 @@
 #
 import tempfile
 import unittest
+from threading import Barrier
 from unittest.mock import patch, call
 
 from pykickstart.constants import AUTOPART_TYPE_LVM_THINP, AUTOPART_TYPE_PLAIN, AUTOPART_TYPE_LVM
@@ -1056,7 +1057,37 @@ class DASDTasksTestCase(unittest.TestCase):
         blockdev.s390.dasd_format.assert_has_calls([
             call("/dev/sda"),
             call("/dev/sdb")
-        ])
+        ], any_order=True)
+
+    @patch('pyanaconda.modules.storage.dasd.format.blockdev')
+    def format_failure_test(self, blockdev):
+        """Test the format task with a failing DASD."""
+        blockdev.S390Error = RuntimeError
+
+        def dasd_format(name):
+            if name == "/dev/sda":
+                raise RuntimeError("Fake error.")
+
+        blockdev.s390.dasd_format.side_effect = dasd_format
+
+        task = DASDFormatTask(["/dev/sda", "/dev/sdb", "/dev/sdc"])
+        task.run()
+
+        self.assertEqual(blockdev.s390.dasd_format.call_count, 3)
+        self.assertEqual(task._formatted, 2)
+
+    def format_concurrently_test(self):
+        """Test that the format task formats DASDs at once."""
+        barrier = Barrier(3, timeout=10)
+        task = DASDFormatTask(["/dev/sda", "/dev/sdb", "/dev/sdc"], max_workers=3)
+
+        # All three DASDs have to be formatted at the same time
+        # to get through the barrier.
+        task._format_dasd = lambda name: barrier.wait()
+        task.run()
+
+        self.assertEqual(task._formatted, 3)
+        self.assertEqual(task.steps, 4)
 
 
 class FCOEInterfaceTestCase(unittest.TestCase):
@@ -16,9 +16,12 @@
 # Red Hat, Inc.
 #
 import unittest
-from time import sleep
-from mock import Mock, call
+from time import sleep, monotonic
+from mock import Mock, call, patch
 
+from gi.repository import GLib
+
+from pyanaconda.modules.boss.install_manager import InstallManager
 from pyanaconda.modules.boss.install_manager.installation import SystemInstallationTask
 from pyanaconda.modules.common.task import Task, TaskInterface, publish_task, sync_run_task, \
     async_run_task
@@ -476,3 +479,143 @@ class TaskInterfaceTestCase(unittest.TestCase):
             call(7, "Install B"),
             call(8, "Install C")
         ])
+
+    class ResourceTask(Task):
+
+        def __init__(self, name, resources, records, duration=0.5, fail=False):
+            super().__init__()
+            self._name = name
+            self._resources = resources
+            self._records = records
+            self._duration = duration
+            self._fail = fail
+
+        @property
+        def name(self):
+            return self._name
+
+        @property
+        def resources(self):
+            return self._resources
+
+        def run(self):
+            start = monotonic()
+
+            if self._fail:
+                raise TaskFailedException()
+
+            while monotonic() - start < self._duration and not self.check_cancel():
+                sleep(0.05)
+
+            self._records[self._name] = (start, monotonic())
+
+    def _run_installation(self):
+        """Run the installation until it stops."""
+        loop = GLib.MainLoop()
+
+        # pylint: disable=no-member
+        self.task_interface.Stopped.connect(loop.quit)
+        GLib.idle_add(self.task_interface.Start)
+        GLib.timeout_add_seconds(self.TIMEOUT, loop.quit)
+
+        loop.run()
+
+    def install_with_independent_tasks_test(self):
+        """Install with tasks that claim different resources."""
+        records = {}
+        self._set_up_task(
+            SystemInstallationTask([
+                TaskInterface(self.ResourceTask("Install A", ["a"], records)),
+                TaskInterface(self.ResourceTask("Install B", ["b"], records)),
+                TaskInterface(self.ResourceTask("Install C", ["a"], records)),
+            ])
+        )
+        self._check_steps(3)
+        self._run_installation()
+        self._finish_task()
+
+        # A and B run at the same time.
+        self.assertLess(records["Install A"][0],
+                        records["Install B"][1])
+        self.assertLess(records["Install B"][0], records["Install A"][1])
+
+        # C runs after A.
+        self.assertGreaterEqual(records["Install C"][0], records["Install A"][1])
+
+        # The progress is aggregated.
+        steps = [c[0][0] for c in self.progress_changed_callback.call_args_list]
+        self.assertEqual(steps, sorted(steps))
+        self.assertEqual(steps[-1], 3)
+
+    @patch('pyanaconda.dbus.DBus.get_proxy')
+    def install_modules_with_independent_tasks_test(self, proxy_getter):
+        """Install with independent tasks of different modules."""
+        records = {}
+        tasks = {
+            "/A/1": TaskInterface(self.ResourceTask(
+                "Install A", ["a"], records
+            )),
+            "/B/1": TaskInterface(self.ResourceTask(
+                "Install B", ["b"], records
+            )),
+        }
+        proxy_getter.side_effect = lambda service_name, object_path: tasks[object_path]
+
+        observers = []
+
+        for service_name in ("A", "B"):
+            observer = Mock()
+            observer.is_service_available = True
+            observer.service_name = service_name
+            observer.proxy.InstallWithTasks.return_value = ["/{}/1".format(service_name)]
+            observers.append(observer)
+
+        install_manager = InstallManager()
+        install_manager.module_observers = observers
+
+        self._set_up_task(install_manager.install_system_with_task())
+        self._check_steps(2)
+        self._run_installation()
+        self._finish_task()
+
+        # The tasks of A and B run at the same time.
+        self.assertLess(records["Install A"][0], records["Install B"][1])
+        self.assertLess(records["Install B"][0], records["Install A"][1])
+
+    def install_with_failing_independent_task_test(self):
+        """Install with a failing task and an independent task."""
+        records = {}
+        self._set_up_task(
+            SystemInstallationTask([
+                TaskInterface(self.ResourceTask("Install A", ["a"], records, fail=True)),
+                TaskInterface(self.ResourceTask("Install B", ["b"], records, duration=10)),
+                TaskInterface(self.ResourceTask("Install C", ["a"], records)),
+            ])
+        )
+        self._run_installation()
+        self._finish_failed_task()
+
+        # B is canceled and C is never started.
+        self.assertIn("Install B", records)
+        self.assertLess(records["Install B"][1] - records["Install B"][0], 5)
+        self.assertNotIn("Install C", records)
+
+    def resolve_dependencies_test(self):
+        """Test the dependencies of installation tasks."""
+        tasks = [
+            Mock(Resources=["a"]),
+            Mock(Resources=["b"]),
+            Mock(Resources=["a", "c"]),
+            Mock(Resources=["*"]),
+            Mock(Resources=[]),
+            Mock(Resources=["c"]),
+        ]
+
+        self.assertEqual(SystemInstallationTask._resolve_dependencies(tasks), {
+            0: set(),
+            1: set(),
+            2: {0},
+            3: {0, 1, 2},
+            4: {3},
+            5: {2, 3},
+        })
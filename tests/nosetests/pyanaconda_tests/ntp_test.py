@@ -0,0 +1,200 @@
+#
+# Copyright (C) 2019  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import socket
+import threading
+import time
+import unittest
+from concurrent.futures import Future
+from unittest.mock import patch
+
+import ntplib
+
+from pyanaconda.ntp import NTPProbeService
+
+
+class NTPResponder(object):
+    """A local NTP server answering with the given delay."""
+
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.requests = 0
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.bind(("127.0.0.1", 0))
+        self._socket.settimeout(0.1)
+        self._running = True
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+
+    @property
+    def port(self):
+        return self._socket.getsockname()[1]
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        self._thread.join()
+        self._socket.close()
+
+    def _run(self):
+        while self._running:
+            try:
+                data, address = self._socket.recvfrom(1024)
+            except socket.timeout:
+                continue
+
+            self.requests += 1
+            time.sleep(self.delay)
+
+            request = ntplib.NTPPacket()
+            request.from_data(data)
+
+            now = ntplib.system_to_ntp_time(time.time())
+            response = ntplib.NTPPacket(mode=4, version=request.version, tx_timestamp=now)
+            response.stratum = 2
+            response.orig_timestamp = request.tx_timestamp
+            response.recv_timestamp = now
+            self._socket.sendto(response.to_data(), address)
+
+
+def get_unused_port():
+    """Get a port nobody listens on."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class NTPProbeServiceTestCase(unittest.TestCase):
+    """Test the NTP probe service."""
+
+    def setUp(self):
+        self.responder = NTPResponder()
+        self.responder.start()
+
+    def tearDown(self):
+        self.responder.stop()
+
+    def working_server_test(self):
+        """Test a working server."""
+        service = NTPProbeService(timeout=1, port=self.responder.port)
+
+        stats = service.query("127.0.0.1").result()
+        self.assertIsNotNone(stats)
+        self.assertAlmostEqual(stats.tx_time, time.time(), delta=5)
+
+        self.assertTrue(service.check_server("127.0.0.1").result())
+        self.assertEqual(service.check_servers(["127.0.0.1"]), {"127.0.0.1": True})
+
+    def dead_server_test(self):
+        """Test a server that doesn't respond."""
+        service = NTPProbeService(timeout=0.5, port=get_unused_port())
+
+        self.assertIsNone(service.query("127.0.0.1").result())
+        self.assertFalse(service.check_server("127.0.0.1").result())
+
+    def unknown_server_test(self):
+        """Test a server that can't be resolved."""
+        service = NTPProbeService(timeout=0.5, port=self.responder.port)
+        self.assertFalse(service.check_server("ntp.invalid").result())
+
+    def callback_test(self):
+        """Test the callback of a check."""
+        service = NTPProbeService(timeout=1, port=self.responder.port)
+        results = []
+
+        future = service.check_server("127.0.0.1", lambda *args: results.append(args))
+        future.result()
+
+        self.assertEqual(results, [("127.0.0.1", True)])
+
+    def shared_query_test(self):
+        """Test that running queries of the same server are shared."""
+        self.responder.delay = 0.5
+        service = NTPProbeService(timeout=2, port=self.responder.port)
+
+        futures = [service.query("127.0.0.1") for _i in range(10)]
+        self.assertTrue(all(f is futures[0] for f in futures))
+        self.assertIsNotNone(futures[0].result())
+        self.assertEqual(self.responder.requests, 1)
+
+    def cache_test(self):
+        """Test the cache of results."""
+        service = NTPProbeService(timeout=1, ttl=0.5, port=self.responder.port)
+
+        first = service.query("127.0.0.1").result()
+        second = service.query("127.0.0.1").result()
+        self.assertIs(first, second)
+        self.assertEqual(self.responder.requests, 1)
+
+        # Skip the cache.
+        service.query("127.0.0.1", use_cache=False).result()
+        self.assertEqual(self.responder.requests, 2)
+
+        # Clear the cache.
+        service.clear_cache()
+        service.query("127.0.0.1").result()
+        self.assertEqual(self.responder.requests, 3)
+
+        # Let the result expire.
+        time.sleep(0.6)
+        service.query("127.0.0.1").result()
+        self.assertEqual(self.responder.requests, 4)
+
+    def failure_cache_test(self):
+        """Test the cache of failed results."""
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as silent:
+            # Nobody reads from this socket, so the queries time out.
+            silent.bind(("127.0.0.1", 0))
+            port = silent.getsockname()[1]
+
+            service = NTPProbeService(timeout=0.2, failure_ttl=0, port=port)
+            start = time.monotonic()
+            self.assertIsNone(service.query("127.0.0.1").result())
+            self.assertIsNone(service.query("127.0.0.1").result())
+
+            # The failure wasn't cached, so both queries timed out.
+            self.assertGreaterEqual(time.monotonic() - start, 0.4)
+
+            service = NTPProbeService(timeout=0.2, failure_ttl=60, port=port)
+            start = time.monotonic()
+            self.assertIsNone(service.query("127.0.0.1").result())
+            self.assertIsNone(service.query("127.0.0.1").result())
+
+            # The failure was cached, so only the first query timed out.
+            self.assertLess(time.monotonic() - start, 0.4)
+
+    def finished_query_test(self):
+        """Test a query that is finished before its callback is added."""
+        service = NTPProbeService(timeout=1, port=self.responder.port)
+
+        def run_coroutine_threadsafe(coroutine, loop):
+            coroutine.close()
+            future = Future()
+            future.set_result(None)
+            return future
+
+        with patch("pyanaconda.ntp.asyncio.run_coroutine_threadsafe", run_coroutine_threadsafe):
+            thread = threading.Thread(target=service.query, args=("127.0.0.1", ))
+            thread.start()
+            thread.join(timeout=5)
+
+        # The query doesn't deadlock and the result is cached.
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(service.query("127.0.0.1").result())
+        self.assertEqual(self.responder.requests, 0)
@@ -23,6 +23,7 @@ from pyanaconda.pwpolicy import F22_PwPolicyData
 from pyanaconda.core import constants
 from pyanaconda.core.i18n import _
 import unittest
+from unittest.mock import Mock, patch
 
 def get_policy():
     return F22_PwPolicyData()
@@ -239,3 +240,92 @@ class PasswordQuality(unittest.TestCase):
         self.assertEqual(check.result.password_quality, 0)  # dependent on password length
         self.assertIs(check.result.error_message,
                       _(constants.SECRET_TOO_SHORT[constants.SecretType.PASSWORD]))
+
+
+class PasswordCheckerTest(unittest.TestCase):
+
+    def verdict_cache_test(self):
+        """Check that the libpwquality verdicts are cached."""
+        cache = input_checking.PwqualityVerdictCache(max_size=2)
+        settings = Mock()
+        settings.check.return_value = 50
+
+        with patch.object(input_checking.pwquality_settings_cache, "get_settings_by_minlen",
+                          return_value=settings):
+            self.assertEqual(cache.check("password", 6, "root"), (50, ""))
+            self.assertEqual(cache.check("password", 6, "root"), (50, ""))
+            self.assertEqual(settings.check.call_count, 1)
+
+            # a different username or minimum length is a different verdict
+            cache.check("password", 6, "user")
+            cache.check("password", 8, "user")
+            self.assertEqual(settings.check.call_count, 3)
+
+            # the oldest verdict was dropped
+            cache.check("password", 6, "root")
+            self.assertEqual(settings.check.call_count, 4)
+
+    def successful_checks_test(self):
+        """Check that the successful checks are not accumulated."""
+        checker = input_checking.PasswordChecker("password", "password", get_policy())
+        checker.add_check(input_checking.PasswordEmptyCheck())
+        checker.add_check(input_checking.PasswordConfirmationCheck())
+
+        checker.run_checks()
+        checker.run_checks()
+        self.assertEqual(len(checker.successful_checks), 2)
+
+    @patch("pyanaconda.input_checking.run_in_loop")
+    @patch("pyanaconda.input_checking.password_check_executor")
+    @patch("pyanaconda.input_checking.Timer")
+    def asynchronous_checks_test(self, timer, executor, run_in_loop):
+        """Check the asynchronous checks."""
+        checker = input_checking.PasswordChecker("", "", get_policy())
+        checker.asynchronous = True
+        checker.add_check(input_checking.PasswordEmptyCheck())
+
+        results = []
+        checker.checks_done.connect(results.append)
+
+        def run_scheduled_checks():
+            # the timeout of the last timer
+            _delay, callback, *args = timer.return_value.timeout_msec.call_args[0]
+            self.assertFalse(callback(*args))
+            # the worker thread
+            function, *args = executor.submit.call_args[0]
+            function(*args)
+            # the main thread
+            callback, *args = run_in_loop.call_args[0]
+            callback(*args)
+
+        # the checks are scheduled
+        checker.password.content = "a"
+        self.assertTrue(checker.checks_pending)
+        self.assertEqual(results, [])
+
+        run_scheduled_checks()
+        self.assertFalse(checker.checks_pending)
+        self.assertEqual(results, [""])
+
+        # the results of outdated checks are dropped
+        checker.password.content = "ab"
+        _delay, start_checks, generation = timer.return_value.timeout_msec.call_args[0]
+        start_checks(generation)
+
+        checker.password.content = ""
+        function, *args = executor.submit.call_args[0]
+        function(*args)
+        callback, *args = run_in_loop.call_args[0]
+        callback(*args)
+        self.assertEqual(results, [""])
+
+        run_scheduled_checks()
+        self.assertEqual(len(results), 2)
+        self.assertFalse(checker.success)
+
+        # the pending checks can run right away
+        checker.password.content = "abc"
+        checker.run_pending_checks()
+        self.assertFalse(checker.checks_pending)
+        self.assertEqual(len(results), 3)
+        self.assertTrue(checker.success)
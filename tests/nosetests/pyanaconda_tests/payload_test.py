@@ -25,8 +25,13 @@ import tempfile
 import os
 import hashlib
 import shutil
+import threading
+from functools import partial
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+from unittest.mock import patch
 
 from pyanaconda.payload.dnfpayload import RepoMDMetaHash
+from pyanaconda.payload.install_tree_metadata import InstallTreeMetadata
 from pyanaconda.payload import PayloadRequirements, PayloadRequirementsMissingApply
 
 
@@ -151,6 +156,150 @@ or it should be. Nah it's just a test!
         self.assertFalse(r.verify_repoMD())
 
 
+class RepoMDRequestHandler(SimpleHTTPRequestHandler):
+    """Serve the test repository and record the status codes."""
+
+    def send_response(self, code, message=None):
+        self.server.status_codes.append(code)
+        super().send_response(code, message)
+
+    def log_message(self, *args):
+        pass
+
+
+class DNFPayloadMDHTTPCheckTests(unittest.TestCase):
+    """Test the checks of repomd.xml files on a local HTTP server."""
+
+    def setUp(self):
+        self._temp_dir = tempfile.mkdtemp(suffix="pyanaconda_tests")
+        os.makedirs(os.path.join(self._temp_dir, "repodata"))
+        self._md_file = os.path.join(self._temp_dir, "repodata", "repomd.xml")
+
+        with open(self._md_file, 'w') as f:
+            f.write("<repomd/>")
+
+        handler = partial(RepoMDRequestHandler, directory=self._temp_dir)
+        self._server = HTTPServer(("127.0.0.1", 0), handler)
+        self._server.status_codes = []
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.start()
+
+        self._url = "http://127.0.0.1:{}".format(self._server.server_port)
+        self._dummyRepo = DummyRepo()
+        self._dummyRepo.baseurl = [self._url]
+
+    def tearDown(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        shutil.rmtree(self._temp_dir)
+
+    def _get_dead_url(self):
+        """Return a URL of a closed port."""
+        server = HTTPServer(("127.0.0.1", 0), RepoMDRequestHandler)
+        url = "http://127.0.0.1:{}".format(server.server_port)
+        server.server_close()
+        return url
+
+    def conditional_verify_test(self):
+        """Test the conditional verification."""
+        r = RepoMDMetaHash(DummyPayload(), self._dummyRepo)
+        r.store_repoMD_hash()
+        self.assertEqual(self._server.status_codes, [200])
+
+        # The file is not downloaded again.
+        self.assertTrue(r.verify_repoMD())
+        self.assertEqual(self._server.status_codes, [200, 304])
+
+        # The file has changed.
+        with open(self._md_file, 'a') as f:
+            f.write("This should not be here!")
+
+        stat = os.stat(self._md_file)
+        os.utime(self._md_file, (stat.st_atime, stat.st_mtime + 10))
+
+        self.assertFalse(r.verify_repoMD())
+        self.assertEqual(self._server.status_codes, [200, 304, 200])
+
+        # The file is not available.
+        os.remove(self._md_file)
+        self.assertFalse(r.verify_repoMD())
+
+    def dead_mirror_test(self):
+        """Test a repository with a dead mirror."""
+        self._dummyRepo.baseurl = [self._get_dead_url(), self._url]
+
+        r = RepoMDMetaHash(DummyPayload(), self._dummyRepo)
+        r.store_repoMD_hash()
+        self.assertTrue(r.verify_repoMD())
+
+        self._dummyRepo.baseurl = [self._get_dead_url()]
+        r = RepoMDMetaHash(DummyPayload(), self._dummyRepo)
+        self.assertFalse(r.verify_repoMD())
+
+
+class InstallTreeMetadataHTTPTests(unittest.TestCase):
+    """Test the download of treeinfo files from a local HTTP server."""
+
+    def setUp(self):
+        self._temp_dir = tempfile.mkdtemp(suffix="pyanaconda_tests")
+
+        handler = partial(RepoMDRequestHandler, directory=self._temp_dir)
+        self._server = HTTPServer(("127.0.0.1", 0), handler)
+        self._server.status_codes = []
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.start()
+
+        self._url = "http://127.0.0.1:{}".format(self._server.server_port)
+
+    def tearDown(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        shutil.rmtree(self._temp_dir)
+
+    def _write_file(self, name, content):
+        with open(os.path.join(self._temp_dir, name), "w") as f:
+            f.write(content)
+
+    def _load_url(self):
+        metadata = InstallTreeMetadata()
+
+        with patch("pyanaconda.payload.install_tree_metadata.TreeInfo") as tree_info:
+            result = metadata.load_url(self._url, {}, True, {})
+
+        return result, tree_info.return_value.loads
+
+    def treeinfo_test(self):
+        """Test the preferred .treeinfo file."""
+        self._write_file(".treeinfo", "hidden")
+        self._write_file("treeinfo", "visible")
+
+        result, loads = self._load_url()
+        self.assertTrue(result)
+        loads.assert_called_once_with("hidden")
+        self.assertEqual(self._server.status_codes, [200, 200])
+
+    def fallback_treeinfo_test(self):
+        """Test the treeinfo file."""
+        self._write_file("treeinfo", "visible")
+
+        result, loads = self._load_url()
+        self.assertTrue(result)
+        loads.assert_called_once_with("visible")
+        self.assertEqual(sorted(self._server.status_codes), [200, 404])
+
+    def missing_treeinfo_test(self):
+        """Test missing treeinfo files."""
+        with patch("pyanaconda.payload.install_tree_metadata.time.sleep") as sleep:
+            result, loads = self._load_url()
+
+        self.assertFalse(result)
+        loads.assert_not_called()
+        sleep.assert_not_called()
+        self.assertEqual(self._server.status_codes, [404, 404])
+
+
 class PayloadRequirementsTestCase(unittest.TestCase):
 
     def requirements_test(self):
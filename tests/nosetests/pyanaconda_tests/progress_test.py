@@ -0,0 +1,98 @@
+#
+# Copyright (C) 2019  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import queue
+import unittest
+from unittest.mock import patch
+
+from pyanaconda.progress import progressQ, collect_progress_update
+
+
+class ProgressUpdateTestCase(unittest.TestCase):
+    """Test the collection of the progress updates."""
+
+    def setUp(self):
+        self.queue = queue.Queue()
+        self._patcher = patch.object(progressQ, "q", self.queue)
+        self._patcher.start()
+
+    def tearDown(self):
+        self._patcher.stop()
+
+    def empty_test(self):
+        """Test an empty queue."""
+        self.assertIsNone(collect_progress_update())
+        self.assertIsNone(collect_progress_update(block=True, timeout=0.01))
+
+    def collapse_test(self):
+        """Test collapsed messages."""
+        progressQ.send_init(10)
+        progressQ.send_step()
+        progressQ.send_message("First")
+        progressQ.send_step()
+        progressQ.send_message("Second")
+
+        update = collect_progress_update()
+        self.assertEqual(update.total_steps, 10)
+        self.assertEqual(update.steps, 2)
+        self.assertEqual(update.message, "Second")
+        self.assertEqual(update.backlog, 5)
+        self.assertFalse(update.complete)
+        self.assertIsNone(update.exit_code)
+
+        self.assertIsNone(collect_progress_update())
+        self.assertEqual(self.queue.unfinished_tasks, 0)
+
+    def init_test(self):
+        """Test steps before the init message."""
+        progressQ.send_step()
+        progressQ.send_init(5)
+        progressQ.send_step()
+
+        update = collect_progress_update()
+        self.assertEqual(update.total_steps, 5)
+        self.assertEqual(update.steps, 1)
+        self.assertIsNone(update.message)
+
+    def complete_test(self):
+        """Test the complete message."""
+        progressQ.send_step()
+        progressQ.send_complete()
+        progressQ.send_message("Next")
+
+        update = collect_progress_update()
+        self.assertEqual(update.steps, 1)
+        self.assertTrue(update.complete)
+        self.assertIsNone(update.message)
+
+        update = collect_progress_update()
+        self.assertFalse(update.complete)
+        self.assertEqual(update.message, "Next")
+
+    def quit_test(self):
+        """Test the quit message."""
+        progressQ.send_message("Message")
+        progressQ.send_quit(1)
+        progressQ.send_step()
+
+        update = collect_progress_update()
+        self.assertEqual(update.message, "Message")
+        self.assertEqual(update.exit_code, 1)
+        self.assertEqual(update.steps, 0)
+
+        update = collect_progress_update()
+        self.assertEqual(update.steps, 1)
@@ -0,0 +1,128 @@
+#
+# Copyright (C) 2019  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from pyanaconda.payload.rpmdb import RPMDatabase
+
+
+class RPMDatabaseTestCase(unittest.TestCase):
+    """Test the cached queries of the RPM database."""
+
+    def setUp(self):
+        self._root = tempfile.TemporaryDirectory()
+        self.root = self._root.name
+        self.dbpath = os.path.join(self.root, "var/lib/rpm")
+        os.makedirs(self.dbpath)
+        self._write_db("Packages", "v1")
+
+        header = Mock()
+        header.name = b"kernel-core"
+        header.filenames = [b"/boot/vmlinuz-5.0", b"/lib/modules/5.0"]
+
+        self.ts = Mock()
+        self.ts.dbMatch.return_value.count.return_value = 1
+        self.ts.dbMatch.return_value.__iter__ = lambda mi: iter([header])
+
+        self.rpm = Mock()
+        self.rpm.TransactionSet.return_value = self.ts
+
+        self._patcher = patch.dict(sys.modules, {"rpm": self.rpm})
+        self._patcher.start()
+
+    def tearDown(self):
+        self._patcher.stop()
+        self._root.cleanup()
+
+    def _write_db(self, name, content):
+        path = os.path.join(self.dbpath, name)
+
+        with open(path, "wt") as f:
+            f.write(content)
+
+        # Make sure that the time stamp changes.
+        stamp = os.stat(path).st_mtime_ns + 1000000000
+        os.utime(path, ns=(stamp, stamp))
+
+    def queries_test(self):
+        """Test the queries."""
+        db = RPMDatabase(root=self.root)
+
+        self.assertEqual(db.count("provides", "rhgb"), 1)
+        self.assertEqual(db.get_names("basenames", "/boot/vmlinuz-5.0"), ("kernel-core", ))
+        self.assertEqual(db.get_filenames("providename", "kernel"),
+                         ("/boot/vmlinuz-5.0", "/lib/modules/5.0"))
+
+        # The database is closed after every query.
+        self.rpm.TransactionSet.assert_called_with(self.root)
+        self.assertEqual(self.rpm.TransactionSet.call_count, 3)
+        self.assertEqual(self.ts.closeDB.call_count, 3)
+
+    def cache_test(self):
+        """Test the cache of the queries."""
+        db = RPMDatabase(root=self.root)
+
+        db.count("provides", "rhgb")
+        db.count("provides", "rhgb")
+        self.assertEqual(self.ts.dbMatch.call_count, 1)
+
+        # The environment files don't invalidate the cache.
+        self._write_db("__db.001", "")
+        db.count("provides", "rhgb")
+        self.assertEqual(self.ts.dbMatch.call_count, 1)
+
+        # A new query is not cached.
+        db.count("provides", "plymouth")
+        self.assertEqual(self.ts.dbMatch.call_count, 2)
+        self.assertEqual(self.rpm.TransactionSet.call_count, 2)
+        self.assertEqual(self.ts.closeDB.call_count, 2)
+
+    def close_test(self):
+        """Test that the database is closed if the query fails."""
+        db = RPMDatabase(root=self.root)
+        self.ts.dbMatch.side_effect = RuntimeError("Failed query.")
+
+        with self.assertRaises(RuntimeError):
+            db.count("provides", "rhgb")
+
+        self.ts.closeDB.assert_called_once_with()
+
+        # The failed query is not cached.
+        self.ts.dbMatch.side_effect = None
+        self.assertEqual(db.count("provides", "rhgb"), 1)
+        self.assertEqual(self.ts.closeDB.call_count, 2)
+
+    def invalidation_test(self):
+        """Test the invalidation of the cache."""
+        db = RPMDatabase(root=self.root)
+        db.count("provides", "rhgb")
+
+        # The database has changed.
+        self._write_db("Packages", "v2")
+        db.count("provides", "rhgb")
+        self.assertEqual(self.ts.dbMatch.call_count, 2)
+        self.assertEqual(self.rpm.TransactionSet.call_count, 2)
+
+        # The cache is invalidated explicitly.
+        db.invalidate()
+        db.count("provides", "rhgb")
+        self.assertEqual(self.ts.dbMatch.call_count, 3)
+        self.assertEqual(self.rpm.TransactionSet.call_count, 3)
@@ -0,0 +1,129 @@
+#
+# Copyright (C) 2019  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import unittest
+from unittest.mock import Mock
+
+from pyanaconda.storage.root import _InstallationProbe, _InstallationProbeCache, _NO_FSTAB
+
+
+class InstallationProbeCacheTestCase(unittest.TestCase):
+    """Test the cache of existing installations."""
+
+    def _get_device(self, device_id, uuid="UUID", size=100):
+        device = Mock()
+        device.id = device_id
+        device.name = "dev%s" % device_id
+        device.size = size
+        device.format.exists = True
+        device.format.uuid = uuid
+        device.format.type = "ext4"
+        return device
+
+    def _get_devicetree(self, *devices):
+        devicetree = Mock()
+        mapping = {device.name: device for device in devices}
+        devicetree.get_device_by_name.side_effect = mapping.get
+        return devicetree
+
+    def cache_test(self):
+        """Test the cache of probes."""
+        root = self._get_device(1)
+        swap = self._get_device(2, uuid="SWAP")
+        devicetree = self._get_devicetree(root, swap)
+
+        cache = _InstallationProbeCache()
+        self.assertIsNone(cache.get(devicetree, root))
+
+        probe = _InstallationProbe("Linux", {"/": root}, [swap])
+        cache.set(root, probe)
+        self.assertEqual(cache.get(devicetree, root), probe)
+
+        # The device has changed.
+        resized = self._get_device(1, size=200)
+        self.assertIsNone(cache.get(devicetree, resized))
+
+        # The swap device is not in the device tree, so the probe is dropped.
+        self.assertIsNone(cache.get(self._get_devicetree(root), root))
+        self.assertIsNone(cache.get(devicetree, root))
+
+    def cache_rescan_test(self):
+        """Test the cache with a device tree of a rescan."""
+        root = self._get_device(1)
+        swap = self._get_device(2, uuid="SWAP")
+        other = self._get_device(3, uuid="OTHER")
+
+        cache = _InstallationProbeCache()
+        probe = _InstallationProbe("Linux", {"/": root}, [swap])
+        cache.set(root, probe)
+        cache.set(other, _NO_FSTAB)
+
+        # The rescanned devices have new ids, but the same names and formats.
+        new_root = self._get_device(4)
+        new_root.name = root.name
+        new_swap = self._get_device(5, uuid="SWAP")
+        new_swap.name = swap.name
+        devicetree = self._get_devicetree(new_root, new_swap)
+
+        self.assertEqual(cache.get(devicetree, new_root), probe)
+        self.assertEqual(probe.get_root(devicetree).swaps, [new_swap])
+
+        # The swap was reformatted, so only the probe of the root is dropped.
+        new_swap.format.uuid = "NEW"
+        self.assertIsNone(cache.get(devicetree, new_root))
+        self.assertEqual(cache.get(devicetree, other), _NO_FSTAB)
+
+    def cache_no_fstab_test(self):
+        """Test the cache of devices without fstab."""
+        device = self._get_device(1)
+        devicetree = self._get_devicetree()
+
+        cache = _InstallationProbeCache()
+        cache.set(device, _NO_FSTAB)
+        self.assertEqual(cache.get(devicetree, device), _NO_FSTAB)
+
+        # The device was reformatted.
+        self.assertIsNone(cache.get(devicetree, self._get_device(1, uuid="NEW")))
+
+        cache.clear()
+        self.assertIsNone(cache.get(devicetree, device))
+
+    def cache_no_uuid_test(self):
+        """Test that devices without UUID are not cached."""
+        root = self._get_device(1, uuid=None)
+        devicetree = self._get_devicetree(root)
+
+        cache = _InstallationProbeCache()
+        cache.set(root, _InstallationProbe("Linux", {"/": root}, []))
+        self.assertIsNone(cache.get(devicetree, root))
+
+    def probe_test(self):
+        """Test the probe of an installation."""
+        root = self._get_device(1)
+        swap = self._get_device(2, uuid="SWAP")
+        copied_root = self._get_device(1)
+        copied_swap = self._get_device(2, uuid="SWAP")
+
+        probe = _InstallationProbe("Linux", {"/": root}, [swap])
+        self.assertFalse(probe.empty)
+        self.assertTrue(_InstallationProbe("Linux", {}, []).empty)
+
+        # The root is created from the given device tree.
+        result = probe.get_root(self._get_devicetree(copied_root, copied_swap))
+        self.assertEqual(result.name, "Linux")
+        self.assertEqual(result.device, copied_root)
+        self.assertEqual(result.swaps, [copied_swap])
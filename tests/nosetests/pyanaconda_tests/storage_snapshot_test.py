@@ -0,0 +1,70 @@
+#
+# Copyright (C) 2019  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import unittest
+
+from pyanaconda.storage.snapshot import StorageSnapshot
+
+
+class FakeStorage(object):
+    """A storage that counts its copies."""
+
+    def __init__(self, copies=None):
+        self.copies = copies if copies is not None else []
+        self.devicetree = None
+        self.roots = None
+        self.fsset = None
+
+    def copy(self):
+        storage = FakeStorage(self.copies)
+        storage.devicetree = object()
+        self.copies.append(storage)
+        return storage
+
+
+class StorageSnapshotTestCase(unittest.TestCase):
+    """Test the storage snapshot."""
+
+    def reset_test(self):
+        """Test that every reset uses a new copy of the snapshot."""
+        storage = FakeStorage()
+        snapshot = StorageSnapshot(storage)
+
+        # Only the snapshot itself.
+        self.assertEqual(len(storage.copies), 1)
+
+        snapshot.reset_to_snapshot(storage)
+        self.assertEqual(len(storage.copies), 2)
+        self.assertEqual(storage.devicetree, storage.copies[1].devicetree)
+
+        snapshot.reset_to_snapshot(storage)
+        self.assertEqual(len(storage.copies), 3)
+        self.assertEqual(storage.devicetree, storage.copies[2].devicetree)
+
+    def dispose_test(self):
+        """Test that the disposed snapshot is not copied."""
+        storage = FakeStorage()
+        snapshot = StorageSnapshot(storage)
+        snap = snapshot.storage
+
+        snapshot.reset_to_snapshot(storage, dispose=True)
+        self.assertEqual(len(storage.copies), 1)
+        self.assertEqual(storage.devicetree, snap.devicetree)
+        self.assertFalse(snapshot.created)
+
+        with self.assertRaises(ValueError):
+            snapshot.reset_to_snapshot(storage)